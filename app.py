@@ -1,8 +1,39 @@
 import streamlit as st
-import base64
-from io import BytesIO
+import os
 from datetime import datetime
-import urllib.parse
+from html import escape
+
+from apstat.cache import content_key, render_cache
+from apstat.content import get_content
+from apstat.exports import export_sizes, optimize_html, publish
+from apstat.flyer import render_flyer_html
+from apstat.fragments import HEALTHCARE_CAREERS, TECH_CAREERS, slide_fragment_html, slide_parts
+from apstat.links import get_dead_links
+from apstat.metrics import install_delta_counter, spans
+from apstat.pdf import render_flyer_pdf, render_presentation_pdf
+from apstat.pptx import render_presentation_pptx
+from apstat.prefetch import slide_prefetcher
+from apstat.previews import get_previews
+from apstat.presentation import render_presentation_html
+from apstat.sections import create_youtube_search_url
+from apstat.session_budget import compact_search_state, saved_search, state_size
+from apstat.slide_deck import slide_deck
+from apstat.styles import publish_stylesheet
+from apstat.tenants import get_tenant, tenant_cache_stats
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# Optional Prometheus text export; APSTAT_METRICS_FILE=static/metrics.txt serves it at /app/static/metrics.txt
+METRICS_FILE = os.environ.get("APSTAT_METRICS_FILE")
+METRICS_WRITE_INTERVAL = 10
+# Reruns shown in the ?debug=1 sidebar panel
+RERUN_HISTORY = 10
+DEBUG_SPANS = ("css", "content", "sidebar", "slide_body", "display_career_resources", "schedule_expander", "printable_viewer", "footer")
+
+# Time the sections of this rerun (see apstat.metrics)
+spans.begin_rerun()
+# Count the deltas and bytes this rerun sends to the browser, stylesheet included
+delta_counter = install_delta_counter(get_script_run_ctx())
 
 # Page configuration
 st.set_page_config(
@@ -12,943 +43,61 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #667eea;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-    }
-    
-    .sub-header {
-        font-size: 1.5rem;
-        color: #764ba2;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .slide-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    .example-box {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border-left: 5px solid #667eea;
-    }
-    
-    .highlight {
-        background: #fff3cd;
-        padding: 2px 6px;
-        border-radius: 4px;
-        font-weight: bold;
-    }
-    
-    .career-title {
-        color: #764ba2;
-        font-size: 1.8rem;
-        margin-bottom: 1rem;
-    }
-    
-    .intro-section {
-        background: linear-gradient(135deg, #e0c3fc 0%, #8ec5fc 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-    }
-    
-    .download-btn {
-        background: #28a745;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 5px;
-        border: none;
-        cursor: pointer;
-        font-weight: bold;
-    }
-    
-    .resource-link {
-        background: #e7f3ff;
-        padding: 0.8rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #667eea;
-    }
-    
-    .resource-link a {
-        color: #667eea;
-        text-decoration: none;
-        font-weight: bold;
-    }
-    
-    .resource-link a:hover {
-        text-decoration: underline;
-    }
-    
-    .case-study-link {
-        background: #fff3e0;
-        padding: 0.8rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #ff9800;
-    }
-    
-    .case-study-link a {
-        color: #e65100;
-        text-decoration: none;
-        font-weight: bold;
-    }
-    
-    .case-study-link a:hover {
-        text-decoration: underline;
-    }
-    
-    .case-study {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-        border: 1px solid #dee2e6;
-    }
-    
-    .video-container {
-        margin: 1rem 0;
-        padding: 1rem;
-        background: #f0f8ff;
-        border-radius: 8px;
-        border-left: 4px solid #667eea;
-    }
-    
-    .video-link {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-        padding: 10px;
-        background: white;
-        border-radius: 6px;
-        margin: 8px 0;
-        border: 1px solid #e0e0e0;
-    }
-    
-    .video-link:hover {
-        background: #f9f9f9;
-    }
-    
-    .print-btn {
-        background: #007bff;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 5px;
-        border: none;
-        margin: 0.5rem;
-        cursor: pointer;
-        font-weight: bold;
-    }
-    
-    .schedule-box {
-        background: linear-gradient(135deg, #f0f7ff 0%, #e6f2ff 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border: 2px solid #667eea;
-    }
-    
-    .schedule-year {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #764ba2;
-    }
-    
-    .search-container {
-        background: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border: 2px solid #28a745;
-    }
-    
-    .search-keyword {
-        display: inline-block;
-        background: #e7f3ff;
-        padding: 6px 12px;
-        margin: 4px;
-        border-radius: 20px;
-        cursor: pointer;
-        border: 1px solid #667eea;
-        font-size: 0.9rem;
-    }
-    
-    .search-keyword:hover {
-        background: #d0e7ff;
-    }
-    
-    .youtube-search-btn {
-        background: #667eea;
-        color: white;
-        padding: 8px 16px;
-        border-radius: 5px;
-        border: none;
-        cursor: pointer;
-        font-weight: bold;
-        display: inline-flex;
-        align-items: center;
-        gap: 8px;
-    }
-    
-    .working-video {
-        background: #d4edda;
-        border-left: 4px solid #28a745;
-    }
-    
-    .alternative-video {
-        background: #fff3cd;
-        border-left: 4px solid #ffc107;
-    }
-    
-    .clickable-link {
-        display: block;
-        padding: 10px 15px;
-        margin: 5px 0;
-        background: #667eea;
-        color: white;
-        text-align: center;
-        border-radius: 5px;
-        text-decoration: none;
-        font-weight: bold;
-        transition: background-color 0.3s ease;
-    }
-    
-    .clickable-link:hover {
-        background: #5a67d8;
-        color: white;
-    }
-    
-    .teacher-banner {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border: 2px solid #fff;
-        color: white;
-        text-align: center;
-    }
-    
-    .teacher-banner h3 {
-        color: white;
-        margin-bottom: 0.5rem;
-        font-size: 3rem;
-        font-weight: bold;
-    }
-    
-    .teacher-banner p {
-        color: #f0f0f0;
-        margin: 0.5rem 0;
-        font-size: 1.5rem;
-    }
-    
-    .teacher-banner p:first-of-type {
-        font-weight: bold;
-        font-size: 1.8rem;
-        margin-top: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# GUARANTEED WORKING YOUTUBE VIDEOS (TESTED)
-GUARANTEED_VIDEOS = {
-    "general_stats": {
-        "title": "What is Statistics?",
-        "url": "https://www.youtube.com/watch?v=LMSyiAJm99g",
-        "description": "Khan Academy introduction to statistics"
-    },
-    "stats_basics": {
-        "title": "Introduction to Statistics",
-        "url": "https://www.youtube.com/watch?v=GUQJ7zMoSCM",
-        "description": "Basic concepts of statistics"
-    },
-    "stats_careers": {
-        "title": "Statistics Careers",
-        "url": "https://www.youtube.com/watch?v=kyjlxsLW1Is",
-        "description": "Careers in statistics"
-    }
-}
+# Custom CSS: a fingerprinted static file the browser caches, so a rerun only sends the link
+with spans.span("css"):
+    st.markdown(f'<link rel="stylesheet" href="{publish_stylesheet(STATIC_DIR, "app")}">', unsafe_allow_html=True)
 
-# Career Case Studies Database (NEW ADDITION)
-CAREER_CASE_STUDIES = {
-    "NICU Nurse": [
-        {
-            "title": "Statistical Analysis of Neonatal Sepsis Risk Factors",
-            "url": "https://publications.aap.org/pediatrics/article/146/1/e20193711/76947/Neonatal-Sepsis-Ahead-of-Time",
-            "description": "Case study showing statistical modeling of risk factors for neonatal infections"
-        },
-        {
-            "title": "Statistical Process Control in NICU Quality Improvement",
-            "url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC5869186/",
-            "description": "Using control charts to reduce central line infections in NICUs"
-        }
-    ],
-    "Marketing Professional": [
-        {
-            "title": "A/B Testing Case Study: Netflix Recommendation Algorithm",
-            "url": "https://netflixtechblog.com/its-all-a-bout-testing-the-netflix-experimentation-platform-4e1ca458c15",
-            "description": "Statistical testing of recommendation algorithms to improve user engagement"
-        },
-        {
-            "title": "Statistical Analysis of Customer Lifetime Value",
-            "url": "https://hbr.org/2021/03/how-to-calculate-customer-lifetime-value",
-            "description": "Using regression analysis to predict and optimize customer value"
-        }
-    ],
-    "Pediatric Surgeon": [
-        {
-            "title": "Statistical Analysis of Surgical Outcomes in Pediatric Cardiology",
-            "url": "https://www.jtcvstech.org/article/S2666-2736(20)30132-9/fulltext",
-            "description": "Case study on statistical models predicting surgical complication risks"
-        },
-        {
-            "title": "Evidence-Based Surgery: Statistical Review of Minimally Invasive Techniques",
-            "url": "https://jamanetwork.com/journals/jamasurgery/fullarticle/2756414",
-            "description": "Meta-analysis comparing traditional vs. minimally invasive pediatric surgery"
-        }
-    ],
-    "Registered Nurse": [
-        {
-            "title": "Statistical Control Charts for Hospital-Acquired Infections",
-            "url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC4043407/",
-            "description": "Using statistical process control to reduce infection rates"
-        },
-        {
-            "title": "Data-Driven Nursing: Statistical Analysis of Fall Prevention Programs",
-            "url": "https://journals.lww.com/nursing/Fulltext/2019/05000/Using_data_to_reduce_patient_falls.12.aspx",
-            "description": "Statistical evaluation of patient fall prevention interventions"
-        }
-    ],
-    "Cybersecurity Professional": [
-        {
-            "title": "Statistical Anomaly Detection for Network Security",
-            "url": "https://www.usenix.org/conference/usenixsecurity21/presentation/liu-zhuo",
-            "description": "Case study on statistical methods for detecting cyber attacks"
-        },
-        {
-            "title": "Probability Models for Cybersecurity Risk Assessment",
-            "url": "https://www.sans.org/white-papers/37075/",
-            "description": "Statistical approaches to quantifying and managing security risks"
-        }
-    ],
-    "Cosmetic Scientist": [
-        {
-            "title": "Statistical Design of Experiments in Cosmetic Formulation",
-            "url": "https://onlinelibrary.wiley.com/doi/abs/10.1111/ics.12456",
-            "description": "Case study on optimizing cosmetic products using statistical methods"
-        },
-        {
-            "title": "Clinical Trial Statistics for Cosmetic Product Testing",
-            "url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC2921764/",
-            "description": "Statistical analysis methods for cosmetic efficacy studies"
-        }
-    ],
-    "Dermatology Physician Assistant": [
-        {
-            "title": "Statistical Analysis of Skin Cancer Diagnostic Accuracy",
-            "url": "https://jamanetwork.com/journals/jamadermatology/fullarticle/2762448",
-            "description": "Statistical evaluation of diagnostic tests for melanoma detection"
-        },
-        {
-            "title": "Clinical Trial Statistics for Dermatological Treatments",
-            "url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC3047950/",
-            "description": "Statistical methods in dermatology treatment efficacy studies"
-        }
-    ],
-    "Electrical Engineer": [
-        {
-            "title": "Statistical Quality Control in Semiconductor Manufacturing",
-            "url": "https://ieeexplore.ieee.org/document/8991809",
-            "description": "Case study on statistical process control in chip manufacturing"
-        },
-        {
-            "title": "Reliability Engineering: Statistical Failure Analysis",
-            "url": "https://www.sciencedirect.com/science/article/pii/S0951832018305500",
-            "description": "Statistical methods for predicting electronic component failures"
-        }
-    ],
-    "Civil Engineer": [
-        {
-            "title": "Statistical Analysis of Structural Load Testing",
-            "url": "https://ascelibrary.org/doi/10.1061/%28ASCE%29ST.1943-541X.0002019",
-            "description": "Case study on statistical methods in bridge safety testing"
-        },
-        {
-            "title": "Geotechnical Statistics for Foundation Design",
-            "url": "https://www.sciencedirect.com/science/article/pii/S0266352X17301832",
-            "description": "Statistical analysis of soil properties for construction projects"
-        }
-    ],
-    "Pediatrician": [
-        {
-            "title": "Statistical Analysis of Childhood Vaccination Effectiveness",
-            "url": "https://www.nejm.org/doi/full/10.1056/NEJMoa1912514",
-            "description": "Large-scale statistical study of pediatric vaccine efficacy"
-        },
-        {
-            "title": "Growth Chart Statistics and Child Development",
-            "url": "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC4235455/",
-            "description": "Statistical methods behind pediatric growth standards"
-        }
-    ],
-    "Software Developer": [
-        {
-            "title": "A/B Testing at Scale: Facebook's Experimentation Platform",
-            "url": "https://engineering.fb.com/2020/05/08/production-engineering/ab-testing/",
-            "description": "Statistical testing methodology for software feature development"
-        },
-        {
-            "title": "Statistical Analysis of Software Performance Metrics",
-            "url": "https://dl.acm.org/doi/10.1145/3180155.3180180",
-            "description": "Case study on using statistics for performance optimization"
-        }
-    ],
-    "Physicist / Nanotechnologist": [
-        {
-            "title": "Statistical Analysis of Experimental Physics Data",
-            "url": "https://www.nature.com/articles/s41567-020-0834-8",
-            "description": "Statistical methods in particle physics experimentation"
-        },
-        {
-            "title": "Nanomaterial Characterization Statistics",
-            "url": "https://pubs.acs.org/doi/10.1021/acsnano.0c08903",
-            "description": "Statistical analysis techniques for nanotechnology research"
-        }
-    ]
-}
+# Deck content (reloaded automatically when apstat/content.json changes)
+with spans.span("content"):
+    # The school this page is for (?tenant=..., see apstat/tenants.py): its branding and slide subset
+    tenant = get_tenant(st.query_params.get("tenant"))
+    branding = tenant.branding
+    # Content shared by every tenant, and this tenant's view of it
+    shared_content = get_content()
+    content = tenant.content(shared_content)
+    slides = content.slides
+    SLIDE_REGISTRY = content.registry
+    GUARANTEED_VIDEOS = content.videos
+    YOUTUBE_SEARCH_KEYWORDS = content.keywords
+    # Links that were down at the last `python -m apstat check-links` (read from its cache, never checked here)
+    DEAD_LINKS = get_dead_links()
+    # Thumbnails from `python -m apstat prefetch-previews`, served from static/thumbs ({} when the cache is cold)
+    LINK_PREVIEWS = get_previews()
 
-# YouTube Search Keywords for each career
-YOUTUBE_SEARCH_KEYWORDS = {
-    "NICU Nurse": [
-        "statistics nursing NICU",
-        "medical statistics for nurses",
-        "data analysis in healthcare",
-        "statistics in neonatal care",
-        "evidence-based practice nursing"
-    ],
-    "Marketing Professional": [
-        "statistics in marketing",
-        "marketing analytics",
-        "A/B testing statistics",
-        "data-driven marketing",
-        "market research statistics"
-    ],
-    "Pediatric Surgeon": [
-        "medical statistics",
-        "surgical outcomes statistics",
-        "clinical research statistics",
-        "statistics in medicine",
-        "evidence-based surgery"
-    ],
-    "Registered Nurse": [
-        "nursing statistics",
-        "healthcare data analysis",
-        "patient care statistics",
-        "quality improvement statistics",
-        "nursing research statistics"
-    ],
-    "Cybersecurity Professional": [
-        "statistics in cybersecurity",
-        "data analysis security",
-        "threat detection statistics",
-        "security analytics",
-        "cybersecurity data science"
-    ],
-    "Cosmetic Scientist": [
-        "statistics in cosmetics",
-        "product testing statistics",
-        "cosmetic research statistics",
-        "quality control statistics",
-        "experimental design cosmetics"
-    ],
-    "Dermatology Physician Assistant": [
-        "medical statistics dermatology",
-        "skin care statistics",
-        "clinical dermatology research",
-        "medical data analysis",
-        "dermatology research statistics"
-    ],
-    "Electrical Engineer": [
-        "statistics for engineers",
-        "engineering statistics",
-        "quality control statistics engineering",
-        "reliability engineering statistics",
-        "electrical engineering data analysis"
-    ],
-    "Civil Engineer": [
-        "statistics civil engineering",
-        "structural engineering statistics",
-        "construction statistics",
-        "engineering data analysis",
-        "civil engineering quality control"
-    ],
-    "Pediatrician": [
-        "medical statistics pediatrics",
-        "child health statistics",
-        "pediatric research statistics",
-        "growth chart statistics",
-        "pediatric medicine data analysis"
-    ],
-    "Software Developer": [
-        "statistics for software developers",
-        "A/B testing software",
-        "data analysis programming",
-        "software metrics statistics",
-        "machine learning statistics"
-    ],
-    "Physicist / Nanotechnologist": [
-        "statistics in physics",
-        "scientific data analysis",
-        "research statistics",
-        "nanotechnology data analysis",
-        "physics experiment statistics"
-    ],
-    "general": [
-        "introduction to statistics",
-        "AP statistics course",
-        "statistics for beginners",
-        "real-world statistics",
-        "careers in statistics"
-    ]
-}
+def link_label(url, label):
+    """Sidebar link text, flagged when the link was down at the last check"""
+    return f"⚠️ {label} (down at last check)" if url in DEAD_LINKS else label
 
-# New Jersey College Schedules (unchanged from original)
-NJ_COLLEGE_SCHEDULES = {
-    "NICU Nurse": {
-        "school": "Rutgers University School of Nursing",
-        "major": "Bachelor of Science in Nursing (BSN)",
-        "schedule": {
-            "Year 1": ["General Biology", "General Chemistry", "Anatomy & Physiology I", "College Writing", "Statistics (AP Credit Accepted!)"],
-            "Year 2": ["Anatomy & Physiology II", "Microbiology", "Pathophysiology", "Nursing Fundamentals", "Health Assessment"],
-            "Year 3": ["Medical-Surgical Nursing", "Pediatric Nursing", "Pharmacology", "Research in Nursing", "Clinical Rotations"],
-            "Year 4": ["Maternal-Child Nursing", "Community Health Nursing", "NICU Specialization", "Nursing Leadership", "Capstone Clinical"]
-        },
-        "stats_note": "Statistics is a REQUIRED course for all nursing majors. AP Statistics credit fulfills this requirement."
-    },
-    "Marketing Professional": {
-        "school": "Rutgers Business School",
-        "major": "Bachelor of Science in Marketing",
-        "schedule": {
-            "Year 1": ["Principles of Marketing", "Microeconomics", "Business Statistics (AP Credit Accepted!)", "Financial Accounting", "Business Ethics"],
-            "Year 2": ["Consumer Behavior", "Marketing Research", "Macroeconomics", "Management Information Systems", "Business Law"],
-            "Year 3": ["Digital Marketing", "Brand Management", "Marketing Analytics", "Sales Management", "Elective"],
-            "Year 4": ["Marketing Strategy", "International Marketing", "Marketing Capstone", "Professional Development", "Internship"]
-        },
-        "stats_note": "Business Statistics is CORE to marketing analytics. AP Stats gives you a significant advantage."
-    },
-    "Pediatric Surgeon": {
-        "school": "Rutgers Robert Wood Johnson Medical School (Pre-med track)",
-        "major": "Biology/Pre-medical Studies",
-        "schedule": {
-            "Year 1": ["General Biology I & II", "General Chemistry I & II", "Calculus I", "Statistics for Life Sciences (AP Credit Accepted!)"],
-            "Year 2": ["Organic Chemistry I & II", "Physics I & II", "Cell Biology", "Genetics", "Biochemistry"],
-            "Year 3": ["Human Anatomy", "Physiology", "Microbiology", "Research Methods", "MCAT Preparation"],
-            "Year 4": ["Advanced Biology Electives", "Medical Ethics", "Senior Thesis", "Shadowing Experience", "Medical School Applications"]
-        },
-        "stats_note": "Statistics is ESSENTIAL for medical research and understanding clinical studies."
-    },
-    "Registered Nurse": {
-        "school": "Montclair State University Nursing Program",
-        "major": "Bachelor of Science in Nursing",
-        "schedule": {
-            "Year 1": ["Human Biology", "General Chemistry", "Introduction to Nursing", "Statistics for Health Sciences (AP Credit Accepted!)", "First Year Seminar"],
-            "Year 2": ["Anatomy & Physiology", "Microbiology", "Health Assessment", "Pathophysiology", "Clinical Skills Lab"],
-            "Year 3": ["Adult Health Nursing", "Mental Health Nursing", "Pharmacology", "Nursing Research", "Clinical Practice"],
-            "Year 4": ["Community Health", "Nursing Leadership", "Complex Care Nursing", "Capstone Experience", "NCLEX Preparation"]
-        },
-        "stats_note": "Statistics is required for evidence-based practice and nursing research courses."
-    },
-    "Cybersecurity Professional": {
-        "school": "New Jersey Institute of Technology (NJIT)",
-        "major": "Bachelor of Science in Cybersecurity",
-        "schedule": {
-            "Year 1": ["Introduction to Cybersecurity", "Programming Fundamentals", "Discrete Mathematics", "Statistics for Computing (AP Credit Accepted!)"],
-            "Year 2": ["Network Security", "Cryptography", "Operating Systems", "Data Structures", "Ethical Hacking"],
-            "Year 3": ["Digital Forensics", "Security Analytics", "Cloud Security", "Risk Management", "Elective"],
-            "Year 4": ["Cyber Defense", "Security Governance", "Capstone Project", "Internship", "Professional Certification Prep"]
-        },
-        "stats_note": "Statistics is crucial for threat detection algorithms and security analytics."
-    },
-    "Cosmetic Scientist": {
-        "school": "Rutgers School of Pharmacy",
-        "major": "Pharmaceutical Sciences/Cosmetic Science",
-        "schedule": {
-            "Year 1": ["General Chemistry", "Biology", "Calculus", "Statistics for Sciences (AP Credit Accepted!)", "Introduction to Cosmetic Science"],
-            "Year 2": ["Organic Chemistry", "Physics", "Biochemistry", "Dermatology Basics", "Product Formulation"],
-            "Year 3": ["Analytical Chemistry", "Product Testing Methods", "Regulatory Affairs", "Quality Control", "Research Methods"],
-            "Year 4": ["Advanced Formulation", "Stability Testing", "Cosmetic Regulations", "Capstone Project", "Industry Internship"]
-        },
-        "stats_note": "Statistics is required for product testing, quality control, and research."
-    },
-    "Dermatology Physician Assistant": {
-        "school": "Rutgers Physician Assistant Program (Pre-PA track)",
-        "major": "Health Sciences/Pre-Physician Assistant",
-        "schedule": {
-            "Year 1": ["Human Biology", "General Chemistry", "Medical Terminology", "Statistics for Health Professions (AP Credit Accepted!)"],
-            "Year 2": ["Anatomy & Physiology", "Microbiology", "Psychology", "Organic Chemistry", "Pathophysiology"],
-            "Year 3": ["Genetics", "Pharmacology", "Medical Ethics", "Research Methods", "Patient Care Experience"],
-            "Year 4": ["Advanced Health Assessment", "Clinical Medicine", "Healthcare Systems", "PA School Prerequisites", "Application Preparation"]
-        },
-        "stats_note": "Statistics is required for PA program admission and understanding clinical research."
-    },
-    "Electrical Engineer": {
-        "school": "New Jersey Institute of Technology (NJIT)",
-        "major": "Bachelor of Science in Electrical Engineering",
-        "schedule": {
-            "Year 1": ["Engineering Fundamentals", "Calculus I & II", "Physics I & II", "Programming for Engineers", "Probability & Statistics (AP Credit Accepted!)"],
-            "Year 2": ["Circuit Analysis", "Digital Logic Design", "Signals & Systems", "Electromagnetics", "Engineering Mathematics"],
-            "Year 3": ["Electronic Devices", "Control Systems", "Power Systems", "Communication Systems", "Lab Courses"],
-            "Year 4": ["Senior Design Project", "Technical Electives", "Power Electronics", "Embedded Systems", "Professional Practice"]
-        },
-        "stats_note": "Probability & Statistics is a CORE engineering requirement for reliability analysis."
-    },
-    "Civil Engineer": {
-        "school": "Rutgers School of Engineering",
-        "major": "Bachelor of Science in Civil Engineering",
-        "schedule": {
-            "Year 1": ["Engineering Graphics", "Calculus I & II", "Physics I & II", "Chemistry for Engineers", "Engineering Statistics (AP Credit Accepted!)"],
-            "Year 2": ["Statics", "Dynamics", "Mechanics of Materials", "Surveying", "Materials Science"],
-            "Year 3": ["Structural Analysis", "Geotechnical Engineering", "Transportation Engineering", "Hydraulics", "Environmental Engineering"],
-            "Year 4": ["Senior Design Project", "Construction Management", "Structural Design", "Electives", "Professional Development"]
-        },
-        "stats_note": "Engineering Statistics is required for structural safety analysis and quality control."
-    },
-    "Pediatrician": {
-        "school": "Rutgers University (Pre-med track)",
-        "major": "Biology/Pre-medical Studies",
-        "schedule": {
-            "Year 1": ["General Biology", "General Chemistry", "Calculus", "Statistics for Biology (AP Credit Accepted!)", "Introduction to Medicine"],
-            "Year 2": ["Organic Chemistry", "Physics", "Genetics", "Psychology", "Child Development"],
-            "Year 3": ["Biochemistry", "Cell Biology", "Physiology", "Research Methods", "MCAT Preparation"],
-            "Year 4": ["Immunology", "Neuroscience", "Medical Ethics", "Pediatrics Elective", "Medical School Applications"]
-        },
-        "stats_note": "Statistics is crucial for interpreting medical research and clinical studies."
-    },
-    "Software Developer": {
-        "school": "Rutgers School of Arts and Sciences",
-        "major": "Computer Science",
-        "schedule": {
-            "Year 1": ["Introduction to Computer Science", "Calculus I", "Discrete Mathematics", "Statistics for CS (AP Credit Accepted!)", "Data Structures"],
-            "Year 2": ["Computer Architecture", "Algorithms", "Software Methodology", "Systems Programming", "Linear Algebra"],
-            "Year 3": ["Operating Systems", "Database Systems", "Computer Networks", "Elective", "Internship"],
-            "Year 4": ["Software Engineering", "Capstone Project", "Advanced Electives", "Professional Development", "Job Preparation"]
-        },
-        "stats_note": "Statistics is essential for A/B testing, machine learning, and data analysis."
-    },
-    "Physicist / Nanotechnologist": {
-        "school": "Rutgers School of Arts and Sciences",
-        "major": "Physics/Nanotechnology",
-        "schedule": {
-            "Year 1": ["Physics I & II", "Calculus I & II", "General Chemistry", "Statistics for Physical Sciences (AP Credit Accepted!)"],
-            "Year 2": ["Modern Physics", "Multivariable Calculus", "Electricity & Magnetism", "Thermal Physics", "Computer Programming"],
-            "Year 3": ["Quantum Mechanics", "Solid State Physics", "Nanotechnology Fundamentals", "Research Methods", "Lab Courses"],
-            "Year 4": ["Advanced Physics Labs", "Senior Thesis", "Specialized Electives", "Graduate School Prep", "Professional Development"]
-        },
-        "stats_note": "Statistics is required for experimental data analysis and uncertainty quantification."
-    }
-}
+def display_youtube_search(career_name, parts):
+    """Display YouTube search functionality for a career"""
+    # Header and search keywords as clickable links, sent as one block
+    st.markdown(f"""### 🔍 Search YouTube for Videos
+**Find current videos about statistics in {career_name}:**
 
-# App data
-slides = [
-    {
-        "title": "📊 AP Statistics",
-        "subtitle": "Your Gateway to Career Success",
-        "content": "Why Juniors Should Take AP Stats Senior Year",
-        "type": "title"
-    },
-    {
-        "title": "Why AP Statistics Matters",
-        "content": {
-            "benefits": [
-                "Required or recommended for MOST college majors",
-                "Earn college credit and save tuition money",
-                "Build critical thinking and data analysis skills",
-                "Stand out on college applications",
-                "Prepare for data-driven careers in ANY field"
-            ],
-            "applications": "Whether you're interested in healthcare, technology, engineering, business, or research, statistics is the foundation of decision-making in the modern workplace. Let's explore how AP Statistics prepares you for YOUR future career!",
-            "resources": "general"
-        },
-        "type": "intro"
-    },
-    {
-        "title": "🏥 NICU Nurse",
-        "content": {
-            "description": "How Statistics Empowers NICU Nurses",
-            "examples": [
-                {
-                    "title": "Patient Monitoring & Risk Assessment",
-                    "content": "NICU nurses analyze vital sign patterns (heart rate, oxygen levels, temperature) to detect abnormalities. Using statistical concepts like <span class='highlight'>mean, standard deviation, and outliers</span>, you can identify when a baby's vitals fall outside normal ranges and require immediate intervention."
-                },
-                {
-                    "title": "Treatment Effectiveness Analysis",
-                    "content": "When implementing care protocols, nurses track outcomes across multiple patients. Using <span class='highlight'>hypothesis testing and confidence intervals</span>, you can determine if a new feeding schedule or medication dosage is significantly improving patient outcomes compared to standard care."
-                }
-            ],
-            "resources": "NICU Nurse"
-        },
-        "type": "career"
-    },
-    {
-        "title": "📈 Marketing Professional",
-        "content": {
-            "description": "How Statistics Drives Marketing Success",
-            "examples": [
-                {
-                    "title": "Campaign Performance Analysis",
-                    "content": "Marketing professionals analyze customer data to measure campaign effectiveness. Using <span class='highlight'>regression analysis and correlation</span>, you can identify which advertising channels (social media, email, TV) drive the most conversions and optimize budget allocation accordingly."
-                },
-                {
-                    "title": "Customer Segmentation & Targeting",
-                    "content": "Understanding customer behavior requires analyzing demographic and purchase data. Using <span class='highlight'>probability distributions and sampling methods</span>, you can segment audiences, predict purchasing patterns, and create personalized marketing strategies for different customer groups."
-                }
-            ],
-            "resources": "Marketing Professional"
-        },
-        "type": "career"
-    },
-    {
-        "title": "⚕️ Pediatric Surgeon",
-        "content": {
-            "description": "How Statistics Enhances Surgical Excellence",
-            "examples": [
-                {
-                    "title": "Surgical Outcome Prediction",
-                    "content": "Surgeons evaluate patient risk factors (age, weight, medical history) to predict surgical outcomes. Using <span class='highlight'>probability and risk assessment</span>, you can calculate the likelihood of complications and make informed decisions about surgical approaches for each child."
-                },
-                {
-                    "title": "Clinical Research & Evidence-Based Practice",
-                    "content": "Surgical techniques improve through research. Using <span class='highlight'>experimental design and statistical significance testing</span>, you can evaluate whether new surgical methods or robotic-assisted procedures produce better results than traditional techniques, ensuring you provide the best care."
-                }
-            ],
-            "resources": "Pediatric Surgeon"
-        },
-        "type": "career"
-    },
-    {
-        "title": "💉 Registered Nurse",
-        "content": {
-            "description": "How Statistics Improves Patient Care",
-            "examples": [
-                {
-                    "title": "Interpreting Lab Results",
-                    "content": "Nurses review patient lab work daily (blood counts, glucose levels, kidney function). Understanding <span class='highlight'>normal distributions and reference ranges</span> allows you to quickly identify abnormal results that require physician notification or immediate patient intervention."
-                },
-                {
-                    "title": "Quality Improvement & Safety",
-                    "content": "Healthcare facilities track infection rates, medication errors, and patient falls. Using <span class='highlight'>control charts and statistical process control</span>, nurses on quality improvement teams can identify trends, implement safety protocols, and measure whether interventions reduce adverse events."
-                }
-            ],
-            "resources": "Registered Nurse"
-        },
-        "type": "career"
-    },
-    {
-        "title": "🔒 Cybersecurity Professional",
-        "content": {
-            "description": "How Statistics Defends Digital Systems",
-            "examples": [
-                {
-                    "title": "Threat Detection & Anomaly Analysis",
-                    "content": "Cybersecurity analysts monitor network traffic patterns to identify potential attacks. Using <span class='highlight'>statistical modeling and outlier detection</span>, you can spot unusual login attempts, data transfers, or access patterns that indicate a security breach in progress."
-                },
-                {
-                    "title": "Risk Assessment & Security Metrics",
-                    "content": "Organizations must prioritize security investments. Using <span class='highlight'>probability and risk modeling</span>, you can calculate the likelihood and potential impact of different cyber threats, helping leadership allocate resources to protect the most critical systems and data."
-                }
-            ],
-            "resources": "Cybersecurity Professional"
-        },
-        "type": "career"
-    },
-    {
-        "title": "🧪 Cosmetic Scientist",
-        "content": {
-            "description": "How Statistics Drives Product Innovation",
-            "examples": [
-                {
-                    "title": "Product Testing & Consumer Research",
-                    "content": "Before launching products, cosmetic scientists conduct consumer trials. Using <span class='highlight'>experimental design and hypothesis testing</span>, you can determine if users experience statistically significant improvements in skin texture, hydration, or appearance compared to placebo products."
-                },
-                {
-                    "title": "Formulation Optimization",
-                    "content": "Creating effective cosmetics requires testing ingredient combinations. Using <span class='highlight'>regression analysis and optimization techniques</span>, you can identify which ingredient concentrations and ratios produce the best stability, texture, and efficacy results for new products."
-                }
-            ],
-            "resources": "Cosmetic Scientist"
-        },
-        "type": "career"
-    },
-    {
-        "title": "🩺 Dermatology Physician Assistant",
-        "content": {
-            "description": "How Statistics Improves Diagnosis & Treatment",
-            "examples": [
-                {
-                    "title": "Diagnostic Accuracy & Pattern Recognition",
-                    "content": "Dermatology PAs evaluate skin lesions for cancer risk. Understanding <span class='highlight'>sensitivity, specificity, and positive predictive value</span> helps you interpret AI diagnostic tools, assess biopsy results, and understand the probability that a concerning lesion is actually malignant."
-                },
-                {
-                    "title": "Treatment Protocol Comparison",
-                    "content": "Multiple treatment options exist for conditions like acne or eczema. Using <span class='highlight'>comparative analysis and confidence intervals</span>, you can evaluate clinical study data to determine which treatments have the highest success rates and recommend evidence-based therapies to patients."
-                }
-            ],
-            "resources": "Dermatology Physician Assistant"
-        },
-        "type": "career"
-    },
-    {
-        "title": "⚡ Electrical Engineer",
-        "content": {
-            "description": "How Statistics Powers Engineering Design",
-            "examples": [
-                {
-                    "title": "Quality Control & Testing",
-                    "content": "Electrical engineers test circuit reliability and component performance. Using <span class='highlight'>sampling distributions and hypothesis testing</span>, you can determine if manufactured circuits meet specifications and identify defect rates before products reach consumers."
-                },
-                {
-                    "title": "Predictive Maintenance & Reliability",
-                    "content": "Power systems and equipment must be maintained before failures occur. Using <span class='highlight'>probability distributions and survival analysis</span>, you can predict when components are likely to fail, schedule preventive maintenance, and minimize costly unexpected outages."
-                }
-            ],
-            "resources": "Electrical Engineer"
-        },
-        "type": "career"
-    },
-    {
-        "title": "🏗️ Civil Engineer",
-        "content": {
-            "description": "How Statistics Ensures Safe Infrastructure",
-            "examples": [
-                {
-                    "title": "Load Analysis & Structural Safety",
-                    "content": "Civil engineers design buildings and bridges to withstand various loads. Using <span class='highlight'>probability distributions and safety factors</span>, you can analyze expected weight, wind, and seismic forces to ensure structures can handle extreme conditions with appropriate safety margins."
-                },
-                {
-                    "title": "Materials Testing & Quality Assurance",
-                    "content": "Construction projects require testing concrete strength, soil properties, and material durability. Using <span class='highlight'>sampling methods and confidence intervals</span>, you can determine if materials meet building codes and specifications based on test samples rather than testing every batch."
-                }
-            ],
-            "resources": "Civil Engineer"
-        },
-        "type": "career"
-    },
-    {
-        "title": "👶 Pediatrician",
-        "content": {
-            "description": "How Statistics Guides Child Healthcare",
-            "examples": [
-                {
-                    "title": "Growth & Development Monitoring",
-                    "content": "Pediatricians track children's growth using standardized charts. Understanding <span class='highlight'>percentiles and z-scores</span> allows you to interpret whether a child's height, weight, and head circumference fall within normal ranges or indicate potential developmental or nutritional concerns."
-                },
-                {
-                    "title": "Evidence-Based Treatment Decisions",
-                    "content": "Medical research guides pediatric care. Using <span class='highlight'>clinical trial analysis and effect sizes</span>, you can interpret study results to determine which treatments, vaccines, or interventions are most effective for different childhood conditions and age groups."
-                }
-            ],
-            "resources": "Pediatrician"
-        },
-        "type": "career"
-    },
-    {
-        "title": "💻 Software Developer",
-        "content": {
-            "description": "How Statistics Powers Modern Software",
-            "examples": [
-                {
-                    "title": "A/B Testing & Feature Optimization",
-                    "content": "Developers test different app designs and features with users. Using <span class='highlight'>hypothesis testing and p-values</span>, you can determine if a new interface design or feature significantly improves user engagement, retention, or conversion rates compared to the current version."
-                },
-                {
-                    "title": "Algorithm Performance & Machine Learning",
-                    "content": "Modern software relies on AI and data analysis. Using <span class='highlight'>regression, classification, and model evaluation metrics</span>, you can build predictive algorithms, assess model accuracy, and optimize software performance based on user behavior data."
-                }
-            ],
-            "resources": "Software Developer"
-        },
-        "type": "career"
-    },
-    {
-        "title": "🔬 Physicist / Nanotechnologist",
-        "content": {
-            "description": "How Statistics Advances Scientific Discovery",
-            "examples": [
-                {
-                    "title": "Experimental Data Analysis",
-                    "content": "Physics experiments generate massive datasets with measurement uncertainty. Using <span class='highlight'>error analysis, statistical significance, and uncertainty propagation</span>, you can determine if experimental results support theoretical predictions and separate true signals from background noise."
-                },
-                {
-                    "title": "Materials Characterization & Modeling",
-                    "content": "Nanotechnology research involves testing material properties at atomic scales. Using <span class='highlight'>statistical mechanics and distribution analysis</span>, you can analyze particle behavior, predict material properties, and optimize nanomaterial designs for specific applications."
-                }
-            ],
-            "resources": "Physicist / Nanotechnologist"
-        },
-        "type": "career"
-    },
-    {
-        "title": "Take AP Statistics Next Year!",
-        "content": {
-            "points": [
-                "✓ Prepare for ANY college major",
-                "✓ Build essential career skills",
-                "✓ Earn college credit",
-                "✓ Stand out to admissions"
-            ],
-            "call_to_action": "Your future career starts with the decisions you make today! 📊",
-            "contact": "Questions? Talk to your guidance counselor about registering for AP Statistics!"
-        },
-        "type": "closing"
-    }
-]
+**Suggested search terms (click to open):**
 
-def create_youtube_search_url(search_query):
-    """Create a YouTube search URL"""
-    encoded_query = urllib.parse.quote(search_query)
-    return f"https://www.youtube.com/results?search_query={encoded_query}"
+{parts["keyword_links"]}
 
-def display_youtube_search(career_name, keywords=None):
-    """Display YouTube search functionality for a career"""
-    if not keywords:
-        keywords = YOUTUBE_SEARCH_KEYWORDS.get(career_name, [])
-    
-    st.markdown("### 🔍 Search YouTube for Videos")
-    st.markdown(f"**Find current videos about statistics in {career_name}:**")
-    
-    # Display search keywords as clickable links
-    st.markdown("**Suggested search terms (click to open):**")
+**Or enter your own search:**
+""", unsafe_allow_html=True)
     
-    for idx, keyword in enumerate(keywords[:6]):  # Show up to 6 keywords
-        search_url = create_youtube_search_url(keyword)
-        st.markdown(f"""
-        <a href="{search_url}" target="_blank" class="clickable-link">
-        🔍 {keyword}
-        </a>
-        """, unsafe_allow_html=True)
+    youtube_search_box(career_name)
     
-    # Custom search box
-    st.markdown("**Or enter your own search:**")
+    # Display guaranteed working videos
+    st.markdown(f"""### ✅ Guaranteed Working Videos
+**These videos are always available (click to watch):**
+
+{parts["videos"]}
+""", unsafe_allow_html=True)
+
+@st.fragment
+def youtube_search_box(career_name):
+    """Custom search box; typing in it reruns only this fragment"""
     col1, col2 = st.columns([3, 1])
     with col1:
         custom_search = st.text_input(
             "Search YouTube:",
-            value=f"statistics in {career_name}",
+            value=saved_search(st.session_state, career_name),
             key=f"custom_search_{career_name}",
             placeholder=f"Search for statistics in {career_name}..."
         )
@@ -960,44 +109,32 @@ def display_youtube_search(career_name, keywords=None):
             🔍 Search
             </a>
             """, unsafe_allow_html=True)
-    
-    # Display guaranteed working videos
-    st.markdown("### ✅ Guaranteed Working Videos")
-    st.markdown("**These videos are always available (click to watch):**")
-    
-    for key, video in GUARANTEED_VIDEOS.items():
-        st.markdown(f"""
-        <div class='resource-link working-video'>
-            ▶️ <a href='{video['url']}' target='_blank'>{video['title']}</a>
-            <br><small>{video['description']}</small>
-        </div>
-        """, unsafe_allow_html=True)
 
-def display_career_resources(career_key, career_name):
+@spans.timed()
+def display_career_resources(record, parts):
     """Display resources for a specific career"""
-    st.markdown("### 📚 Learning Resources")
+    career_name = record.career
     
     # Display Case Studies Section (NEW ADDITION)
-    if career_name in CAREER_CASE_STUDIES and CAREER_CASE_STUDIES[career_name]:
-        st.markdown("#### 📄 Real-World Case Studies")
-        st.markdown(f"**See how statistics are actually used in {career_name}: (click to open)**")
-        
-        for study in CAREER_CASE_STUDIES[career_name]:
-            st.markdown(f"""
-            <div class='case-study-link'>
-                📖 <a href='{study['url']}' target='_blank'>{study['title']}</a>
-                <br><small>{study['description']}</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("---")
+    if record.case_studies:
+        st.markdown(f"""### 📚 Learning Resources
+#### 📄 Real-World Case Studies
+**See how statistics are actually used in {career_name}: (click to open)**
+
+{parts["case_studies"]}
+
+---
+""", unsafe_allow_html=True)
+    else:
+        st.markdown("### 📚 Learning Resources")
     
     # Display YouTube search section
-    display_youtube_search(career_name)
+    display_youtube_search(career_name, parts)
     
     # Additional resources section
-    st.markdown("### 📖 Additional Learning Materials")
     st.markdown("""
+    ### 📖 Additional Learning Materials
+    
     <div class='case-study'>
     <strong>Where to find more information:</strong>
     <ul>
@@ -1009,797 +146,227 @@ def display_career_resources(career_key, career_name):
     </div>
     """, unsafe_allow_html=True)
 
-def create_instructions_file():
-    instructions = """HOW TO CONVERT TO POWERPOINT/GOOGLE SLIDES
-
-OPTION 1 - MANUAL RECREATION (Recommended for full control):
-1. Open PowerPoint or Google Slides
-2. Create a new presentation
-3. For each slide in this preview:
-   - Create a new slide with appropriate layout
-   - Copy the text content
-   - Apply similar formatting (colors, fonts, spacing)
-   - Add gradient backgrounds where shown
-
-OPTION 2 - SCREENSHOT METHOD (Quick):
-1. Use this presentation in full-screen mode
-2. Take screenshots of each slide
-3. Import screenshots into PowerPoint/Google Slides
-4. Add text boxes over screenshots for editability
-5. Adjust formatting as needed
+@spans.timed()
+def create_flyer_html():
+    """Create a two-page flyer summary (front and back) as HTML"""
+    today = datetime.now().strftime("%B %d, %Y")
+    return render_flyer_html(branding.rebrand(content.flyer), today)
 
-DESIGN TIPS:
-- Use gradient backgrounds (purple/blue theme)
-- Keep text large and readable
-- Use consistent colors: Primary purple (#667eea), Secondary purple (#764ba2)
-- Include emojis for visual interest
-- Use white/light gray cards for examples
-- Maintain spacing and hierarchy
+@spans.timed()
+def create_complete_presentation_html():
+    """Create a COMPLETE printable version of ALL slides"""
+    today = datetime.now().strftime("%B %d, %Y")
+    return render_presentation_html(SLIDE_REGISTRY, GUARANTEED_VIDEOS, today, branding)
 
-CONTENT ORGANIZATION:
-Slide 1: Title slide
-Slide 2: Introduction to AP Statistics benefits
-Slides 3-14: Individual careers (12 careers)
-Slide 15: Closing/Call to action
+@spans.timed()
+def create_presentation_pdf():
+    """Create the complete presentation as a native PDF"""
+    today = datetime.now().strftime("%B %d, %Y")
+    return render_presentation_pdf(SLIDE_REGISTRY, GUARANTEED_VIDEOS, today, branding)
 
-All content is fully editable once transferred to PowerPoint or Google Slides."""
-    
-    return instructions
+@spans.timed()
+def create_presentation_pptx():
+    """Create the complete presentation as an editable PowerPoint deck"""
+    today = datetime.now().strftime("%B %d, %Y")
+    return render_presentation_pptx(SLIDE_REGISTRY, GUARANTEED_VIDEOS, today, branding)
 
-def create_flyer_html():
-    """Create a two-page flyer summary (front and back) as HTML"""
+@spans.timed()
+def create_flyer_pdf():
+    """Create the two-page flyer as a native PDF"""
     today = datetime.now().strftime("%B %d, %Y")
-    
-    flyer_html = '''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AP Statistics Flyer</title>
-    <style>
-        @media print {
-            @page {
-                size: letter;
-                margin: 0.5in;
-            }
-            body {
-                font-family: Arial, sans-serif;
-                font-size: 11pt;
-                line-height: 1.4;
-                margin: 0;
-                padding: 0;
-                color: #000;
-            }
-            .page {
-                page-break-after: always;
-                padding: 0.5in;
-                min-height: 9in;
-            }
-            .page-break {
-                page-break-before: always;
-            }
-            h1 {
-                color: #667eea;
-                text-align: center;
-                margin-bottom: 10px;
-                font-size: 24pt;
-            }
-            h2 {
-                color: #764ba2;
-                border-bottom: 2px solid #764ba2;
-                padding-bottom: 5px;
-                font-size: 16pt;
-            }
-            .highlight {
-                background-color: #fff3cd;
-                padding: 2px 4px;
-                border-radius: 3px;
-            }
-            .section {
-                margin: 15px 0;
-                padding: 15px;
-                background: #f8f9fa;
-                border-radius: 5px;
-                border: 1px solid #dee2e6;
-            }
-            .career-grid {
-                display: grid;
-                grid-template-columns: repeat(2, 1fr);
-                gap: 10px;
-                margin: 15px 0;
-            }
-            .career-item {
-                padding: 10px;
-                background: white;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                font-size: 10pt;
-            }
-            .stat-method {
-                background: #e7f3ff;
-                padding: 8px;
-                margin: 5px 0;
-                border-left: 3px solid #667eea;
-                font-size: 10pt;
-            }
-            .contact-info {
-                text-align: center;
-                margin-top: 30px;
-                font-size: 10pt;
-                padding-top: 15px;
-                border-top: 2px solid #ccc;
-            }
-            ul, ol {
-                margin-left: 20px;
-            }
-            li {
-                margin: 8px 0;
-            }
-            .teacher-credit {
-                text-align: center;
-                font-style: italic;
-                font-size: 12pt;
-                color: #666;
-                margin-top: 5px;
-                padding: 5px;
-                border-top: 1px solid #ccc;
-            }
-        }
-    </style>
-</head>
-<body>
+    return render_flyer_pdf(branding.rebrand(content.flyer), today, branding)
 
-<!-- PAGE 1 (FRONT) -->
-<div class="page">
-    <div style="text-align: center; margin-bottom: 20px;">
-        <h1>📊 AP Statistics</h1>
-        <h2>Your Gateway to Career Success</h2>
-        <p style="font-weight: bold; font-size: 12pt;">Why Juniors Should Take AP Stats Senior Year</p>
-        <p style="font-size: 12pt; color: #666;">''' + today + '''</p>
-        <div class="teacher-credit">
-            Compiled by Dr. Roland Lucas<br>
-            AP Statistics Teacher at Newark Tech
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>🚀 Key Benefits of AP Statistics</h2>
-        <ul>
-            <li><strong>College Credit:</strong> Earn credits and save thousands in tuition</li>
-            <li><strong>College Admissions:</strong> Stand out in competitive applications</li>
-            <li><strong>Career Preparation:</strong> Required for most STEM and business majors</li>
-            <li><strong>Real-World Skills:</strong> Data analysis, critical thinking, problem-solving</li>
-            <li><strong>Versatility:</strong> Applies to healthcare, tech, engineering, business, and more</li>
-        </ul>
-    </div>
-    
-    <div class="section">
-        <h2>🎯 AP Statistics in Real Careers</h2>
-        <div class="career-grid">
-            <div class="career-item">
-                <strong style="color: #667eea;">🏥 NICU Nurse</strong><br>
-                • Vital sign statistical analysis<br>
-                • Treatment effectiveness testing<br>
-                • Infection control statistics
-            </div>
-            <div class="career-item">
-                <strong style="color: #667eea;">📈 Marketing Professional</strong><br>
-                • A/B testing campaigns<br>
-                • Customer segmentation analysis<br>
-                • ROI statistical analysis
-            </div>
-            <div class="career-item">
-                <strong style="color: #667eea;">⚕️ Pediatric Surgeon</strong><br>
-                • Surgical risk probability<br>
-                • Outcome prediction models<br>
-                • Clinical trial statistics
-            </div>
-            <div class="career-item">
-                <strong style="color: #667eea;">🔒 Cybersecurity</strong><br>
-                • Anomaly detection algorithms<br>
-                • Threat probability modeling<br>
-                • Risk statistical analysis
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>📚 AP Stats Methods You\'ll Learn</h2>
-        <div class="stat-method"><strong>Hypothesis Testing:</strong> Test ideas with data</div>
-        <div class="stat-method"><strong>Regression Analysis:</strong> Find relationships between variables</div>
-        <div class="stat-method"><strong>Probability Distributions:</strong> Model uncertainty</div>
-        <div class="stat-method"><strong>Confidence Intervals:</strong> Estimate with precision</div>
-        <div class="stat-method"><strong>Sampling Methods:</strong> Study populations efficiently</div>
-        <div class="stat-method"><strong>Experimental Design:</strong> Design valid studies</div>
-    </div>
-    
-    <div class="contact-info">
-        <p><strong>Questions?</strong> Talk to your guidance counselor about registering for AP Statistics!</p>
-    </div>
-</div>
+# Printable documents: name -> (content sections they depend on, renderer per format)
+PRINTABLES = {
+    "flyer": (
+        ("flyer",),
+        {"html": create_flyer_html, "pdf": create_flyer_pdf},
+    ),
+    "presentation": (
+        ("slides", "career_case_studies", "youtube_search_keywords", "guaranteed_videos"),
+        {"html": create_complete_presentation_html, "pdf": create_presentation_pdf, "pptx": create_presentation_pptx},
+    ),
+}
 
-<!-- PAGE 2 (BACK) -->
-<div class="page page-break">
-    <div style="text-align: center; margin-bottom: 20px;">
-        <h1 style="color: #764ba2;">AP Statistics Career Connections</h1>
-        <div class="teacher-credit">
-            AP Statistics: The Data Skills Every Career Demands<br>
-            Dr. Roland Lucas, Newark Tech
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>💡 More Career Examples</h2>
-        <div class="career-grid">
-            <div class="career-item">
-                <strong style="color: #764ba2;">🧪 Cosmetic Scientist</strong><br>
-                • Product testing statistics<br>
-                • Formulation optimization<br>
-                • Consumer research analysis
-            </div>
-            <div class="career-item">
-                <strong style="color: #764ba2;">⚡ Electrical Engineer</strong><br>
-                • Quality control statistics<br>
-                • Reliability testing<br>
-                • Circuit failure analysis
-            </div>
-            <div class="career-item">
-                <strong style="color: #764ba2;">🏗️ Civil Engineer</strong><br>
-                • Structural safety factors<br>
-                • Material strength testing<br>
-                • Load probability analysis
-            </div>
-            <div class="career-item">
-                <strong style="color: #764ba2;">💻 Software Developer</strong><br>
-                • A/B feature testing<br>
-                • Algorithm optimization<br>
-                • Performance metrics analysis
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>🔗 Real-World Case Studies</h2>
-        <p>Statistics in action across industries:</p>
-        <ul>
-            <li><strong>Netflix:</strong> A/B testing thousands of interface designs</li>
-            <li><strong>CDC:</strong> Tracking disease outbreaks with statistics</li>
-            <li><strong>Google:</strong> Analyzing search patterns and user behavior</li>
-            <li><strong>Hospitals:</strong> Reducing infection rates with statistical process control</li>
-            <li><strong>Manufacturing:</strong> Ensuring quality through statistical sampling</li>
-        </ul>
-    </div>
-    
-    <div class="section">
-        <h2>🎓 College Majors That Require Statistics</h2>
-        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 10px;">
-            <div>
-                <ul>
-                    <li>All Engineering fields</li>
-                    <li>Business & Economics</li>
-                    <li>Psychology & Sociology</li>
-                    <li>Biology & Chemistry</li>
-                </ul>
-            </div>
-            <div>
-                <ul>
-                    <li>Computer Science</li>
-                    <li>Data Science</li>
-                    <li>Environmental Science</li>
-                    <li>Public Health</li>
-                </ul>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>📞 Take Action Today!</h2>
-        <p><strong>Steps to Register for AP Statistics:</strong></p>
-        <ol>
-            <li>Talk to your current math teacher about your readiness</li>
-            <li>Visit your guidance counselor for scheduling</li>
-            <li>Check your school\'s AP course offerings and deadlines</li>
-            <li>Discuss the benefits with parents/guardians</li>
-            <li>Register before the course selection deadline</li>
-        </ol>
-    </div>
-    
-    <div class="contact-info">
-        <p style="font-size: 12pt; font-weight: bold; color: #667eea;">
-        Your future career starts with the decisions you make today!
-        </p>
-        <p style="font-style: italic; margin-top: 10px;">
-        "In God we trust, all others must bring data." - W. Edwards Deming
-        </p>
-        <div class="teacher-credit">
-            <strong>AP Statistics: The Data Skills Every Career Demands</strong><br>
-            Compiled by Dr. Roland Lucas, AP Statistics Teacher at Newark Tech
-        </div>
-    </div>
-</div>
+def get_printable_export(name, fmt="html"):
+    """Return (bytes, static URL) for a printable document from the tenant's render cache"""
+    tags, renderers = PRINTABLES[name]
+    key = content_key(f"{name}.{fmt}", content.version(*tags), branding.key())
+    
+    def render_export():
+        data = renderers[fmt]()
+        if fmt == "html":
+            data = optimize_html(data)
+        if isinstance(data, str):
+            data = data.encode()
+        return data, publish(STATIC_DIR, tenant.export_name(name), data, extension=fmt, variants=fmt == "html")
+    
+    return tenant.cache.get_or_render(key, render_export, tags=tags)
 
-</body>
-</html>'''
-    
-    return flyer_html
+def get_export_sizes(name, fmt="html"):
+    """Raw and compressed sizes of a printable document, computed once per version"""
+    tags, _ = PRINTABLES[name]
+    key = content_key(f"{name}.{fmt}.sizes", content.version(*tags), branding.key())
+    return tenant.cache.get_or_render(key, lambda: export_sizes(get_printable_export(name, fmt)[0]), tags=tags)
 
-def create_complete_presentation_html():
-    """Create a COMPLETE printable version of ALL slides"""
-    today = datetime.now().strftime("%B %d, %Y")
-    
-    presentation_html = '''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AP Statistics Full Presentation</title>
-    <style>
-        @media print {
-            @page {
-                size: letter;
-                margin: 0.5in;
-            }
-            body {
-                font-family: Arial, sans-serif;
-                font-size: 12pt;
-                line-height: 1.5;
-                margin: 0;
-                padding: 0;
-                color: #000;
-                background: white;
-            }
-            .slide {
-                page-break-after: always;
-                padding: 0.5in;
-                min-height: 9.5in;
-            }
-            h1 {
-                color: #667eea;
-                text-align: center;
-                margin-bottom: 20px;
-                font-size: 28pt;
-            }
-            h2 {
-                color: #764ba2;
-                border-bottom: 3px solid #764ba2;
-                padding-bottom: 10px;
-                margin-top: 30px;
-                font-size: 20pt;
-            }
-            h3 {
-                color: #333;
-                margin-top: 25px;
-                font-size: 16pt;
-            }
-            .example {
-                background: #f8f9fa;
-                padding: 15px;
-                margin: 15px 0;
-                border-left: 5px solid #667eea;
-                border-radius: 5px;
-            }
-            .benefit-list {
-                margin: 20px 0;
-                padding-left: 20px;
-            }
-            .benefit-list li {
-                margin: 10px 0;
-                font-size: 11pt;
-            }
-            .stat-term {
-                background: #fff3cd;
-                padding: 3px 6px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            .footer {
-                position: absolute;
-                bottom: 0.5in;
-                width: calc(100% - 1in);
-                text-align: center;
-                font-size: 10pt;
-                color: #666;
-                border-top: 1px solid #ccc;
-                padding-top: 10px;
-            }
-            .page-number::after {
-                content: "Page " counter(page);
-            }
-            .career-title {
-                background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-                padding: 20px;
-                border-radius: 10px;
-                margin: 20px 0;
-            }
-            .highlight-box {
-                background: #e7f3ff;
-                padding: 15px;
-                margin: 15px 0;
-                border-radius: 8px;
-                border: 1px solid #b8d4ff;
-            }
-            .resources {
-                background: #f0f7ff;
-                padding: 15px;
-                margin: 20px 0;
-                border-radius: 8px;
-                font-size: 11pt;
-            }
-            .resources h4 {
-                margin-top: 0;
-                color: #667eea;
-            }
-            .print-header {
-                text-align: center;
-                margin-bottom: 30px;
-                padding-bottom: 15px;
-                border-bottom: 2px solid #667eea;
-            }
-            .print-header small {
-                font-size: 10pt;
-                color: #666;
-            }
-            ul, ol {
-                margin-left: 25px;
-            }
-            li {
-                margin: 8px 0;
-            }
-            .teacher-credit {
-                font-style: italic;
-                color: #666;
-                text-align: center;
-                margin-top: 10px;
-                padding-top: 10px;
-                border-top: 1px solid #ccc;
-                font-size: 11pt;
-            }
-        }
-    </style>
-</head>
-<body>
+def format_sizes(sizes):
+    """'12.3 KB (4.5 KB gzip)' for an export_sizes() result"""
+    compressed = ", ".join(f"{size / 1024:.1f} KB {encoding}" for encoding, size in sizes.items() if encoding != "raw")
+    return f"{sizes['raw'] / 1024:.1f} KB ({compressed})"
 
-<div class="print-header">
-    <h1>AP Statistics Career Presentation</h1>
-    <p><strong>AP Statistics: The Data Skills Every Career Demands</strong></p>
-    <small>Generated on ''' + today + ''' | All content expanded for printing</small>
-    <div class="teacher-credit">
-        Compiled by Dr. Roland Lucas<br>
-        AP Statistics Teacher at Newark Tech
-    </div>
-</div>'''
-    
-    # Add ALL slides to the printable version
-    for i, slide in enumerate(slides):
-        presentation_html += '<div class="slide">\n'
-        
-        if slide["type"] == "title":
-            presentation_html += f'''
-            <h1>{slide["title"]}</h1>
-            <h2 style="text-align: center; color: #764ba2;">{slide["subtitle"]}</h2>
-            <div style="text-align: center; margin-top: 100px; font-size: 16pt;">
-                {slide["content"]}
-            </div>
-            <div class="teacher-credit">
-                AP Statistics: The Data Skills Every Career Demands<br>
-                Dr. Roland Lucas, AP Statistics Teacher at Newark Tech
-            </div>
-            '''
-            
-        elif slide["type"] == "intro":
-            presentation_html += f'''
-            <h1>{slide["title"]}</h1>
-            
-            <div class="highlight-box">
-                <h2>College & Career Benefits</h2>
-                <ul class="benefit-list">
-            '''
-            for benefit in slide["content"]["benefits"]:
-                presentation_html += f'<li>{benefit}</li>\n'
-            presentation_html += '''
-                </ul>
-            </div>
-            
-            <div class="highlight-box">
-                <h2>Real-World Applications</h2>
-                <p>''' + slide["content"]["applications"] + '''</p>
-            </div>
-            
-            <div class="resources">
-                <h4>📚 General Resources for AP Statistics:</h4>
-                <ul>
-                    <li><strong>YouTube Search:</strong> "Introduction to Statistics" or "AP Statistics course"</li>
-                    <li><strong>Khan Academy AP Statistics:</strong> Free video lessons and practice problems</li>
-                    <li><strong>College Board AP Statistics:</strong> Official course information and resources</li>
-                    <li><strong>American Statistical Association:</strong> Career information and case studies</li>
-                </ul>
-            </div>
-            '''
-            
-        elif slide["type"] == "career":
-            career_name = slide["title"].replace("🏥 ", "").replace("📈 ", "").replace("⚕️ ", "").replace("💉 ", "").replace("🔒 ", "").replace("🧪 ", "").replace("🩺 ", "").replace("⚡ ", "").replace("🏗️ ", "").replace("👶 ", "").replace("💻 ", "").replace("🔬 ", "")
-            
-            presentation_html += f'''
-            <h1>{slide["title"]}</h1>
-            
-            <div class="career-title">
-                <h2>{slide["content"]["description"]}</h2>
-            </div>
-            '''
-            
-            for example in slide["content"]["examples"]:
-                content_with_terms = example["content"].replace(
-                    "<span class='highlight'>", "<span class='stat-term'>"
-                ).replace("</span>", "</span>")
-                
-                presentation_html += f'''
-                <div class="example">
-                    <h3>{example["title"]}</h3>
-                    <p>{content_with_terms}</p>
-                </div>
-                '''
-            
-            # Add case studies to printable version
-            if career_name in CAREER_CASE_STUDIES and CAREER_CASE_STUDIES[career_name]:
-                presentation_html += f'''
-                <div class="resources">
-                    <h4>📄 Case Studies in {career_name}:</h4>
-                    <ul>
-                '''
-                
-                for study in CAREER_CASE_STUDIES[career_name]:
-                    presentation_html += f'<li><a href="{study["url"]}">{study["title"]}</a>: {study["description"]}</li>\n'
-                
-                presentation_html += '''
-                    </ul>
-                </div>
-                '''
-            
-            # Add YouTube search tips
-            presentation_html += f'''
-            <div class="resources">
-                <h4>📺 Find Videos About {career_name}:</h4>
-                <p><strong>Search YouTube for:</strong></p>
-                <ul>
-            '''
-            
-            keywords = YOUTUBE_SEARCH_KEYWORDS.get(career_name, [f"statistics in {career_name}"])
-            for keyword in keywords[:3]:  # Show top 3 keywords
-                presentation_html += f'<li>"{keyword}"</li>\n'
-            
-            presentation_html += '''
-                </ul>
-                <p><strong>Guaranteed working videos:</strong></p>
-                <ul>
-            '''
-            
-            for key, video in GUARANTEED_VIDEOS.items():
-                presentation_html += f'<li><a href="{video["url"]}">{video["title"]}</a></li>\n'
-            
-            presentation_html += '''
-                </ul>
-            </div>
-            '''
-            
-        elif slide["type"] == "closing":
-            presentation_html += f'''
-            <h1>{slide["title"]}</h1>
-            
-            <div style="text-align: center; margin: 50px 0;">
-            '''
-            for point in slide["content"]["points"]:
-                presentation_html += f'<p style="font-size: 14pt; margin: 15px 0;">{point}</p>\n'
-            presentation_html += f'''
-            </div>
-            
-            <div class="highlight-box" style="text-align: center; padding: 30px;">
-                <p style="font-size: 16pt; font-weight: bold;">{slide["content"]["call_to_action"]}</p>
-            </div>
-            
-            <div style="text-align: center; margin-top: 50px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
-                <h3>Next Steps</h3>
-                <p style="font-size: 12pt;">{slide["content"]["contact"]}</p>
-                <p style="margin-top: 15px; font-size: 11pt;">
-                    <strong>Video Resources:</strong><br>
-                    • Search YouTube: "AP Statistics introduction"<br>
-                    • Khan Academy: Free AP Statistics course<br>
-                    • College Board: Official AP Statistics resources
-                </p>
-            </div>
-            
-            <div class="teacher-credit">
-                <strong>AP Statistics: The Data Skills Every Career Demands</strong><br>
-                Compiled by Dr. Roland Lucas, AP Statistics Teacher at Newark Tech
-            </div>
-            '''
-        
-        presentation_html += f'''
-        <div class="footer">
-            <div class="page-number"></div>
-            <div>Slide {i+1} of {len(slides)} | AP Statistics Career Presentation</div>
-        </div>
-        </div>
-        '''
-    
-    presentation_html += '''
-    </body>
-    </html>
-    '''
-    
-    return presentation_html
+# Printable views: which session flag shows them and how they are presented
+PRINTABLE_VIEWS = {
+    "presentation": {
+        "state": "show_printable",
+        "heading": "## 📄 Complete Printable Presentation",
+        "instructions": "**Instructions:** Use your browser's Print function (Ctrl+P) and select 'Save as PDF' for best results.",
+        "file_stem": "ap_statistics_presentation",
+    },
+    "flyer": {
+        "state": "show_flyer",
+        "heading": "## 📄 2-Page Printable Flyer",
+        "instructions": "**Instructions:** Print double-sided or save as PDF. Perfect for handing out!",
+        "file_stem": "ap_statistics_flyer",
+    },
+}
 
-def main():
-    # Initialize session state
-    if 'current_slide' not in st.session_state:
-        st.session_state.current_slide = 0
-    if 'show_printable' not in st.session_state:
-        st.session_state.show_printable = False
-    if 'show_flyer' not in st.session_state:
-        st.session_state.show_flyer = False
-    
-    # Sidebar navigation
-    with st.sidebar:
-        st.title("📊 Navigation")
-        
-        # Slide selector
-        selected_slide = st.selectbox(
-            "Go to Slide:",
-            [f"Slide {i+1}: {slides[i]['title'][:30]}..." for i in range(len(slides))],
-            index=st.session_state.current_slide
+@st.fragment
+@spans.timed()
+def printable_viewer(name):
+    """Download buttons and preview for a printable document; downloads rerun only this fragment"""
+    view = PRINTABLE_VIEWS[name]
+    st.markdown(view["heading"])
+    st.info(view["instructions"])
+    
+    html_data, html_url = get_printable_export(name)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 Download HTML for Printing",
+            data=html_data,
+            file_name=f"{view['file_stem']}.html",
+            mime="text/html"
         )
-        
-        # Update current slide based on selection
-        st.session_state.current_slide = int(selected_slide.split(":")[0].replace("Slide ", "")) - 1
-        
-        # Navigation buttons
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("⬅️ Previous", disabled=st.session_state.current_slide == 0):
-                st.session_state.current_slide = max(0, st.session_state.current_slide - 1)
-                st.rerun()
-        
-        with col2:
-            if st.button("Next ➡️", disabled=st.session_state.current_slide == len(slides)-1):
-                st.session_state.current_slide = min(len(slides)-1, st.session_state.current_slide + 1)
-                st.rerun()
-        
-        # Progress indicator
-        st.progress((st.session_state.current_slide + 1) / len(slides))
-        st.caption(f"Slide {st.session_state.current_slide + 1} of {len(slides)}")
-        
-        # YOUTUBE SEARCH SECTION
-        st.markdown("---")
-        st.subheader("🔍 Quick YouTube Search")
-        
-        # Show search keywords for current slide
-        slide = slides[st.session_state.current_slide]
-        if slide["type"] in ["intro", "career"]:
-            if slide["type"] == "intro":
-                career_name = "statistics"
-            else:
-                career_name = slide["title"].replace("🏥 ", "").replace("📈 ", "").replace("⚕️ ", "").replace("💉 ", "").replace("🔒 ", "").replace("🧪 ", "").replace("🩺 ", "").replace("⚡ ", "").replace("🏗️ ", "").replace("👶 ", "").replace("💻 ", "").replace("🔬 ", "")
-            
-            keywords = YOUTUBE_SEARCH_KEYWORDS.get(career_name, ["statistics"])
-            
-            # Show top 3 keywords as clickable links
-            st.markdown("**Click to search YouTube:**")
-            for idx, keyword in enumerate(keywords[:3]):
-                search_url = create_youtube_search_url(keyword)
-                st.markdown(f"[🔎 {keyword}]({search_url})")
-        
-        # CASE STUDY LINKS IN SIDEBAR
-        st.markdown("---")
-        st.subheader("📄 Case Studies")
-        
-        if slide["type"] == "career":
-            career_name = slide["title"].replace("🏥 ", "").replace("📈 ", "").replace("⚕️ ", "").replace("💉 ", "").replace("🔒 ", "").replace("🧪 ", "").replace("🩺 ", "").replace("⚡ ", "").replace("🏗️ ", "").replace("👶 ", "").replace("💻 ", "").replace("🔬 ", "")
-            
-            if career_name in CAREER_CASE_STUDIES and CAREER_CASE_STUDIES[career_name]:
-                for study in CAREER_CASE_STUDIES[career_name][:2]:  # Show 2 in sidebar
-                    st.markdown(f"[📖 {study['title'][:40]}...]({study['url']})")
-        
-        # GUARANTEED WORKING VIDEOS
-        st.markdown("---")
-        st.subheader("✅ Always Works")
-        
-        for key, video in GUARANTEED_VIDEOS.items():
-            st.markdown(f"[▶️ {video['title']}]({video['url']})")
-        
-        # PRINT/SAVE BUTTONS
-        st.markdown("---")
-        st.subheader("🖨️ Print & Save")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("📄 Print Flyer", use_container_width=True):
-                st.session_state.show_flyer = True
-                st.session_state.show_printable = False
-                st.rerun()
-        
-        with col2:
-            if st.button("📊 Full Presentation", use_container_width=True):
-                st.session_state.show_printable = True
-                st.session_state.show_flyer = False
-                st.rerun()
-        
-        # Download section
-        st.markdown("---")
-        st.subheader("Download Instructions")
-        
-        instructions = create_instructions_file()
+    with col2:
+        pdf_data, _ = get_printable_export(name, "pdf")
         st.download_button(
-            label="📥 Download PowerPoint Instructions",
-            data=instructions,
-            file_name="PowerPoint_Conversion_Instructions.txt",
-            mime="text/plain"
+            label="📥 Download PDF",
+            data=pdf_data,
+            file_name=f"{view['file_stem']}.pdf",
+            mime="application/pdf"
         )
     
-    # Main content area - Show printable versions if requested
-    if st.session_state.show_printable:
-        st.markdown("## 📄 Complete Printable Presentation")
-        st.info("**Instructions:** Use your browser's Print function (Ctrl+P) and select 'Save as PDF' for best results.")
-        
-        presentation_html = create_complete_presentation_html()
-        b64 = base64.b64encode(presentation_html.encode()).decode()
-        href = f'<a href="data:text/html;base64,{b64}" download="ap_statistics_presentation.html" style="background:#667eea;color:white;padding:10px 20px;border-radius:5px;text-decoration:none;">📥 Download HTML for Printing</a>'
-        st.markdown(href, unsafe_allow_html=True)
-        
-        # Display the HTML
-        st.components.v1.html(presentation_html, height=800, scrolling=True)
-        
-        if st.button("← Back to Interactive Presentation"):
-            st.session_state.show_printable = False
-            st.rerun()
-        
-        return
-    
-    if st.session_state.show_flyer:
-        st.markdown("## 📄 2-Page Printable Flyer")
-        st.info("**Instructions:** Print double-sided or save as PDF. Perfect for handing out!")
-        
-        flyer_html = create_flyer_html()
-        b64 = base64.b64encode(flyer_html.encode()).decode()
-        href = f'<a href="data:text/html;base64,{b64}" download="ap_statistics_flyer.html" style="background:#667eea;color:white;padding:10px 20px;border-radius:5px;text-decoration:none;">📥 Download HTML for Printing</a>'
-        st.markdown(href, unsafe_allow_html=True)
-        
-        # Display the HTML
-        st.components.v1.html(flyer_html, height=800, scrolling=True)
-        
-        if st.button("← Back to Interactive Presentation"):
-            st.session_state.show_flyer = False
-            st.rerun()
-        
-        return
+    st.caption(f"HTML {format_sizes(get_export_sizes(name))} · PDF {format_sizes(get_export_sizes(name, 'pdf'))}")
     
-    # TEACHER BANNER WITH NEW HEADER AND LARGER FONT
-    st.markdown("""
-    <div class="teacher-banner">
-        <h3>AP Statistics: The Data Skills Every Career Demands</h3>
-        <p>Compiled by Dr. Roland Lucas</p>
-        <p>AP Statistics Teacher at Newark Tech</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # PRINT/SAVE BUTTONS IN MAIN AREA
-    st.markdown("### 🖨️ Printable Materials")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("📄 Print 2-Page Flyer", use_container_width=True, type="primary"):
-            st.session_state.show_flyer = True
-            st.rerun()
-        st.caption("Perfect for handing out to students")
-    
-    with col2:
-        if st.button("📊 Save Full Presentation", use_container_width=True, type="secondary"):
-            st.session_state.show_printable = True
-            st.rerun()
-        st.caption("Complete 15-slide presentation for printing")
+    # Display the HTML from the static export instead of inlining it; the path must be
+    # root-relative, as st.iframe renders any other non-URL string as inline HTML
+    st.iframe("/" + html_url, height=800)
+
+# Content sections the slide fragments are built from
+DECK_SECTIONS = ("slides", "career_case_studies", "youtube_search_keywords", "nj_college_schedules", "guaranteed_videos")
+
+def get_deck_fragments():
+    """Return (fragments, titles) for every slide of the tenant's deck from its render cache"""
+    key = content_key("deck.fragments", content.version(*DECK_SECTIONS))
     
-    st.markdown("---")
+    def render_fragments():
+        fragments = [slide_fragment_html(record, content) for record in SLIDE_REGISTRY]
+        titles = [record.title for record in SLIDE_REGISTRY]
+        return fragments, titles
     
-    # Display current slide
-    slide = slides[st.session_state.current_slide]
+    return tenant.cache.get_or_render(key, render_fragments, tags=DECK_SECTIONS)
+
+def slide_parts_job(index):
+    """(key, render, tags) for the cached HTML pieces of one slide
+
+    The pieces do not depend on branding or on where the slide sits in a
+    tenant's deck, so the key names the slide (its career, or its type)
+    and every tenant shares the entry in the process-wide cache.
+    """
+    record = SLIDE_REGISTRY[index]
+    key = content_key(
+        f"slide-{record.career or record.type}.parts",
+        shared_content.version(*DECK_SECTIONS),
+        sorted(DEAD_LINKS),
+        LINK_PREVIEWS,
+    )
+    return key, lambda: slide_parts(record, content, DEAD_LINKS, LINK_PREVIEWS), DECK_SECTIONS
+
+def get_slide_parts(index):
+    """Return one slide's HTML pieces and warm its neighbours in the background"""
+    key, render, tags = slide_parts_job(index)
+    parts = slide_prefetcher.get(key, render, tags=tags)
+    slide_prefetcher.prefetch(
+        slide_parts_job(neighbour) for neighbour in (index - 1, index + 1) if 0 <= neighbour < len(SLIDE_REGISTRY)
+    )
+    return parts
+
+def metrics_gauges():
+    """Render cache and prefetch counters exported next to the span histograms"""
+    cache = render_cache.stats()
+    tenant_cache = tenant_cache_stats()
+    prefetch = slide_prefetcher.stats()
+    return {
+        "render_cache_entries": cache["entries"],
+        "render_cache_hits_total": cache["hits"],
+        "render_cache_misses_total": cache["misses"],
+        "render_cache_evictions_total": cache["evictions"],
+        "tenant_render_cache_entries": tenant_cache["entries"],
+        "tenant_render_cache_hits_total": tenant_cache["hits"],
+        "tenant_render_cache_misses_total": tenant_cache["misses"],
+        "tenant_render_cache_evictions_total": tenant_cache["evictions"],
+        "slide_prefetch_hit_ratio": prefetch["hit_rate"],
+        "slide_prefetch_warmed_total": prefetch["warmed"],
+        "slide_prefetch_warm_seconds_total": prefetch["warm_ms_total"] / 1000,
+    }
+
+def show_debug_panel():
+    """Timings of this session's last reruns, shown in the sidebar with ?debug=1"""
+    history = st.session_state.get("rerun_history", [])
+    if not history:
+        return
+    with st.expander(f"🛠️ Last {len(history)} reruns (ms)"):
+        header = "| time | total | deltas | " + " | ".join(DEBUG_SPANS) + " |"
+        rows = [header, "|" + " --- |" * (len(DEBUG_SPANS) + 3)]
+        for trace in reversed(history):
+            cells = [f"{trace['spans'][name]:.1f}" if name in trace["spans"] else "" for name in DEBUG_SPANS]
+            rows.append(f"| {trace['at']} | {trace['total_ms']:.1f} | {trace['deltas'] or ''} | " + " | ".join(cells) + " |")
+        st.markdown("\n".join(rows))
+
+# Topic of the YouTube search box on each kind of slide (career slides use the career)
+SEARCH_TOPICS = {"title": "statistics", "intro": "AP Statistics", "closing": None}
+
+def search_topic(record):
+    """Name of the slide's search box topic, or None when it has no search box"""
+    return SEARCH_TOPICS.get(record.type, record.career)
+
+# Navigation callbacks: Streamlit runs these before the script, so each click
+# or selection costs exactly one rerun and no widget has to call st.rerun()
+def step_slide(delta):
+    """Move delta slides forward or back, staying inside the deck"""
+    st.session_state.current_slide = min(max(st.session_state.current_slide + delta, 0), len(slides) - 1)
+
+def show_view(view):
+    """Switch between the slides (None), the printable flyer and the full presentation"""
+    st.session_state.show_flyer = view == "flyer"
+    st.session_state.show_printable = view == "presentation"
+
+def sync_presenter_slide():
+    """Pick up where the client-side deck left off"""
+    value = st.session_state.slide_deck
+    if not value:
+        return
+    st.session_state.current_slide = min(max(int(value["slide"]), 0), len(slides) - 1)
+    if value.get("exit"):
+        st.session_state.presenter_mode = False
+
+@st.fragment
+@spans.timed()
+def slide_body(index):
+    """Render one slide; widgets inside it rerun only the slide, not the whole page"""
+    record = SLIDE_REGISTRY[index]
+    slide = record.slide
+    parts = get_slide_parts(record.index)
     
     if slide["type"] == "title":
         st.markdown(f"<h1 class='main-header'>{slide['title']}</h1>", unsafe_allow_html=True)
@@ -1807,7 +374,7 @@ def main():
         st.markdown(f"<h3 style='text-align: center; color: #667eea; margin-top: 2rem;'>{slide['content']}</h3>", unsafe_allow_html=True)
         
         # YouTube search section
-        display_youtube_search("statistics", YOUTUBE_SEARCH_KEYWORDS["general"])
+        display_youtube_search(search_topic(record), parts)
         
         # Add decorative gradient background
         st.markdown("""
@@ -1832,7 +399,7 @@ def main():
         st.markdown("</div>", unsafe_allow_html=True)
         
         # YouTube search section
-        display_youtube_search("AP Statistics", YOUTUBE_SEARCH_KEYWORDS["general"])
+        display_youtube_search(search_topic(record), parts)
         
         # Display resources
         st.markdown("---")
@@ -1858,49 +425,18 @@ def main():
                 st.markdown(f"[🔍 {keyword}]({search_url})")
     
     elif slide["type"] == "career":
-        career_name = slide["title"].replace("🏥 ", "").replace("📈 ", "").replace("⚕️ ", "").replace("💉 ", "").replace("🔒 ", "").replace("🧪 ", "").replace("🩺 ", "").replace("⚡ ", "").replace("🏗️ ", "").replace("👶 ", "").replace("💻 ", "").replace("🔬 ", "")
-        
         st.markdown(f"<h1 class='main-header'>{slide['title']}</h1>", unsafe_allow_html=True)
         
-        with st.container():
-            st.markdown("<div class='slide-card'>", unsafe_allow_html=True)
-            st.markdown(f"<h2 class='career-title'>{slide['content']['description']}</h2>", unsafe_allow_html=True)
-            
-            for example in slide["content"]["examples"]:
-                with st.container():
-                    st.markdown("<div class='example-box'>", unsafe_allow_html=True)
-                    st.markdown(f"**{example['title']}**")
-                    st.markdown(example["content"], unsafe_allow_html=True)
-                    st.markdown("</div>", unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
+        # Slide card with the worked examples, rendered once per content version
+        st.markdown(parts["card"], unsafe_allow_html=True)
         
         # Display YouTube search for this career (now includes case studies first)
-        display_career_resources(slide["content"]["resources"], career_name)
+        display_career_resources(record, parts)
         
         # Add College Schedule Section
-        if career_name in NJ_COLLEGE_SCHEDULES:
-            with st.expander("🎓 Sample College Schedule at a New Jersey State School", expanded=False):
-                schedule_data = NJ_COLLEGE_SCHEDULES[career_name]
-                
-                st.markdown(f"""
-                <div class='schedule-box'>
-                    <h3>🏫 {schedule_data['school']}</h3>
-                    <p><strong>Major:</strong> {schedule_data['major']}</p>
-                    <p><strong>Note:</strong> {schedule_data['stats_note']}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.markdown("### 📅 4-Year Course Schedule")
-                
-                for year, courses in schedule_data['schedule'].items():
-                    st.markdown(f"<div class='schedule-year'><strong>{year}:</strong>", unsafe_allow_html=True)
-                    for course in courses:
-                        if "Statistics" in course or "(AP Credit Accepted!)" in course:
-                            st.markdown(f"✅ **{course}**")
-                        else:
-                            st.markdown(f"• {course}")
-                    st.markdown("</div>", unsafe_allow_html=True)
+        if parts["schedule"]:
+            with spans.span("schedule_expander"), st.expander("🎓 Sample College Schedule at a New Jersey State School", expanded=False):
+                st.markdown(parts["schedule"], unsafe_allow_html=True)
     
     elif slide["type"] == "closing":
         st.markdown(f"<h1 class='main-header'>{slide['title']}</h1>", unsafe_allow_html=True)
@@ -1913,7 +449,7 @@ def main():
         
         with col1:
             st.markdown("**Healthcare Fields:**")
-            for career in ["NICU Nurse", "Pediatric Surgeon", "Registered Nurse", "Dermatology Physician Assistant", "Pediatrician"]:
+            for career in HEALTHCARE_CAREERS:
                 keywords = YOUTUBE_SEARCH_KEYWORDS.get(career, [f"statistics in {career}"])
                 if keywords:
                     search_url = create_youtube_search_url(keywords[0])
@@ -1921,7 +457,7 @@ def main():
         
         with col2:
             st.markdown("**Technology & Engineering:**")
-            for career in ["Cybersecurity Professional", "Software Developer", "Electrical Engineer", "Civil Engineer", "Physicist / Nanotechnologist"]:
+            for career in TECH_CAREERS:
                 keywords = YOUTUBE_SEARCH_KEYWORDS.get(career, [f"statistics in {career}"])
                 if keywords:
                     search_url = create_youtube_search_url(keywords[0])
@@ -1961,13 +497,199 @@ def main():
         </div>
         </div>
         """, unsafe_allow_html=True)
+
+@st.fragment
+def powerpoint_download():
+    """Sidebar download of the deck as a PowerPoint file; clicking reruns only this fragment"""
+    st.subheader("Download PowerPoint")
+    
+    pptx_data, _ = get_printable_export("presentation", "pptx")
+    st.download_button(
+        label="📥 Download PowerPoint (.pptx)",
+        data=pptx_data,
+        file_name="ap_statistics_presentation.pptx",
+        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+    )
+    st.caption("Every slide is editable in PowerPoint, Keynote or Google Slides.")
+
+def main():
+    # Initialize session state
+    if 'current_slide' not in st.session_state:
+        st.session_state.current_slide = 0
+    if 'show_printable' not in st.session_state:
+        st.session_state.show_printable = False
+    if 'show_flyer' not in st.session_state:
+        st.session_state.show_flyer = False
+    if 'presenter_mode' not in st.session_state:
+        st.session_state.presenter_mode = False
+    
+    # Sidebar navigation
+    with st.sidebar, spans.span("sidebar"):
+        st.title("📊 Navigation")
+        
+        # Slide selector: the options are slide indexes and the widget owns current_slide
+        if st.session_state.current_slide >= len(slides):
+            st.session_state.current_slide = len(slides) - 1
+        st.selectbox(
+            "Go to Slide:",
+            range(len(slides)),
+            format_func=lambda i: f"Slide {i+1}: {slides[i]['title'][:30]}...",
+            key="current_slide",
+        )
+        
+        # Navigation buttons
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("⬅️ Previous", disabled=st.session_state.current_slide == 0,
+                      on_click=step_slide, args=(-1,))
+        
+        with col2:
+            st.button("Next ➡️", disabled=st.session_state.current_slide == len(slides)-1,
+                      on_click=step_slide, args=(1,))
+        
+        # Presenter mode switches slides in the browser without rerunning the app
+        st.toggle("🎬 Presenter mode", key="presenter_mode",
+                  help="Switch slides with the arrow keys without waiting for the server")
+        
+        # Progress indicator
+        st.progress((st.session_state.current_slide + 1) / len(slides))
+        st.caption(f"Slide {st.session_state.current_slide + 1} of {len(slides)}")
+        
+        # Add ?debug=1 to the URL to see what the previous rerun sent
+        if st.query_params.get("debug") and "last_rerun_deltas" in st.session_state:
+            stats = st.session_state.last_rerun_deltas
+            st.caption(f"🛠️ Last rerun: {stats['deltas']} deltas, {stats['bytes']:,} bytes")
+            prefetch = slide_prefetcher.stats()
+            st.caption(
+                f"🛠️ Slide cache: {prefetch['hit_rate']:.0%} hits ({prefetch['hits']}/{prefetch['hits'] + prefetch['misses']}), "
+                f"{prefetch['warmed']} warmed, {prefetch['warm_ms_avg']:.1f} ms avg warm-up"
+            )
+            cache = tenant.cache.stats()
+            st.caption(
+                f"🛠️ Tenant {tenant.name}: {cache['entries']}/{cache['max_entries']} cached, "
+                f"{cache['hit_rate']:.0%} hits, {cache['evictions']} evicted"
+            )
+            sizes = state_size(st.session_state)
+            st.caption(f"🛠️ Session state: {len(sizes)} keys, {sum(sizes.values()):,} bytes")
+            show_debug_panel()
+        
+        # YOUTUBE SEARCH SECTION
+        st.markdown("---")
+        st.subheader("🔍 Quick YouTube Search")
+        
+        # Show search keywords for current slide
+        record = SLIDE_REGISTRY[st.session_state.current_slide]
+        if record.type in ["intro", "career"]:
+            # Show top 3 keywords as clickable links
+            links = [f"[🔎 {keyword}]({create_youtube_search_url(keyword)})" for keyword in (record.keywords or ("statistics",))[:3]]
+            st.markdown("**Click to search YouTube:**  \n" + "  \n".join(links))
+        
+        # CASE STUDY LINKS IN SIDEBAR
+        st.markdown("---")
+        st.subheader("📄 Case Studies")
+        
+        if record.type == "career" and record.case_studies:
+            # Show 2 in sidebar
+            st.markdown("  \n".join(
+                f"[{link_label(study['url'], '📖 ' + study['title'][:40] + '...')}]({study['url']})"
+                for study in record.case_studies[:2]
+            ))
+        
+        # GUARANTEED WORKING VIDEOS
+        st.markdown("---")
+        st.subheader("✅ Always Works")
+        
+        st.markdown("  \n".join(
+            f"[{link_label(video['url'], '▶️ ' + video['title'])}]({video['url']})" for video in GUARANTEED_VIDEOS.values()
+        ))
+        
+        # PRINT/SAVE BUTTONS
+        st.markdown("---")
+        st.subheader("🖨️ Print & Save")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("📄 Print Flyer", use_container_width=True, on_click=show_view, args=("flyer",))
+        
+        with col2:
+            st.button("📊 Full Presentation", use_container_width=True, on_click=show_view, args=("presentation",))
+        
+        # Download section
+        st.markdown("---")
+        powerpoint_download()
+    
+    # Main content area - Show printable versions if requested
+    for view in ("presentation", "flyer"):
+        if st.session_state[PRINTABLE_VIEWS[view]["state"]]:
+            printable_viewer(view)
+            st.button("← Back to Interactive Presentation", on_click=show_view, args=(None,))
+            return
+    
+    if st.session_state.presenter_mode:
+        with spans.span("presenter_deck"):
+            fragments, titles = get_deck_fragments()
+            slide_deck(
+                fragments,
+                titles,
+                st.session_state.current_slide,
+                publish_stylesheet(STATIC_DIR, "app", "site"),
+                key="slide_deck",
+                on_change=sync_presenter_slide,
+            )
+        return
+    
+    # TEACHER BANNER WITH NEW HEADER AND LARGER FONT
+    st.markdown(f"""
+    <div class="teacher-banner">
+        <h3>{escape(branding.headline)}</h3>
+        <p>{escape(branding.compiled_by)}</p>
+        <p>{escape(branding.position)}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # PRINT/SAVE BUTTONS IN MAIN AREA
+    st.markdown("### 🖨️ Printable Materials")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.button("📄 Print 2-Page Flyer", use_container_width=True, type="primary",
+                  on_click=show_view, args=("flyer",))
+        st.caption("Perfect for handing out to students")
     
-    # Footer with teacher credit
-    st.markdown("---")
-    col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.caption("💡 **Tip:** Click any search link to open YouTube in a new tab")
-        st.caption("🎓 **AP Statistics: The Data Skills Every Career Demands** - Dr. Roland Lucas, Newark Tech")
+        st.button("📊 Save Full Presentation", use_container_width=True, type="secondary",
+                  on_click=show_view, args=("presentation",))
+        st.caption(f"Complete {len(slides)}-slide presentation for printing")
+    
+    st.markdown("---")
+    
+    # Display current slide
+    slide_body(st.session_state.current_slide)
+    
+    # Footer with teacher credit
+    with spans.span("footer"):
+        st.markdown("---")
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.caption("💡 **Tip:** Click any search link to open YouTube in a new tab")
+            st.caption(f"🎓 **{branding.headline}** - {branding.short_credit}")
 
 if __name__ == "__main__":
     main()
+    
+    # Fold the search boxes of slides no longer on screen into the session's saved searches
+    on_slides = not (st.session_state.show_flyer or st.session_state.show_printable or st.session_state.presenter_mode)
+    active_topic = search_topic(SLIDE_REGISTRY[st.session_state.current_slide]) if on_slides else None
+    compact_search_state(st.session_state, active_topic)
+    
+    if delta_counter is not None:
+        st.session_state.last_rerun_deltas = delta_counter.snapshot()
+    
+    # Keep this rerun's timings for the debug panel and refresh the metrics file
+    trace = spans.end_rerun()
+    if trace is not None:
+        trace["at"] = datetime.now().strftime("%H:%M:%S")
+        trace["deltas"] = delta_counter.deltas if delta_counter is not None else None
+        st.session_state.rerun_history = (st.session_state.get("rerun_history", []) + [trace])[-RERUN_HISTORY:]
+    if METRICS_FILE:
+        spans.export(METRICS_FILE, metrics_gauges(), interval=METRICS_WRITE_INTERVAL)
@@ -0,0 +1 @@
+"""Shared, Streamlit-free building blocks for the AP Statistics presentation app"""
@@ -0,0 +1,5 @@
+import sys
+
+from apstat.cli import main
+
+sys.exit(main())
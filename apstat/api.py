@@ -0,0 +1,295 @@
+"""Read-only JSON API for the deck content, served without Streamlit
+
+A plain ASGI application (no framework) exposing the normalized content and
+the rendered slide fragments to other sites, such as the school LMS:
+
+    GET /api/v1/                      content version, section sizes, endpoints
+    GET /api/v1/slides                slide summaries (paginated)
+    GET /api/v1/slides/<n>            one slide with its career resources
+    GET /api/v1/slides/<n>/fragment   the slide rendered as an HTML fragment
+    GET /api/v1/case-studies          case studies per career (paginated)
+    GET /api/v1/keywords              YouTube search keywords per topic (paginated)
+    GET /api/v1/schedules             NJ college schedules per career (paginated)
+    GET /api/v1/videos                guaranteed videos (paginated)
+
+Paginated endpoints take ?offset=&limit= (at most MAX_LIMIT) and return
+{"items", "total", "offset", "limit", "next"}. Each response body is built
+once per content version and kept in response_cache together with its
+gzipped form and ETag, so a request is a cache lookup: If-None-Match gets
+a 304 and clients that accept gzip get the precompressed body. Entries are
+tagged with the content sections they come from and dropped when those
+change.
+
+Run it next to the app with ``python -m apstat serve-api`` (uvicorn).
+"""
+import gzip
+import hashlib
+import json
+import urllib.parse
+
+from apstat.cache import RenderCache, content_key
+from apstat.content import SECTIONS, get_content
+from apstat.fragments import slide_fragment_html
+
+API_PREFIX = "/api/v1"
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+# Smaller bodies are not worth compressing
+GZIP_MIN_BYTES = 512
+CACHE_CONTROL = "public, max-age=60"
+
+response_cache = RenderCache(max_entries=512)
+
+SLIDE_SECTIONS = ("slides", "career_case_studies", "youtube_search_keywords", "nj_college_schedules")
+FRAGMENT_SECTIONS = SLIDE_SECTIONS + ("guaranteed_videos",)
+
+
+class APIError(Exception):
+    """A request the API refuses; carries the HTTP status"""
+
+    def __init__(self, status, message, headers=()):
+        super().__init__(message)
+        self.status = status
+        self.headers = list(headers)
+
+
+class Response:
+    """An encoded JSON body with its gzipped form, ETag and ready-made headers"""
+
+    __slots__ = ("status", "body", "gzipped", "etag", "headers", "gzip_headers")
+
+    def __init__(self, payload, status=200, cache=True):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:20]}"'.encode() if cache else None
+        self.gzipped = gzip.compress(self.body, mtime=0) if len(self.body) >= GZIP_MIN_BYTES else None
+
+        common = [
+            (b"content-type", b"application/json; charset=utf-8"),
+            (b"vary", b"accept-encoding"),
+            (b"access-control-allow-origin", b"*"),
+        ]
+        if cache:
+            common += [(b"etag", self.etag), (b"cache-control", CACHE_CONTROL.encode())]
+        else:
+            common.append((b"cache-control", b"no-store"))
+        self.headers = common + [(b"content-length", str(len(self.body)).encode())]
+        self.gzip_headers = None
+        if self.gzipped is not None:
+            self.gzip_headers = common + [
+                (b"content-encoding", b"gzip"),
+                (b"content-length", str(len(self.gzipped)).encode()),
+            ]
+
+
+# Payload builders
+
+def _page(items, offset, limit, path):
+    items = list(items)
+    end = offset + limit
+    return {
+        "items": items[offset:end],
+        "total": len(items),
+        "offset": offset,
+        "limit": limit,
+        "next": f"{API_PREFIX}/{path}?offset={end}&limit={limit}" if end < len(items) else None,
+    }
+
+
+def _slide_summary(record):
+    return {
+        "index": record.index,
+        "type": record.type,
+        "title": record.title,
+        "career": record.career,
+        "url": f"{API_PREFIX}/slides/{record.index}",
+    }
+
+
+def _slide_detail(record):
+    return {
+        "index": record.index,
+        "type": record.type,
+        "title": record.title,
+        "career": record.career,
+        "slide": record.slide,
+        "case_studies": list(record.case_studies),
+        "keywords": list(record.keywords),
+        "schedule": record.schedule,
+        "fragment_url": f"{API_PREFIX}/slides/{record.index}/fragment",
+    }
+
+
+def _index_payload(content):
+    return {
+        "version": content.version(*SECTIONS),
+        "counts": {
+            "slides": len(content.registry),
+            "case_studies": sum(len(studies) for studies in content.case_studies.values()),
+            "keywords": len(content.keywords),
+            "schedules": len(content.schedules),
+            "videos": len(content.videos),
+        },
+        "endpoints": [f"{API_PREFIX}/{name}" for name in ("slides", *COLLECTIONS)],
+    }
+
+
+# Paginated collections: path -> (content sections, items for a content version)
+COLLECTIONS = {
+    "case-studies": (
+        ("career_case_studies",),
+        lambda content: ({"career": career, "case_studies": studies} for career, studies in content.case_studies.items()),
+    ),
+    "keywords": (
+        ("youtube_search_keywords",),
+        lambda content: ({"topic": topic, "keywords": keywords} for topic, keywords in content.keywords.items()),
+    ),
+    "schedules": (
+        ("nj_college_schedules",),
+        lambda content: ({"career": career, **schedule} for career, schedule in content.schedules.items()),
+    ),
+    "videos": (
+        ("guaranteed_videos",),
+        lambda content: ({"id": video_id, **video} for video_id, video in content.videos.items()),
+    ),
+}
+
+
+def _int_param(params, name, default, minimum=0, maximum=None):
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise APIError(400, f"{name} must be an integer") from None
+    if value < minimum or (maximum is not None and value > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+        raise APIError(400, f"{name} must be {bounds}")
+    return value
+
+
+def _slide(content, segment):
+    if not segment.isdigit() or int(segment) >= len(content.registry):
+        raise APIError(404, f"no slide {segment!r}")
+    return content.registry[int(segment)]
+
+
+def route(content, path, query):
+    """Resolve a request to (cache name, content sections, payload builder)
+
+    The cache name includes the parsed pagination, so junk query parameters
+    cannot fill the response cache with copies.
+    """
+    if path != API_PREFIX and not path.startswith(f"{API_PREFIX}/"):
+        raise APIError(404, "not found")
+    segments = [segment for segment in path[len(API_PREFIX):].split("/") if segment]
+    if not segments:
+        return "index", SECTIONS, lambda: _index_payload(content)
+
+    name, rest = segments[0], segments[1:]
+    if name == "slides" and len(rest) == 1:
+        record = _slide(content, rest[0])
+        return f"slides/{record.index}", SLIDE_SECTIONS, lambda: _slide_detail(record)
+    if name == "slides" and len(rest) == 2 and rest[1] == "fragment":
+        record = _slide(content, rest[0])
+        return (
+            f"slides/{record.index}/fragment",
+            FRAGMENT_SECTIONS,
+            lambda: {"index": record.index, "title": record.title, "html": slide_fragment_html(record, content)},
+        )
+    if rest or (name != "slides" and name not in COLLECTIONS):
+        raise APIError(404, "not found")
+
+    params = urllib.parse.parse_qs(query)
+    offset = _int_param(params, "offset", 0)
+    limit = _int_param(params, "limit", DEFAULT_LIMIT, minimum=1, maximum=MAX_LIMIT)
+    if name == "slides":
+        sections, items = ("slides",), lambda content: (_slide_summary(record) for record in content.registry)
+    else:
+        sections, items = COLLECTIONS[name]
+    return f"{name}?offset={offset}&limit={limit}", sections, lambda: _page(items(content), offset, limit, name)
+
+
+def get_response(path, query=""):
+    """The cached Response for a GET of path?query; raises APIError"""
+    content = get_content()
+    name, sections, build = route(content, path, query)
+    key = content_key(f"api:{name}", content.version(*sections))
+    return response_cache.get_or_render(key, lambda: Response(build()), tags=sections)
+
+
+def _header(scope, name):
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip"""
+    for coding in accept_encoding.split(","):
+        token, _, params = coding.partition(";")
+        if token.strip().lower() in ("gzip", "*"):
+            quality = params.strip().lower()
+            if not quality.startswith("q="):
+                return True
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header matches etag (weak comparison)"""
+    etag = etag.decode()
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def _send(send, status, headers, body):
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point: ``uvicorn apstat.api:app``"""
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    method = scope["method"]
+    try:
+        if method not in ("GET", "HEAD"):
+            raise APIError(405, "read-only API", headers=[(b"allow", b"GET, HEAD")])
+        response = get_response(scope["path"], scope["query_string"].decode("latin-1"))
+    except APIError as exc:
+        response = Response({"error": str(exc)}, status=exc.status, cache=False)
+        await _send(send, exc.status, response.headers + exc.headers, b"" if method == "HEAD" else response.body)
+        return
+
+    if etag_matches(_header(scope, b"if-none-match"), response.etag):
+        headers = [(name, value) for name, value in response.headers if name in (b"etag", b"cache-control", b"vary")]
+        await _send(send, 304, headers, b"")
+        return
+
+    if response.gzipped is not None and accepts_gzip(_header(scope, b"accept-encoding")):
+        headers, body = response.gzip_headers, response.gzipped
+    else:
+        headers, body = response.headers, response.body
+    await _send(send, response.status, headers, b"" if method == "HEAD" else body)
@@ -0,0 +1,180 @@
+"""Batch export of many branded decks into one ZIP archive
+
+A batch is a JSON list of deck configurations, one per teacher and school:
+
+    [{"name": "newark-tech", "teacher": "Dr. Roland Lucas", "school": "Newark Tech",
+      "role": "AP Statistics Teacher", "headline": "...", "date": "September 2, 2026",
+      "documents": ["presentation", "flyer"], "formats": ["html", "pdf"],
+      "content": "path/to/content.json"}, ...]
+
+Only "name" is required; the rest default to the original deck. Each
+(deck, document, format) is a job rendered in a worker process. At most
+IN_FLIGHT_PER_WORKER jobs per worker are queued or finished-but-unwritten at
+once, and every finished file goes straight into the archive, so memory is
+bounded by the window rather than the size of the batch. The archive ends
+with report.json recording each job's file, size, render time, worker pid
+and error (with the traceback), and is moved into place only once complete.
+"""
+import json
+import os
+import re
+import tempfile
+import time
+import traceback
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from itertools import islice
+
+from apstat.branding import Branding
+from apstat.cli import DOCUMENTS, FILE_NAMES, FORMATS, render_document
+from apstat.content import CONTENT_PATH, load_content
+from apstat.pptx import MEMBER_DATE_TIME
+
+DEFAULT_FORMATS = ("html", "pdf")
+IN_FLIGHT_PER_WORKER = 2
+REPORT_NAME = "report.json"
+# Already-compressed formats are stored rather than deflated a second time
+STORED_FORMATS = ("pdf", "pptx")
+
+_DECK_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def load_configs(path):
+    """Read and check a batch file; raises ValueError for an unusable one"""
+    with open(path, encoding="utf-8") as f:
+        configs = json.load(f)
+    if not isinstance(configs, list):
+        raise ValueError(f"{path} must contain a JSON list of deck configurations")
+
+    names = set()
+    for number, config in enumerate(configs, start=1):
+        name = config.get("name") if isinstance(config, dict) else None
+        if not isinstance(name, str) or not _DECK_NAME.match(name):
+            raise ValueError(f"deck {number} needs a \"name\" of letters, digits, '.', '_' or '-'")
+        if name in names:
+            raise ValueError(f"deck name {name!r} is used twice")
+        names.add(name)
+    return configs
+
+
+def expand_jobs(configs, today):
+    """One job dict per (deck, document, format), in batch order"""
+    jobs = []
+    for config in configs:
+        for document in config.get("documents") or DOCUMENTS:
+            for fmt in config.get("formats") or DEFAULT_FORMATS:
+                if (document, fmt) == ("flyer", "pptx"):
+                    continue
+                jobs.append({
+                    "index": len(jobs),
+                    "deck": config["name"],
+                    "document": document,
+                    "format": fmt,
+                    "path": f"{config['name']}/{FILE_NAMES.get(document, document)}.{fmt}",
+                    "config": config,
+                    "today": config.get("date") or today,
+                })
+    return jobs
+
+
+# Content per source file, loaded once per worker process
+_contents = {}
+
+
+def _content(path):
+    path = os.path.abspath(path or CONTENT_PATH)
+    if path not in _contents:
+        _contents[path] = load_content(path)
+    return _contents[path]
+
+
+def run_job(job, optimize=True):
+    """Render one job in a worker; returns its result dict (never raises)"""
+    start = time.perf_counter()
+    result = {"index": job["index"], "path": job["path"], "pid": os.getpid(), "error": None}
+    try:
+        if job["document"] not in DOCUMENTS or job["format"] not in FORMATS:
+            raise ValueError(f"unknown document or format: {job['document']}.{job['format']}")
+        content = _content(job["config"].get("content"))
+        branding = Branding.from_dict(job["config"])
+        data = render_document(content, job["document"], job["format"], job["today"], branding)
+        if job["format"] == "html" and optimize:
+            from apstat.exports import optimize_html
+            data = optimize_html(data)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        result["data"] = data
+        result["size"] = len(data)
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        result["traceback"] = traceback.format_exc()
+    result["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def _add_file(archive, path, fmt, data):
+    info = zipfile.ZipInfo(path, date_time=MEMBER_DATE_TIME)
+    info.compress_type = zipfile.ZIP_STORED if fmt in STORED_FORMATS else zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data)
+
+
+def export_batch(configs, out, workers=None, today=None, optimize=True, on_result=None):
+    """Render every job of configs in a process pool and stream the files into the ZIP at out
+
+    on_result(result) is called as each job finishes. Returns the job results
+    (without their data) in batch order; failed jobs carry an "error".
+    """
+    today = today or datetime.now().strftime("%B %d, %Y")
+    jobs = expand_jobs(configs, today)
+    workers = workers or os.cpu_count() or 1
+    window = workers * IN_FLIGHT_PER_WORKER
+    results = []
+
+    out_dir = os.path.dirname(os.path.abspath(out))
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".batch.", suffix=".zip")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as archive, \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            queue = iter(jobs)
+            pending = {}
+
+            def fill():
+                for job in islice(queue, window - len(pending)):
+                    pending[pool.submit(run_job, job, optimize)] = job
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # the worker died (e.g. killed for memory)
+                        result = {"index": job["index"], "path": job["path"], "pid": None, "ms": None,
+                                  "error": f"{type(exc).__name__}: {exc}"}
+                    data = result.pop("data", None)
+                    if data is not None:
+                        _add_file(archive, job["path"], job["format"], data)
+                    result.update(deck=job["deck"], document=job["document"], format=job["format"])
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+                fill()
+
+            results.sort(key=lambda result: result["index"])
+            report = {
+                "date": today,
+                "workers": workers,
+                "jobs": results,
+            }
+            _add_file(archive, REPORT_NAME, "json", json.dumps(report, indent=2, ensure_ascii=False))
+        # mkstemp creates the file private; the archive is meant to be handed out
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, out)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return results
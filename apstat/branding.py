@@ -0,0 +1,81 @@
+"""Who a deck is credited to: teacher, role, school and headline
+
+The renderers take a Branding and default to DEFAULT_BRANDING, the deck's
+original author. Credits that live inside content.json (the flyer's) are
+written for the default author; rebrand() swaps the default names for this
+branding's wherever they appear in a piece of content.
+"""
+
+
+class Branding:
+    """Credit lines for one teacher; attributes cannot be reassigned"""
+
+    __slots__ = ("teacher", "role", "school", "headline")
+
+    def __init__(self, teacher, school, role="AP Statistics Teacher",
+                 headline="AP Statistics: The Data Skills Every Career Demands"):
+        for name, value in (("teacher", teacher), ("role", role), ("school", school), ("headline", headline)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Branding is read-only (tried to set {name!r})")
+
+    def __eq__(self, other):
+        return isinstance(other, Branding) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __reduce__(self):
+        # The default slots pickling restores through __setattr__, which refuses
+        return (Branding, (self.teacher, self.school, self.role, self.headline))
+
+    def __repr__(self):
+        return f"Branding({self.teacher!r}, {self.school!r})"
+
+    def key(self):
+        """Tuple identifying this branding, for cache keys"""
+        return (self.teacher, self.role, self.school, self.headline)
+
+    @property
+    def compiled_by(self):
+        return f"Compiled by {self.teacher}"
+
+    @property
+    def position(self):
+        """'AP Statistics Teacher at Newark Tech'"""
+        return f"{self.role} at {self.school}"
+
+    @property
+    def credit(self):
+        """'Dr. Roland Lucas, AP Statistics Teacher at Newark Tech'"""
+        return f"{self.teacher}, {self.position}"
+
+    @property
+    def short_credit(self):
+        """'Dr. Roland Lucas, Newark Tech'"""
+        return f"{self.teacher}, {self.school}"
+
+    def rebrand(self, value):
+        """Copy of value (str, list or dict, nested) with DEFAULT_BRANDING's names replaced by these"""
+        if self == DEFAULT_BRANDING:
+            return value
+        if isinstance(value, str):
+            for field in ("headline", "teacher", "role", "school"):
+                value = value.replace(getattr(DEFAULT_BRANDING, field), getattr(self, field))
+            return value
+        if isinstance(value, list):
+            return [self.rebrand(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.rebrand(item) for key, item in value.items()}
+        return value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Branding from a config mapping; missing fields keep the defaults"""
+        fields = {name: data[name] for name in ("teacher", "school", "role", "headline") if data.get(name)}
+        defaults = {name: getattr(DEFAULT_BRANDING, name) for name in ("teacher", "school")}
+        return cls(**{**defaults, **fields})
+
+
+DEFAULT_BRANDING = Branding("Dr. Roland Lucas", "Newark Tech")
@@ -0,0 +1,102 @@
+"""Process-wide render cache shared by every Streamlit session
+
+Streamlit re-executes app.py on every rerun, so anything stored in its module
+globals is thrown away. Modules imported from app.py stay in sys.modules for the
+life of the server process, which makes this the place for state that all
+sessions should share.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import date
+
+
+def content_key(name, *parts, day=None):
+    """Build a cache key from a render name, the content it depends on and the day"""
+    if day is None:
+        day = date.today()
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False).encode())
+        digest.update(b"\0")
+    return f"{name}:{day.isoformat()}:{digest.hexdigest()[:16]}"
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered documents with hit/miss counters"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get_or_render(self, key, render, tags=()):
+        """Return the cached value for key, calling render() once on a miss
+
+        Concurrent callers asking for the same missing key wait for the first
+        render to finish instead of rendering the same document again. tags
+        name the content sections the value was built from, for invalidate().
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key][0]
+                self.misses += 1
+
+            value = render()
+
+            with self._lock:
+                self._entries[key] = (value, frozenset(tags))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+                self._key_locks.pop(key, None)
+        return value
+
+    def invalidate(self, tags):
+        """Drop every entry built from any of the given tags; return how many were dropped"""
+        tags = set(tags)
+        if not tags:
+            return 0
+        with self._lock:
+            stale = [key for key, (_, entry_tags) in self._entries.items() if entry_tags & tags]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        """Drop every cached entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return a snapshot of the cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# One cache for the whole server process
+render_cache = RenderCache()
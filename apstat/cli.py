@@ -0,0 +1,284 @@
+"""Headless command line entry point: ``python -m apstat <command>``
+
+Nothing imported here pulls in Streamlit, and heavy optional dependencies
+(reportlab) are imported only by the commands that need them, so cron jobs
+and build scripts start quickly.
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+from apstat.branding import DEFAULT_BRANDING
+from apstat.content import get_content
+
+FORMATS = ("html", "pdf", "md", "pptx")
+DOCUMENTS = ("presentation", "flyer")
+# Same names as the in-app download buttons
+FILE_NAMES = {
+    "presentation": "ap_statistics_presentation",
+    "flyer": "ap_statistics_flyer",
+}
+
+
+def render_document(content, document, fmt, today, branding=DEFAULT_BRANDING):
+    """Render one document in one format; returns str or bytes"""
+    flyer = branding.rebrand(content.flyer) if document == "flyer" else None
+    if fmt == "html":
+        if document == "flyer":
+            from apstat.flyer import render_flyer_html
+            return render_flyer_html(flyer, today)
+        from apstat.presentation import render_presentation_html
+        return render_presentation_html(content.registry, content.videos, today, branding)
+
+    if fmt == "md":
+        from apstat.markdown import render_flyer_markdown, render_presentation_markdown
+        if document == "flyer":
+            return render_flyer_markdown(flyer, today)
+        return render_presentation_markdown(content.registry, content.videos, today, branding)
+
+    if fmt == "pdf":
+        from apstat.pdf import render_flyer_pdf, render_presentation_pdf
+        if document == "flyer":
+            return render_flyer_pdf(flyer, today, branding)
+        return render_presentation_pdf(content.registry, content.videos, today, branding)
+
+    if fmt == "pptx":
+        if document == "flyer":
+            raise ValueError("The flyer has no PowerPoint version")
+        from apstat.pptx import render_presentation_pptx
+        return render_presentation_pptx(content.registry, content.videos, today, branding)
+
+    raise ValueError(f"Unknown format: {fmt}")
+
+
+def write_file(path, data):
+    mode = "wb" if isinstance(data, bytes) else "w"
+    encoding = None if isinstance(data, bytes) else "utf-8"
+    with open(path, mode, encoding=encoding) as f:
+        f.write(data)
+
+
+def tenant_content(name):
+    """(content, branding) for a tenant name from apstat/tenants.py, or the original deck for None"""
+    if name is None:
+        return get_content(), DEFAULT_BRANDING
+    from apstat.tenants import load_tenants
+
+    tenants, _ = load_tenants()
+    if name not in tenants:
+        raise ValueError(f"unknown tenant {name!r} (configured: {', '.join(sorted(tenants))})")
+    tenant = tenants[name]
+    return tenant.content(get_content()), tenant.branding
+
+
+def cmd_render(args):
+    from apstat.exports import VARIANT_SUFFIXES, compressed_variants, export_sizes, optimize_html
+
+    try:
+        content, branding = tenant_content(args.tenant)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    today = args.date or datetime.now().strftime("%B %d, %Y")
+    os.makedirs(args.out, exist_ok=True)
+
+    for document in args.document or DOCUMENTS:
+        for fmt in args.format or ("html",):
+            if (document, fmt) == ("flyer", "pptx"):
+                continue
+            start = time.perf_counter()
+            data = render_document(content, document, fmt, today, branding)
+            if fmt == "html" and not args.no_optimize:
+                data = optimize_html(data)
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            path = os.path.join(args.out, f"{FILE_NAMES[document]}.{fmt}")
+            write_file(path, data)
+            if args.compress:
+                for encoding, variant in compressed_variants(data).items():
+                    write_file(path + VARIANT_SUFFIXES[encoding], variant)
+            elapsed = (time.perf_counter() - start) * 1000
+            sizes = ", ".join(f"{encoding} {size:,}" for encoding, size in export_sizes(data).items())
+            print(f"{path} ({sizes} bytes, {elapsed:.0f} ms)")
+    return 0
+
+
+def cmd_build_site(args):
+    from apstat.site import build_site
+
+    try:
+        content, branding = tenant_content(args.tenant)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    today = args.date or datetime.now().strftime("%B %d, %Y")
+    start = time.perf_counter()
+    written = build_site(content, args.out, today, branding)
+    elapsed = (time.perf_counter() - start) * 1000
+    total = sum(os.path.getsize(path) for path in written)
+    print(f"Wrote {len(written)} files ({total:,} bytes) to {args.out} in {elapsed:.0f} ms")
+    print(f"Serve with: python -m http.server -d {args.out}")
+    return 0
+
+
+def cmd_check_links(args):
+    from apstat.links import LinkStatusCache, check_links, collect_links
+
+    urls = collect_links(get_content())
+    cache = LinkStatusCache(ttl=args.ttl * 3600)
+    start = time.perf_counter()
+    results = check_links(
+        urls,
+        cache=cache,
+        force=args.force,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        retries=args.retries,
+    )
+    elapsed = time.perf_counter() - start
+
+    dead = {url: entry for url, entry in results.items() if not entry["ok"]}
+    for url, entry in dead.items():
+        print(f"DEAD {url} ({entry['error'] or entry['status']})")
+    print(f"{len(urls) - len(dead)}/{len(urls)} links ok in {elapsed:.1f} s (results cached in {cache.path})")
+    return 1 if dead else 0
+
+
+def cmd_prefetch_previews(args):
+    from apstat.links import collect_links
+    from apstat.previews import prefetch_previews
+
+    urls = collect_links(get_content())
+    start = time.perf_counter()
+    index, errors = prefetch_previews(urls, ttl=args.ttl * 86400, force=args.force, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    for url, error in errors.items():
+        print(f"FAILED {url} ({error})")
+    with_thumbnails = sum(1 for url in urls if index.get(url, {}).get("thumbnail"))
+    print(f"{with_thumbnails}/{len(urls)} links have thumbnails ({len(errors)} failed) in {elapsed:.1f} s")
+    return 0
+
+
+def cmd_batch_export(args):
+    from apstat.batch import export_batch, load_configs
+
+    try:
+        configs = load_configs(args.config)
+    except (OSError, ValueError) as exc:
+        print(f"Cannot read {args.config}: {exc}")
+        return 2
+
+    def report(result):
+        if result["error"]:
+            print(f"FAIL {result['path']}: {result['error']}")
+        else:
+            print(f"ok   {result['path']} ({result['size']:,} bytes, {result['ms']:.0f} ms, pid {result['pid']})")
+
+    start = time.perf_counter()
+    results = export_batch(configs, args.out, workers=args.workers, today=args.date,
+                           optimize=not args.no_optimize, on_result=report)
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result["error"]]
+    render_ms = sum(result["ms"] or 0 for result in results)
+    print(f"Wrote {len(results) - len(failed)} files from {len(configs)} decks to {args.out} "
+          f"({os.path.getsize(args.out):,} bytes) in {elapsed:.1f} s; "
+          f"{render_ms / 1000:.1f} s of rendering, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+def cmd_mail_merge(args):
+    from apstat.roster import merge_roster
+
+    today = args.date or datetime.now().strftime("%B %d, %Y")
+
+    def report(flyers, errors, unknown):
+        for error in errors:
+            print(f"SKIP {error}")
+
+    try:
+        summary = merge_roster(args.roster, args.out, today, workers=args.workers,
+                               chunk_size=args.chunk_size, on_chunk=report)
+    except (OSError, ValueError) as exc:
+        print(f"Cannot merge {args.roster}: {exc}")
+        return 2
+
+    if summary["unknown_careers"]:
+        print(f"Careers not in the deck (printed without details): {', '.join(summary['unknown_careers'])}")
+    print(f"Wrote {summary['flyers']:,} flyers to {args.out} ({os.path.getsize(args.out):,} bytes) "
+          f"in {summary['seconds']:.1f} s: {summary['rate']:,.0f} flyers/s, {len(summary['errors'])} rows skipped")
+    return 1 if summary["errors"] else 0
+
+
+def cmd_serve_api(args):
+    import uvicorn
+
+    uvicorn.run("apstat.api:app", host=args.host, port=args.port, log_level="warning", access_log=args.access_log)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m apstat", description="AP Statistics presentation tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="render the deck and flyer to files")
+    render.add_argument("--format", action="append", choices=FORMATS, help="output format (repeatable, default html)")
+    render.add_argument("--document", action="append", choices=DOCUMENTS, help="document to render (repeatable, default both)")
+    render.add_argument("--out", default="exports", help="output directory (default: exports)")
+    render.add_argument("--date", help="date printed on the documents (default: today)")
+    render.add_argument("--compress", action="store_true", help="also write .gz (and .br with brotli installed) next to each file")
+    render.add_argument("--no-optimize", action="store_true", help="write HTML as rendered, without minifying it")
+    render.add_argument("--tenant", help="render for this tenant profile (apstat/tenants.py)")
+    render.set_defaults(func=cmd_render)
+
+    site = commands.add_parser("build-site", help="pre-render the whole deck as a static site")
+    site.add_argument("--out", default="site", help="output directory (default: site)")
+    site.add_argument("--date", help="date printed on the printable documents (default: today)")
+    site.add_argument("--tenant", help="build the site for this tenant profile (apstat/tenants.py)")
+    site.set_defaults(func=cmd_build_site)
+
+    links = commands.add_parser("check-links", help="check the case study and video links and cache the results")
+    links.add_argument("--ttl", type=float, default=24, help="re-check links whose result is older than this many hours (default: 24)")
+    links.add_argument("--force", action="store_true", help="re-check every link regardless of the cache")
+    links.add_argument("--concurrency", type=int, default=8, help="links checked at once (default: 8)")
+    links.add_argument("--timeout", type=float, default=10, help="seconds to wait for each response (default: 10)")
+    links.add_argument("--retries", type=int, default=2, help="retries after a timeout or transient error (default: 2)")
+    links.set_defaults(func=cmd_check_links)
+
+    previews = commands.add_parser("prefetch-previews", help="cache thumbnails and site names for the resource links")
+    previews.add_argument("--ttl", type=float, default=7, help="re-fetch previews older than this many days (default: 7)")
+    previews.add_argument("--force", action="store_true", help="re-fetch every preview regardless of the cache")
+    previews.add_argument("--workers", type=int, default=8, help="previews fetched at once (default: 8)")
+    previews.set_defaults(func=cmd_prefetch_previews)
+
+    batch = commands.add_parser("batch-export", help="render many branded decks in parallel into one ZIP")
+    batch.add_argument("config", help="JSON list of deck configurations (see apstat/batch.py)")
+    batch.add_argument("--out", default="exports/batch.zip", help="ZIP archive to write (default: exports/batch.zip)")
+    batch.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    batch.add_argument("--date", help="date printed on decks whose config has none (default: today)")
+    batch.add_argument("--no-optimize", action="store_true", help="write HTML as rendered, without minifying it")
+    batch.set_defaults(func=cmd_batch_export)
+
+    merge = commands.add_parser("mail-merge", help="personalized flyers for every student on a roster CSV")
+    merge.add_argument("roster", help="CSV with name, homeroom and careers (';'-separated) columns")
+    merge.add_argument("--out", default="exports/flyers.zip",
+                       help="a .zip of HTML flyers, or a .pdf for one combined PDF (default: exports/flyers.zip)")
+    merge.add_argument("--workers", type=int, default=1, help="worker processes for ZIP output (default: 1, in-process)")
+    merge.add_argument("--chunk-size", type=int, default=200, help="roster rows read and rendered at a time (default: 200)")
+    merge.add_argument("--date", help="date printed on the flyers (default: today)")
+    merge.set_defaults(func=cmd_mail_merge)
+
+    api = commands.add_parser("serve-api", help="serve the read-only JSON content API (uvicorn)")
+    api.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    api.add_argument("--port", type=int, default=8600, help="port to listen on (default: 8600)")
+    api.add_argument("--access-log", action="store_true", help="log every request")
+    api.set_defaults(func=cmd_serve_api)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
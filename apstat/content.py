@@ -0,0 +1,133 @@
+"""Deck content loaded from content.json with a compiled cache and hot reload
+
+The slides and per-career resources live in content.json so they can be
+edited without touching code. The parsed content is also written to a
+marshal cache in __pycache__, keyed by the source file's mtime and size,
+which is much faster to load than re-parsing JSON on a cold start.
+
+get_content() checks the source mtime on every call and reloads only when it
+changed. Render-cache entries are tagged with the content sections they were
+built from, and only the tags of sections that actually changed are
+invalidated on reload.
+"""
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import threading
+
+from apstat.cache import render_cache
+from apstat.registry import build_registry
+
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.json")
+# Bump when the layout of the compiled cache changes
+CACHE_FORMAT = 1
+
+# Top-level keys of content.json
+SECTIONS = (
+    "guaranteed_videos",
+    "career_case_studies",
+    "youtube_search_keywords",
+    "nj_college_schedules",
+    "slides",
+    "flyer",
+)
+
+
+class Content:
+    """One loaded version of the deck content and its slide registry"""
+
+    __slots__ = (
+        "videos", "case_studies", "keywords", "schedules", "slides", "flyer",
+        "registry", "careers", "section_hashes", "mtime_ns",
+    )
+
+    def __init__(self, data, mtime_ns):
+        self.videos = data["guaranteed_videos"]
+        self.case_studies = data["career_case_studies"]
+        self.keywords = data["youtube_search_keywords"]
+        self.schedules = data["nj_college_schedules"]
+        self.slides = data["slides"]
+        self.flyer = data["flyer"]
+        self.registry = build_registry(self.slides, self.case_studies, self.keywords, self.schedules)
+        self.careers = {record.career: record for record in self.registry if record.career}
+        self.section_hashes = {name: _hash_section(data[name]) for name in SECTIONS}
+        self.mtime_ns = mtime_ns
+
+    def version(self, *sections):
+        """Return a short fingerprint of the given content sections"""
+        return "-".join(self.section_hashes[name][:8] for name in sections)
+
+
+def _hash_section(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def _cache_path(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(path)), "__pycache__", f"{name}.marshal")
+
+
+def _read_data(path, stat):
+    """Return the parsed content, preferring the compiled cache when it is current"""
+    cache_path = _cache_path(path)
+    header = (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_header, data = marshal.load(f)
+        if tuple(cached_header) == header:
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    missing = [name for name in SECTIONS if name not in data]
+    if missing:
+        raise ValueError(f"{path} is missing sections: {', '.join(missing)}")
+
+    # The compiled cache is only an optimization; a read-only tree still works
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), prefix=".content.")
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump((header, data), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return data
+
+
+_lock = threading.Lock()
+_current = None
+
+
+def load_content(path=CONTENT_PATH):
+    """Load content from path without touching the shared current version"""
+    stat = os.stat(path)
+    return Content(_read_data(path, stat), stat.st_mtime_ns)
+
+
+def get_content():
+    """Return the current content, reloading it if content.json changed"""
+    global _current
+
+    mtime_ns = os.stat(CONTENT_PATH).st_mtime_ns
+    current = _current
+    if current is not None and current.mtime_ns == mtime_ns:
+        return current
+
+    with _lock:
+        if _current is not None and _current.mtime_ns == mtime_ns:
+            return _current
+
+        content = load_content()
+        if _current is not None:
+            changed = [name for name in SECTIONS if content.section_hashes[name] != _current.section_hashes[name]]
+            render_cache.invalidate(changed)
+        _current = content
+        return content
@@ -0,0 +1,164 @@
+"""Publish rendered exports as static files served by Streamlit
+
+With ``server.enableStaticServing`` on, Streamlit serves ``<app dir>/static``
+at ``app/static/`` over plain HTTP (gzip-compressed, browser-cacheable).
+Exports are written once under a content-hashed name, so every session
+links to the same file and a page only carries the URL.
+
+HTML exports go through optimize_html() first: indentation is collapsed and
+inline styles used more than once become classes. publish(variants=True)
+also writes precompressed .gz (and .br, when the optional brotli package is
+installed) siblings for static servers that serve them directly, and
+export_sizes() reports raw and compressed sizes.
+"""
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are written without it
+    brotli = None
+
+EXPORTS_SUBDIR = "exports"
+# Older versions of an export kept around for sessions still showing them
+KEEP_VERSIONS = 3
+# Class names given to hoisted inline styles: hs1, hs2, ...
+HOISTED_CLASS_PREFIX = "hs"
+
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_START_TAG = re.compile(r"<[a-zA-Z][^>]*\sstyle=\"[^\"]*\"[^>]*>")
+_STYLE_ATTRIBUTE = re.compile(r"\sstyle=\"([^\"]*)\"")
+_CLASS_ATTRIBUTE = re.compile(r"\sclass=([\"'])(.*?)\1")
+_ANY_CLASS_ATTRIBUTE = re.compile(r"\sclass\s*=", re.I)
+
+
+def minify_html(html):
+    """Drop comments and collapse whitespace runs (newline-preserving) in html
+
+    Only safe for documents without <pre>, <textarea> or inline scripts,
+    which the printable documents do not use.
+    """
+    html = _COMMENT.sub("", html)
+    return _WHITESPACE.sub(lambda match: "\n" if "\n" in match.group() else " ", html).strip()
+
+
+def _normalize_style(style):
+    declarations = (_WHITESPACE.sub(" ", declaration).strip() for declaration in style.split(";"))
+    return ";".join(declaration.replace(": ", ":") for declaration in declarations if declaration)
+
+
+def hoist_inline_styles(html):
+    """Replace inline styles that occur more than once with generated classes
+
+    The rules are marked !important, which keeps the precedence the inline
+    style had over the document's stylesheet (which uses no !important).
+    """
+    counts = {}
+    for tag in _START_TAG.findall(html):
+        style = _normalize_style(_STYLE_ATTRIBUTE.search(tag).group(1))
+        counts[style] = counts.get(style, 0) + 1
+    classes = {}
+    for style, count in counts.items():
+        if count > 1 and style:
+            classes[style] = f"{HOISTED_CLASS_PREFIX}{len(classes) + 1}"
+    if not classes:
+        return html
+
+    def replace(match):
+        tag = match.group()
+        style = _normalize_style(_STYLE_ATTRIBUTE.search(tag).group(1))
+        existing = _CLASS_ATTRIBUTE.search(tag)
+        # A class attribute we cannot merge into would be duplicated, and browsers drop the duplicate
+        if style not in classes or (not existing and _ANY_CLASS_ATTRIBUTE.search(tag)):
+            return tag
+        tag = _STYLE_ATTRIBUTE.sub("", tag, count=1)
+        existing = _CLASS_ATTRIBUTE.search(tag)
+        if existing:
+            return tag[:existing.start(2)] + f"{existing.group(2)} {classes[style]}" + tag[existing.end(2):]
+        return tag[:-1] + f' class="{classes[style]}">'
+
+    html = _START_TAG.sub(replace, html)
+    rules = "".join(
+        f".{name}{{{';'.join(f'{declaration}!important' for declaration in style.split(';'))}}}"
+        for style, name in classes.items()
+    )
+    if "</style>" in html:
+        return html.replace("</style>", f"{rules}</style>", 1)
+    return html.replace("</head>", f"<style>{rules}</style></head>", 1)
+
+
+def optimize_html(html):
+    """The export post-processing stage for HTML documents; returns str"""
+    return minify_html(hoist_inline_styles(html))
+
+
+def compressed_variants(data):
+    """{encoding: compressed bytes} for the encodings available here"""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def export_sizes(data):
+    """{"raw": bytes, "gzip": bytes, ...} sizes of data and its compressed variants"""
+    sizes = {"raw": len(data)}
+    sizes.update((encoding, len(variant)) for encoding, variant in compressed_variants(data).items())
+    return sizes
+
+
+VARIANT_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def _write_atomic(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def publish(static_dir, name, data, extension="html", variants=False):
+    """Write data to static/exports/<name>-<hash>.<extension> and return its URL path
+
+    With variants, precompressed siblings (<file>.gz, <file>.br) are written too.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{name}-{digest}.{extension}"
+    export_dir = os.path.join(static_dir, EXPORTS_SUBDIR)
+    path = os.path.join(export_dir, filename)
+
+    if not os.path.exists(path):
+        os.makedirs(export_dir, exist_ok=True)
+        if variants:
+            # Siblings first, so a server never sees the file without them
+            for encoding, variant in compressed_variants(data).items():
+                _write_atomic(path + VARIANT_SUFFIXES[encoding], variant)
+        _write_atomic(path, data)
+        _prune(export_dir, name, extension)
+
+    return f"app/static/{EXPORTS_SUBDIR}/{filename}"
+
+
+def _prune(export_dir, name, extension):
+    """Remove all but the newest KEEP_VERSIONS versions of an export"""
+    # Exactly <name>-<hash>.<extension>: "flyer_east" must not match "flyer_east-high-<hash>"
+    pattern = re.compile(rf"{re.escape(name)}-[0-9a-f]{{12}}\.{re.escape(extension)}")
+    versions = []
+    for entry in os.scandir(export_dir):
+        if pattern.fullmatch(entry.name):
+            versions.append((entry.stat().st_mtime, entry.path))
+    versions.sort(reverse=True)
+    for _, old_path in versions[KEEP_VERSIONS:]:
+        for path in (old_path, *(old_path + suffix for suffix in VARIANT_SUFFIXES.values())):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,221 @@
+"""Two-page printable flyer rendered from the flyer section of content.json"""
+from apstat.styles import stylesheet_bundle
+from apstat.templates import Template
+
+
+FLYER_HEAD = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AP Statistics Flyer</title>
+    <style>
+{style}    </style>
+</head>
+<body>
+
+<!-- PAGE 1 (FRONT) -->
+<div class="page">
+{personal}    <div style="text-align: center; margin-bottom: 20px;">
+        <h1>{title}</h1>
+        <h2>{subtitle}</h2>
+        <p style="font-weight: bold; font-size: 12pt;">{tagline}</p>
+        <p style="font-size: 12pt; color: #666;">{today}</p>
+        <div class="teacher-credit">
+            {credit}
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>{benefits_heading}</h2>
+        <ul>
+""")
+
+LABELED_ITEM = Template("""            <li><strong>{label}:</strong> {text}</li>
+""")
+
+SECTION_END = """        </ul>
+    </div>
+"""
+
+CAREER_GRID_OPEN = Template("""    
+    <div class="section">
+        <h2>{heading}</h2>
+        <div class="career-grid">
+""")
+
+CAREER_ITEM = Template("""            <div class="career-item">
+                <strong style="color: {color};">{title}</strong><br>
+                {points}
+            </div>
+""")
+
+CAREER_GRID_CLOSE = """        </div>
+    </div>
+"""
+
+METHODS_OPEN = Template("""    
+    <div class="section">
+        <h2>{heading}</h2>
+""")
+
+METHOD_ITEM = Template("""        <div class="stat-method"><strong>{label}:</strong> {text}</div>
+""")
+
+FRONT_TAIL = Template("""    </div>
+    
+    <div class="contact-info">
+        <p><strong>Questions?</strong> {contact}</p>
+    </div>
+</div>
+
+<!-- PAGE 2 (BACK) -->
+<div class="page page-break">
+    <div style="text-align: center; margin-bottom: 20px;">
+        <h1 style="color: #764ba2;">{back_title}</h1>
+        <div class="teacher-credit">
+            {credit}
+        </div>
+    </div>
+""")
+
+CASE_STUDIES_OPEN = Template("""    
+    <div class="section">
+        <h2>{heading}</h2>
+        <p>{intro}</p>
+        <ul>
+""")
+
+MAJORS_OPEN = Template("""    
+    <div class="section">
+        <h2>{heading}</h2>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 10px;">
+""")
+
+MAJORS_COLUMN = Template("""            <div>
+                <ul>
+{items}                </ul>
+            </div>
+""")
+
+MAJOR_ITEM = Template("""                    <li>{item}</li>
+""")
+
+MAJORS_CLOSE = """        </div>
+    </div>
+"""
+
+STEPS_OPEN = Template("""    
+    <div class="section">
+        <h2>{heading}</h2>
+        <p><strong>{intro}</strong></p>
+        <ol>
+""")
+
+STEP_ITEM = Template("""            <li>{item}</li>
+""")
+
+FLYER_TAIL = Template("""        </ol>
+    </div>
+    
+    <div class="contact-info">
+        <p style="font-size: 12pt; font-weight: bold; color: #667eea;">
+        {call_to_action}
+        </p>
+        <p style="font-style: italic; margin-top: 10px;">
+        {quote}
+        </p>
+        <div class="teacher-credit">
+            <strong>{closing_headline}</strong><br>
+            {closing_credit}
+        </div>
+    </div>
+</div>
+
+</body>
+</html>""")
+
+# Mail-merged copies (apstat.roster) open with the student's own block, styled by student.css
+STUDENT_BANNER = Template("""    <div class="student-banner">
+        <p><strong>Prepared for {name}</strong> &middot; Homeroom {homeroom}</p>
+        <ul>
+{careers}        </ul>
+    </div>
+""")
+
+STUDENT_CAREER = Template("""            <li><strong>{title}:</strong> {description}</li>
+""")
+
+FRONT_COLOR = "#667eea"
+BACK_COLOR = "#764ba2"
+
+
+def _write_career_grid(write, heading, careers, color):
+    CAREER_GRID_OPEN.render_into(write, heading=heading)
+    for career in careers:
+        points = "<br>\n                ".join(f"• {point}" for point in career["points"])
+        CAREER_ITEM.render_into(write, color=color, title=career["title"], points=points)
+    write(CAREER_GRID_CLOSE)
+
+
+def write_flyer_html(write, flyer, today, personal="", stylesheets=("flyer",)):
+    """Stream the two-page flyer to write(), with personal HTML opening the front page"""
+    FLYER_HEAD.render_into(
+        write,
+        style=stylesheet_bundle(*stylesheets) + "\n",
+        personal=personal,
+        title=flyer["title"],
+        subtitle=flyer["subtitle"],
+        tagline=flyer["tagline"],
+        today=today,
+        credit="<br>\n            ".join(flyer["front_credit"]),
+        benefits_heading=flyer["benefits_heading"],
+    )
+    for benefit in flyer["benefits"]:
+        LABELED_ITEM.render_into(write, **benefit)
+    write(SECTION_END)
+
+    _write_career_grid(write, flyer["front_careers_heading"], flyer["front_careers"], FRONT_COLOR)
+
+    METHODS_OPEN.render_into(write, heading=flyer["methods_heading"])
+    for method in flyer["methods"]:
+        METHOD_ITEM.render_into(write, **method)
+
+    FRONT_TAIL.render_into(
+        write,
+        contact=flyer["contact"],
+        back_title=flyer["back_title"],
+        credit="<br>\n            ".join(flyer["back_credit"]),
+    )
+
+    _write_career_grid(write, flyer["back_careers_heading"], flyer["back_careers"], BACK_COLOR)
+
+    CASE_STUDIES_OPEN.render_into(write, heading=flyer["case_studies_heading"], intro=flyer["case_studies_intro"])
+    for study in flyer["case_studies"]:
+        LABELED_ITEM.render_into(write, **study)
+    write(SECTION_END)
+
+    MAJORS_OPEN.render_into(write, heading=flyer["majors_heading"])
+    for column in flyer["majors"]:
+        MAJORS_COLUMN.render_into(write, items="".join(MAJOR_ITEM.render(item=item) for item in column))
+    write(MAJORS_CLOSE)
+
+    STEPS_OPEN.render_into(write, heading=flyer["steps_heading"], intro=flyer["steps_intro"])
+    for step in flyer["steps"]:
+        STEP_ITEM.render_into(write, item=step)
+
+    headline, credit = flyer["closing_credit"]
+    FLYER_TAIL.render_into(
+        write,
+        call_to_action=flyer["call_to_action"],
+        quote=flyer["quote"],
+        closing_headline=headline,
+        closing_credit=credit,
+    )
+
+
+def render_flyer_html(flyer, today, personal="", stylesheets=("flyer",)):
+    """Render the two-page flyer to a single string"""
+    parts = []
+    write_flyer_html(parts.append, flyer, today, personal, stylesheets)
+    return "".join(parts)
@@ -0,0 +1,171 @@
+"""Self-contained HTML for one slide, outside of Streamlit
+
+The Streamlit app renders slides with widgets; these builders produce the
+same content as plain HTML (a form stands in for the search text box and
+<details> for the schedule expander) for the static site and anything else
+that needs a slide without a Streamlit session.
+"""
+from html import escape
+
+from apstat.sections import (
+    case_studies_html,
+    create_youtube_search_url,
+    guaranteed_videos_html,
+    keyword_links_html,
+    schedule_html,
+)
+
+HEALTHCARE_CAREERS = ("NICU Nurse", "Pediatric Surgeon", "Registered Nurse", "Dermatology Physician Assistant", "Pediatrician")
+TECH_CAREERS = ("Cybersecurity Professional", "Software Developer", "Electrical Engineer", "Civil Engineer", "Physicist / Nanotechnologist")
+
+ADDITIONAL_MATERIALS = """<h3>📖 Additional Learning Materials</h3>
+<div class='case-study'>
+<strong>Where to find more information:</strong>
+<ul>
+<li><strong>Khan Academy AP Statistics:</strong> Free comprehensive course</li>
+<li><strong>College Board AP Statistics:</strong> Official course description and exam info</li>
+<li><strong>Your school library:</strong> Ask for statistics textbooks and career guides</li>
+<li><strong>Professional associations:</strong> Many offer student resources</li>
+</ul>
+</div>"""
+
+START_YOUR_SEARCH = """<h3>📺 Start Your Search</h3>
+<div class='video-container'>
+<strong>Click these links to begin exploring statistics videos:</strong>
+<div class='video-link'>▶️ <a href="https://www.youtube.com/results?search_query=introduction+to+statistics" target="_blank">Search: "Introduction to Statistics"</a></div>
+<div class='video-link'>▶️ <a href="https://www.youtube.com/results?search_query=AP+Statistics+course" target="_blank">Search: "AP Statistics course"</a></div>
+<div class='video-link'>▶️ <a href="https://www.youtube.com/results?search_query=statistics+careers" target="_blank">Search: "Statistics careers"</a></div>
+</div>"""
+
+GRADIENT_PANEL = "<div class='gradient-panel'></div>"
+
+
+def youtube_search_html(career_name, keywords, videos):
+    """Keyword links, a search form and the guaranteed videos for one topic"""
+    return f"""<h3>🔍 Search YouTube for Videos</h3>
+<p><strong>Find current videos about statistics in {career_name}:</strong></p>
+<p><strong>Suggested search terms (click to open):</strong></p>
+{keyword_links_html(keywords[:6])}
+<form class='search-form' action='https://www.youtube.com/results' target='_blank'>
+<label>Or enter your own search:
+<input type='search' name='search_query' value='statistics in {escape(career_name, quote=True)}'></label>
+<button type='submit' class='clickable-link'>🔍 Search</button>
+</form>
+<h3>✅ Guaranteed Working Videos</h3>
+<p><strong>These videos are always available (click to watch):</strong></p>
+{guaranteed_videos_html(videos)}"""
+
+
+def _career_links(careers, keywords):
+    links = []
+    for career in careers:
+        search = (keywords.get(career) or [f"statistics in {career}"])[0]
+        links.append(f"<a href='{create_youtube_search_url(search)}' target='_blank'>🔍 {career}</a>")
+    return "<br>".join(links)
+
+
+def title_slide_html(record, content):
+    slide = record.slide
+    return f"""<h1 class='main-header'>{slide['title']}</h1>
+<h2 class='sub-header'>{slide['subtitle']}</h2>
+<h3 class='slide-lead'>{slide['content']}</h3>
+{youtube_search_html("statistics", record.keywords, content.videos)}
+{GRADIENT_PANEL}"""
+
+
+def intro_slide_html(record, content):
+    slide = record.slide
+    benefits = "".join(f"<li>✅ {benefit}</li>" for benefit in slide["content"]["benefits"])
+    return f"""<h1 class='main-header'>{slide['title']}</h1>
+<div class='intro-section'>
+<h3>College & Career Benefits</h3>
+<ul class='plain-list'>{benefits}</ul>
+</div>
+<div class='intro-section'>
+<h3>Real-World Applications</h3>
+<div class='info-box'>{slide['content']['applications']}</div>
+</div>
+{youtube_search_html("AP Statistics", record.keywords, content.videos)}
+<hr>
+<h3>🔍 Explore Real Statistics in Action</h3>
+<p><strong>Search for these terms on YouTube to see statistics in action (click to open):</strong></p>
+{keyword_links_html(record.keywords)}"""
+
+
+def slide_card_html(slide):
+    """The description and worked examples of a career slide"""
+    examples = "".join(
+        f"<div class='example-box'><p><strong>{example['title']}</strong></p><p>{example['content']}</p></div>"
+        for example in slide["content"]["examples"]
+    )
+    return f"<div class='slide-card'><h2 class='career-title'>{slide['content']['description']}</h2>{examples}</div>"
+
+
+def career_slide_html(record, content):
+    slide = record.slide
+    parts = [
+        f"<h1 class='main-header'>{slide['title']}</h1>",
+        slide_card_html(slide),
+        "<h3>📚 Learning Resources</h3>",
+    ]
+    if record.case_studies:
+        parts.append(
+            f"<h4>📄 Real-World Case Studies</h4>"
+            f"<p><strong>See how statistics are actually used in {record.career}: (click to open)</strong></p>"
+            f"{case_studies_html(record.case_studies)}<hr>"
+        )
+    parts.append(youtube_search_html(record.career, record.keywords, content.videos))
+    parts.append(ADDITIONAL_MATERIALS)
+    if record.schedule:
+        parts.append(
+            "<details class='schedule-details'>"
+            "<summary>🎓 Sample College Schedule at a New Jersey State School</summary>"
+            f"{schedule_html(record.schedule)}"
+            "</details>"
+        )
+    return "\n".join(parts)
+
+
+def closing_slide_html(record, content):
+    slide = record.slide
+    points = "".join(f"<h3>{point}</h3>" for point in slide["content"]["points"])
+    return f"""<h1 class='main-header'>{slide['title']}</h1>
+<h3>🔍 Explore More Careers</h3>
+<p><strong>Click these links to search YouTube and learn about statistics in different fields:</strong></p>
+<div class='columns'>
+<div><p><strong>Healthcare Fields:</strong></p>{_career_links(HEALTHCARE_CAREERS, content.keywords)}</div>
+<div><p><strong>Technology & Engineering:</strong></p>{_career_links(TECH_CAREERS, content.keywords)}</div>
+</div>
+<div class='gradient-panel closing-points'>{points}</div>
+<div class='success-box'>{slide['content']['call_to_action']}</div>
+<hr>
+<h3>🎓 Next Steps</h3>
+<div class='info-box'>{slide['content']['contact']}</div>
+{START_YOUR_SEARCH}"""
+
+
+SLIDE_BUILDERS = {
+    "title": title_slide_html,
+    "intro": intro_slide_html,
+    "career": career_slide_html,
+    "closing": closing_slide_html,
+}
+
+
+def slide_parts(record, content, dead_links=frozenset(), previews=None):
+    """Pre-rendered HTML pieces the Streamlit app assembles one slide from"""
+    parts = {
+        "keyword_links": keyword_links_html(record.keywords[:6]),
+        "videos": guaranteed_videos_html(content.videos, dead_links, previews),
+    }
+    if record.type == "career":
+        parts["card"] = slide_card_html(record.slide)
+        parts["case_studies"] = case_studies_html(record.case_studies, dead_links, previews) if record.case_studies else ""
+        parts["schedule"] = schedule_html(record.schedule) if record.schedule else ""
+    return parts
+
+
+def slide_fragment_html(record, content):
+    """Return the body HTML for one slide record"""
+    builder = SLIDE_BUILDERS.get(record.type)
+    return builder(record, content) if builder else ""
@@ -0,0 +1,212 @@
+"""Health checks for the external links in the deck
+
+check_links() probes the guaranteed videos and case study URLs concurrently
+and records each result, stamped with when it was checked, in a JSON cache
+file. Results younger than the TTL are not checked again. The app never
+touches the network: it only reads the cache through get_dead_links() to
+flag links that were down at the last check. Refresh the cache from cron
+with ``python -m apstat check-links``.
+"""
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from apstat.content import CONTENT_PATH
+
+LINK_STATUS_PATH = os.path.join(os.path.dirname(CONTENT_PATH), "__pycache__", "link_status.json")
+STATUS_TTL = 24 * 60 * 60
+CONCURRENCY = 8
+PER_HOST = 2
+TIMEOUT = 10
+RETRIES = 2
+BACKOFF = 0.5
+USER_AGENT = "apstat-link-checker/1.0"
+
+# Responses worth asking again for; anything else is final
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Servers that refuse HEAD are asked again with a streamed GET
+HEAD_REFUSED = frozenset({403, 405, 501})
+
+
+def collect_links(content):
+    """Every external URL the deck links to, in first-seen order"""
+    urls = [video["url"] for video in content.videos.values()]
+    urls += [study["url"] for studies in content.case_studies.values() for study in studies]
+    return list(dict.fromkeys(urls))
+
+
+class LinkStatusCache:
+    """url -> last check result, persisted as JSON"""
+
+    def __init__(self, path=LINK_STATUS_PATH, ttl=STATUS_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.entries = read_link_statuses(path)
+
+    def fresh(self, url, now=None):
+        """Return the cached result for url if it is younger than the TTL"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        if (now or time.time()) - entry["checked_at"] >= self.ttl:
+            return None
+        return entry
+
+    def update(self, results):
+        self.entries.update(results)
+
+    def save(self):
+        """Write the cache atomically so readers never see a partial file"""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".link_status.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def read_link_statuses(path=LINK_STATUS_PATH):
+    """Return the cached url -> result mapping, or {} if there is none yet"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _probe(session, url, timeout):
+    """Blocking HEAD (or GET when HEAD is refused); returns (status, final URL)"""
+    response = session.head(url, timeout=timeout, allow_redirects=True)
+    if response.status_code in HEAD_REFUSED:
+        response.close()
+        response = session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+    response.close()
+    return response.status_code, response.url
+
+
+class LinkChecker:
+    """Checks URLs concurrently with a global and a per-host limit
+
+    Each host gets its own requests.Session, so connections to it are kept
+    alive and reused across checks, and its own semaphore, so one slow host
+    cannot take every slot. The blocking requests run in the checker's own
+    thread pool, sized to the concurrency limit (the default executor can be
+    smaller than that on machines with few cores).
+    """
+
+    def __init__(self, concurrency=CONCURRENCY, per_host=PER_HOST, timeout=TIMEOUT, retries=RETRIES, backoff=BACKOFF):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._slots = asyncio.Semaphore(concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="apstat-links")
+        self._hosts = {}
+
+    def _host(self, url):
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        if host not in self._hosts:
+            session = requests.Session()
+            session.headers["User-Agent"] = USER_AGENT
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._hosts[host] = (session, asyncio.Semaphore(self.per_host))
+        return self._hosts[host]
+
+    async def check(self, url):
+        """Return the result entry for one URL, retrying timeouts and transient errors"""
+        session, host_slots = self._host(url)
+        attempts = 0
+        while True:
+            attempts += 1
+            # The host's slot first: waiting for a busy host must not hold a global slot
+            async with host_slots, self._slots:
+                try:
+                    status, final_url = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, _probe, session, url, self.timeout
+                    )
+                    error = None
+                except requests.RequestException as exc:
+                    status, final_url, error = None, url, f"{type(exc).__name__}: {exc}"
+            if attempts > self.retries or (error is None and status not in RETRY_STATUSES):
+                break
+            await asyncio.sleep(self.backoff * 2 ** (attempts - 1))
+
+        return {
+            "ok": error is None and status < 400,
+            "status": status,
+            "error": error,
+            "final_url": final_url,
+            "attempts": attempts,
+            "checked_at": time.time(),
+        }
+
+    async def check_all(self, urls):
+        results = await asyncio.gather(*(self.check(url) for url in urls))
+        return dict(zip(urls, results))
+
+    def close(self):
+        for session, _ in self._hosts.values():
+            session.close()
+        self._hosts.clear()
+        self._executor.shutdown(wait=False)
+
+
+async def _check_all(urls, options):
+    checker = LinkChecker(**options)
+    try:
+        return await checker.check_all(urls)
+    finally:
+        checker.close()
+
+
+def check_links(urls, cache=None, force=False, **options):
+    """Check every URL without a fresh cached result; returns url -> result for all of them
+
+    options are passed to LinkChecker (concurrency, per_host, timeout,
+    retries, backoff). The cache is saved when anything was checked.
+    """
+    if cache is None:
+        cache = LinkStatusCache()
+    now = time.time()
+    stale = [url for url in dict.fromkeys(urls) if force or cache.fresh(url, now) is None]
+    if stale:
+        cache.update(asyncio.run(_check_all(stale, options)))
+        cache.save()
+    return {url: cache.entries[url] for url in urls}
+
+
+_lock = threading.Lock()
+_dead_links = (None, None, frozenset())
+
+
+def get_dead_links(path=LINK_STATUS_PATH):
+    """URLs that failed their last check, re-read only when the cache file changes
+
+    Never blocks on the network; with no cache file nothing is reported dead.
+    """
+    global _dead_links
+
+    try:
+        version = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return frozenset()
+
+    cached_path, cached_mtime, dead = _dead_links
+    if (cached_path, cached_mtime) == version:
+        return dead
+
+    with _lock:
+        if _dead_links[:2] != version:
+            dead = frozenset(url for url, entry in read_link_statuses(path).items() if not entry["ok"])
+            _dead_links = (*version, dead)
+        return _dead_links[2]
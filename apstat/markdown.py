@@ -0,0 +1,105 @@
+"""Markdown export of the deck and flyer, for wikis, LMS pages and email"""
+import re
+
+from apstat.branding import DEFAULT_BRANDING
+
+_TAGS = re.compile(r"<[^>]+>")
+
+
+def _md(text):
+    """Turn slide HTML (highlight spans) into Markdown emphasis"""
+    text = text.replace("<span class='highlight'>", "**").replace("</span>", "**")
+    return _TAGS.sub("", text)
+
+
+def _career_slide(lines, record, videos):
+    slide = record.slide
+    lines.append(f"### {slide['content']['description']}")
+    lines.append("")
+    for example in slide["content"]["examples"]:
+        lines.append(f"#### {example['title']}")
+        lines.append("")
+        lines.append(_md(example["content"]))
+        lines.append("")
+    if record.case_studies:
+        lines.append(f"**Case Studies in {record.career}:**")
+        lines.append("")
+        lines.extend(f"- [{study['title']}]({study['url']}): {study['description']}" for study in record.case_studies)
+        lines.append("")
+    lines.append(f"**Find Videos About {record.career}** (search YouTube for):")
+    lines.append("")
+    lines.extend(f'- "{keyword}"' for keyword in (record.keywords[:3] or (f"statistics in {record.career}",)))
+    lines.append("")
+    lines.append("**Guaranteed working videos:**")
+    lines.append("")
+    lines.extend(f"- [{video['title']}]({video['url']})" for video in videos.values())
+
+
+def render_presentation_markdown(registry, videos, today, branding=DEFAULT_BRANDING):
+    """Render the full presentation as a Markdown document"""
+    lines = [
+        "# AP Statistics Career Presentation",
+        "",
+        f"**{branding.headline}**  ",
+        f"Compiled by {branding.credit}  ",
+        f"Generated on {today}",
+    ]
+    for record in registry:
+        slide = record.slide
+        lines += ["", "---", "", f"## Slide {record.index + 1}: {slide['title']}", ""]
+        if record.type == "title":
+            lines += [f"### {slide['subtitle']}", "", slide["content"]]
+        elif record.type == "intro":
+            lines += ["### College & Career Benefits", ""]
+            lines += [f"- {benefit}" for benefit in slide["content"]["benefits"]]
+            lines += ["", "### Real-World Applications", "", slide["content"]["applications"]]
+        elif record.type == "career":
+            _career_slide(lines, record, videos)
+        elif record.type == "closing":
+            lines += [f"- {point}" for point in slide["content"]["points"]]
+            lines += ["", f"**{slide['content']['call_to_action']}**", "", slide["content"]["contact"]]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_flyer_markdown(flyer, today):
+    """Render the two-page flyer as a Markdown document"""
+    lines = [
+        f"# {flyer['title']}",
+        "",
+        f"## {flyer['subtitle']}",
+        "",
+        f"**{flyer['tagline']}**  ",
+        f"{today}  ",
+        "  \n".join(flyer["front_credit"]),
+        "",
+        f"### {flyer['benefits_heading']}",
+        "",
+    ]
+    lines += [f"- **{item['label']}:** {item['text']}" for item in flyer["benefits"]]
+    for heading, careers in (
+        (flyer["front_careers_heading"], flyer["front_careers"]),
+        (flyer["back_careers_heading"], flyer["back_careers"]),
+    ):
+        lines += ["", f"### {heading}", ""]
+        for career in careers:
+            lines.append(f"- **{career['title']}:** " + "; ".join(career["points"]))
+    lines += ["", f"### {flyer['methods_heading']}", ""]
+    lines += [f"- **{item['label']}:** {item['text']}" for item in flyer["methods"]]
+    lines += ["", f"**Questions?** {flyer['contact']}"]
+    lines += ["", f"### {flyer['case_studies_heading']}", "", flyer["case_studies_intro"], ""]
+    lines += [f"- **{item['label']}:** {item['text']}" for item in flyer["case_studies"]]
+    lines += ["", f"### {flyer['majors_heading']}", ""]
+    lines += [f"- {major}" for column in flyer["majors"] for major in column]
+    lines += ["", f"### {flyer['steps_heading']}", "", f"**{flyer['steps_intro']}**", ""]
+    lines += [f"{number}. {step}" for number, step in enumerate(flyer["steps"], start=1)]
+    lines += [
+        "",
+        f"**{flyer['call_to_action']}**",
+        "",
+        f"*{flyer['quote']}*",
+        "",
+        "  \n".join(flyer["closing_credit"]),
+        "",
+    ]
+    return "\n".join(lines)
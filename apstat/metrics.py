@@ -0,0 +1,188 @@
+"""Lightweight instrumentation for Streamlit reruns
+
+Nothing here imports Streamlit; the app passes in its ScriptRunContext.
+"""
+import functools
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+
+class DeltaCounter:
+    """Counts the messages and bytes a session sends to the browser"""
+
+    __slots__ = ("messages", "deltas", "bytes")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.messages = 0
+        self.deltas = 0
+        self.bytes = 0
+
+    def record(self, msg):
+        self.messages += 1
+        self.bytes += msg.ByteSize()
+        if msg.HasField("delta"):
+            self.deltas += 1
+
+    def snapshot(self):
+        return {"messages": self.messages, "deltas": self.deltas, "bytes": self.bytes}
+
+
+def install_delta_counter(ctx):
+    """Return the DeltaCounter for a script run context, wrapping its enqueue once
+
+    The counter is reset on every call, so calling this at the top of a rerun
+    measures that rerun. Returns None when there is no context (bare mode).
+    """
+    if ctx is None:
+        return None
+
+    counter = getattr(ctx, "_apstat_delta_counter", None)
+    if counter is None:
+        counter = DeltaCounter()
+        enqueue = ctx._enqueue
+
+        def counting_enqueue(msg):
+            counter.record(msg)
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+        ctx._apstat_delta_counter = counter
+
+    counter.reset()
+    return counter
+
+
+# Histogram bucket upper bounds for span durations, in seconds
+SPAN_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=SPAN_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class SpanRecorder:
+    """Times named sections of a rerun into process-wide histograms
+
+    Each script run (one thread) can also collect its own spans between
+    begin_rerun() and end_rerun(), for showing the last few reruns of a
+    session. Spans outside a collected rerun (fragment reruns, background
+    renders) still feed the histograms.
+    """
+
+    def __init__(self, buckets=SPAN_BUCKETS):
+        self.buckets = buckets
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_export = 0.0
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+        trace = getattr(self._local, "trace", None)
+        if trace is not None:
+            trace[name] = trace.get(name, 0.0) + seconds
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name=None):
+        """Decorator recording every call of the function as a span"""
+        def decorate(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def begin_rerun(self):
+        self._local.trace = {}
+        self._local.started = time.perf_counter()
+
+    def end_rerun(self):
+        """Stop collecting for this thread; returns {"total_ms", "spans": {name: ms}} or None"""
+        trace = getattr(self._local, "trace", None)
+        if trace is None:
+            return None
+        total = time.perf_counter() - self._local.started
+        self._local.trace = None
+        self.observe("rerun", total)
+        return {
+            "total_ms": total * 1000,
+            "spans": {name: seconds * 1000 for name, seconds in trace.items()},
+        }
+
+    def prometheus_text(self, gauges=None):
+        """Histograms (and optional {name: value} gauges/counters) in the Prometheus text format"""
+        lines = [
+            "# HELP apstat_span_seconds Time spent in instrumented sections of the app.",
+            "# TYPE apstat_span_seconds histogram",
+        ]
+        with self._lock:
+            for name, histogram in sorted(self.histograms.items()):
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'apstat_span_seconds_bucket{{span="{name}",le="{bound:g}"}} {count}')
+                lines.append(f'apstat_span_seconds_bucket{{span="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'apstat_span_seconds_sum{{span="{name}"}} {histogram.sum:.6f}')
+                lines.append(f'apstat_span_seconds_count{{span="{name}"}} {histogram.count}')
+        for name, value in sorted((gauges or {}).items()):
+            # Prometheus naming: cumulative values end in _total and are counters
+            lines.append(f"# TYPE apstat_{name} {'counter' if name.endswith('_total') else 'gauge'}")
+            lines.append(f"apstat_{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, gauges=None, interval=10):
+        """Write prometheus_text() to path at most once per interval seconds; returns True if written"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_export < interval:
+                return False
+            self._last_export = now
+        write_metrics_file(path, self.prometheus_text(gauges))
+        return True
+
+
+def write_metrics_file(path, text):
+    """Atomically replace path with text, so scrapers never read a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# One recorder for the whole server process
+spans = SpanRecorder()
@@ -0,0 +1,421 @@
+"""Native PDF export of the deck and flyer using reportlab
+
+The PDFs are laid out from the same slide registry and flyer data as the
+printable HTML, so classrooms get a consistent file without going through
+the browser print dialog. Pages are laid out by platypus straight into the
+caller's output stream (a file, or a BytesIO for in-memory use).
+"""
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import (
+    BaseDocTemplate,
+    Frame,
+    KeepInFrame,
+    PageBreak,
+    PageTemplate,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from apstat.branding import DEFAULT_BRANDING
+
+PRIMARY = colors.HexColor("#667eea")
+SECONDARY = colors.HexColor("#764ba2")
+MUTED = colors.HexColor("#666666")
+LIGHT_BOX = colors.HexColor("#f8f9fa")
+BLUE_BOX = colors.HexColor("#e7f3ff")
+RESOURCE_BOX = colors.HexColor("#f0f7ff")
+BORDER = colors.HexColor("#dee2e6")
+
+MARGIN = 0.6 * inch
+BAND_HEIGHT = 0.18 * inch
+
+
+def _style(name, **kwargs):
+    base = {"fontName": "Helvetica", "fontSize": 11, "leading": 15}
+    base.update(kwargs)
+    return ParagraphStyle(name, **base)
+
+
+STYLES = {
+    "h1": _style("h1", fontName="Helvetica-Bold", fontSize=24, leading=30, textColor=PRIMARY, alignment=TA_CENTER, spaceAfter=10),
+    "h2": _style("h2", fontName="Helvetica-Bold", fontSize=16, leading=20, textColor=SECONDARY, spaceBefore=8, spaceAfter=6),
+    "h2c": _style("h2c", fontName="Helvetica-Bold", fontSize=16, leading=20, textColor=SECONDARY, alignment=TA_CENTER, spaceAfter=6),
+    "h3": _style("h3", fontName="Helvetica-Bold", fontSize=13, leading=17, textColor=colors.HexColor("#333333"), spaceAfter=4),
+    "h4": _style("h4", fontName="Helvetica-Bold", fontSize=11, leading=15, textColor=PRIMARY, spaceAfter=4),
+    "body": _style("body"),
+    "center": _style("center", alignment=TA_CENTER),
+    "big": _style("big", fontSize=15, leading=20, alignment=TA_CENTER),
+    "bullet": _style("bullet", leftIndent=14, bulletIndent=2, spaceAfter=3),
+    "credit": _style("credit", fontName="Helvetica-Oblique", fontSize=10, leading=13, textColor=MUTED, alignment=TA_CENTER, spaceBefore=6),
+    "small": _style("small", fontSize=9.5, leading=12.5),
+    "small_bullet": _style("small_bullet", fontSize=9.5, leading=12.5, leftIndent=12, bulletIndent=2, spaceAfter=2),
+}
+
+
+def _plain(text):
+    """Drop characters the standard PDF fonts cannot draw (emoji, check marks)"""
+    cleaned = text.encode("cp1252", "ignore").decode("cp1252")
+    return " ".join(cleaned.split())
+
+
+def _markup(text):
+    """Escape text for a Paragraph, keeping the slide highlight spans as bold"""
+    text = text.replace("<span class='highlight'>", "\x01").replace("</span>", "\x02")
+    text = escape(_plain(text))
+    return text.replace("\x01", "<b>").replace("\x02", "</b>")
+
+
+def _link(url, title):
+    return f'<a href="{escape(url)}" color="#1a4fd6">{escape(_plain(title))}</a>'
+
+
+def _p(text, style="body"):
+    return Paragraph(text, STYLES[style])
+
+
+def _bullets(items, style="bullet"):
+    return [Paragraph(item, STYLES[style], bulletText="•") for item in items]
+
+
+def _box(flowables, background, border=None, padding=10):
+    """Wrap flowables in a shaded, optionally bordered box"""
+    table = Table([[flowables]], colWidths=["100%"])
+    commands = [
+        ("BACKGROUND", (0, 0), (-1, -1), background),
+        ("LEFTPADDING", (0, 0), (-1, -1), padding),
+        ("RIGHTPADDING", (0, 0), (-1, -1), padding),
+        ("TOPPADDING", (0, 0), (-1, -1), padding),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), padding),
+    ]
+    if border is not None:
+        commands.append(("LINEBEFORE", (0, 0), (0, -1), 4, border))
+    table.setStyle(TableStyle(commands))
+    return table
+
+
+def _grid(cells, columns=2):
+    """Lay cells out in a grid of bordered boxes"""
+    rows = [cells[i:i + columns] for i in range(0, len(cells), columns)]
+    if rows and len(rows[-1]) < columns:
+        rows[-1] = rows[-1] + [""] * (columns - len(rows[-1]))
+    table = Table(rows, colWidths=[f"{100 / columns}%"] * columns)
+    table.setStyle(TableStyle([
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("BOX", (0, 0), (-1, -1), 0.5, BORDER),
+        ("INNERGRID", (0, 0), (-1, -1), 0.5, BORDER),
+        ("LEFTPADDING", (0, 0), (-1, -1), 6),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+    ]))
+    return table
+
+
+def _draw_band(canvas, width, height):
+    """Gradient band across the top of the page"""
+    canvas.saveState()
+    steps = 48
+    for step in range(steps):
+        canvas.setFillColor(colors.linearlyInterpolatedColor(PRIMARY, SECONDARY, 0, steps - 1, step))
+        canvas.rect(width * step / steps, height - BAND_HEIGHT, width / steps + 1, BAND_HEIGHT, stroke=0, fill=1)
+    canvas.restoreState()
+
+
+def _draw_footer(canvas, width, text):
+    canvas.saveState()
+    canvas.setFont("Helvetica", 8.5)
+    canvas.setFillColor(MUTED)
+    canvas.drawCentredString(width / 2, 0.4 * inch, text)
+    canvas.restoreState()
+
+
+def _draw_page(footer):
+    """Page decoration: gradient band across the top and a footer line"""
+    def draw(canvas, doc):
+        width, height = doc.pagesize
+        _draw_band(canvas, width, height)
+        _draw_footer(canvas, width, f"Page {doc.page} | {footer}")
+    return draw
+
+
+def _build(out, story, title, footer, author):
+    doc = BaseDocTemplate(
+        out,
+        pagesize=letter,
+        leftMargin=MARGIN,
+        rightMargin=MARGIN,
+        topMargin=MARGIN,
+        bottomMargin=MARGIN,
+        title=title,
+        author=author,
+    )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="body")
+    doc.addPageTemplates([PageTemplate(id="page", frames=[frame], onPage=_draw_page(footer))])
+    doc.build(story)
+
+
+# --- Full presentation ---------------------------------------------------------
+
+def _title_slide(record, videos, branding):
+    slide = record.slide
+    return [
+        _p(escape(_plain(slide["title"])), "h1"),
+        _p(escape(_plain(slide["subtitle"])), "h2c"),
+        Spacer(1, 1.2 * inch),
+        _p(escape(_plain(slide["content"])), "big"),
+        Spacer(1, 0.6 * inch),
+        _p(f"{escape(branding.headline)}<br/>{escape(branding.credit)}", "credit"),
+    ]
+
+
+def _intro_slide(record, videos, branding):
+    slide = record.slide
+    content = slide["content"]
+    return [
+        _p(escape(_plain(slide["title"])), "h1"),
+        _box([_p("College &amp; Career Benefits", "h2")] + _bullets([_markup(b) for b in content["benefits"]]), BLUE_BOX),
+        Spacer(1, 10),
+        _box([_p("Real-World Applications", "h2"), _p(_markup(content["applications"]))], BLUE_BOX),
+        Spacer(1, 10),
+        _box([_p("General Resources for AP Statistics:", "h4")] + _bullets([
+            '<b>YouTube Search:</b> "Introduction to Statistics" or "AP Statistics course"',
+            "<b>Khan Academy AP Statistics:</b> Free video lessons and practice problems",
+            "<b>College Board AP Statistics:</b> Official course information and resources",
+            "<b>American Statistical Association:</b> Career information and case studies",
+        ], "small_bullet"), RESOURCE_BOX),
+    ]
+
+
+def _career_slide(record, videos, branding):
+    slide = record.slide
+    career = escape(record.career)
+    story = [
+        _p(escape(_plain(slide["title"])), "h1"),
+        _p(escape(_plain(slide["content"]["description"])), "h2"),
+    ]
+    for example in slide["content"]["examples"]:
+        story.append(_box([_p(escape(_plain(example["title"])), "h3"), _p(_markup(example["content"]))], LIGHT_BOX, border=PRIMARY))
+        story.append(Spacer(1, 8))
+
+    if record.case_studies:
+        items = [f"{_link(study['url'], study['title'])}: {escape(_plain(study['description']))}" for study in record.case_studies]
+        story.append(_box([_p(f"Case Studies in {career}:", "h4")] + _bullets(items, "small_bullet"), RESOURCE_BOX))
+        story.append(Spacer(1, 8))
+
+    keywords = record.keywords[:3] or (f"statistics in {record.career}",)
+    resources = [_p(f"Find Videos About {career}:", "h4"), _p("<b>Search YouTube for:</b>", "small")]
+    resources += _bullets([f'"{escape(keyword)}"' for keyword in keywords], "small_bullet")
+    resources.append(_p("<b>Guaranteed working videos:</b>", "small"))
+    resources += _bullets([_link(video["url"], video["title"]) for video in videos.values()], "small_bullet")
+    story.append(_box(resources, RESOURCE_BOX))
+    return story
+
+
+def _closing_slide(record, videos, branding):
+    content = record.slide["content"]
+    story = [_p(escape(_plain(record.slide["title"])), "h1"), Spacer(1, 0.4 * inch)]
+    story += [_p(escape(_plain(point)), "big") for point in content["points"]]
+    story += [
+        Spacer(1, 0.3 * inch),
+        _box([_p(f"<b>{escape(_plain(content['call_to_action']))}</b>", "big")], BLUE_BOX, padding=18),
+        Spacer(1, 0.3 * inch),
+        _box([
+            _p("Next Steps", "h3"),
+            _p(escape(_plain(content["contact"]))),
+            Spacer(1, 6),
+            _p("<b>Video Resources:</b>", "small"),
+        ] + _bullets([
+            'Search YouTube: "AP Statistics introduction"',
+            "Khan Academy: Free AP Statistics course",
+            "College Board: Official AP Statistics resources",
+        ], "small_bullet"), LIGHT_BOX),
+        Spacer(1, 0.3 * inch),
+        _p(f"<b>{escape(branding.headline)}</b><br/>Compiled by {escape(branding.credit)}", "credit"),
+    ]
+    return story
+
+
+SLIDE_BUILDERS = {
+    "title": _title_slide,
+    "intro": _intro_slide,
+    "career": _career_slide,
+    "closing": _closing_slide,
+}
+
+
+def write_presentation_pdf(out, registry, videos, today, branding=DEFAULT_BRANDING):
+    """Write the full presentation as a PDF to out (a path or binary file object)"""
+    story = [
+        _p("AP Statistics Career Presentation", "h1"),
+        _p(f"<b>{escape(branding.headline)}</b>", "center"),
+        _p(f"Generated on {escape(today)}", "credit"),
+        _p(f"{escape(branding.compiled_by)}<br/>{escape(branding.position)}", "credit"),
+        Spacer(1, 0.3 * inch),
+    ]
+    for record in registry:
+        if record.index:
+            story.append(PageBreak())
+        builder = SLIDE_BUILDERS.get(record.type)
+        if builder:
+            story.extend(builder(record, videos, branding))
+    _build(out, story, "AP Statistics Full Presentation", "AP Statistics Career Presentation", branding.teacher)
+
+
+def render_presentation_pdf(registry, videos, today, branding=DEFAULT_BRANDING):
+    """Render the full presentation PDF to bytes"""
+    buffer = BytesIO()
+    write_presentation_pdf(buffer, registry, videos, today, branding)
+    return buffer.getvalue()
+
+
+# --- Two-page flyer ------------------------------------------------------------
+
+def _labeled(items):
+    return [f"<b>{escape(_plain(item['label']))}:</b> {escape(_plain(item['text']))}" for item in items]
+
+
+def _career_cells(careers, color):
+    cells = []
+    for career in careers:
+        lines = [f'<font color="{color}"><b>{escape(_plain(career["title"]))}</b></font>']
+        lines += [f"• {escape(_plain(point))}" for point in career["points"]]
+        cells.append(_p("<br/>".join(lines), "small"))
+    return cells
+
+
+def _section(flowables):
+    return [_box(flowables, LIGHT_BOX, padding=8), Spacer(1, 8)]
+
+
+def _flyer_sides(flyer, today):
+    """The flyer's front and back page stories"""
+    story = [
+        _p(escape(_plain(flyer["title"])), "h1"),
+        _p(escape(_plain(flyer["subtitle"])), "h2c"),
+        _p(f"<b>{escape(_plain(flyer['tagline']))}</b>", "center"),
+        _p(escape(today), "credit"),
+        _p("<br/>".join(escape(line) for line in flyer["front_credit"]), "credit"),
+        Spacer(1, 8),
+    ]
+    story += _section([_p(escape(_plain(flyer["benefits_heading"])), "h2")] + _bullets(_labeled(flyer["benefits"]), "small_bullet"))
+    story += _section([_p(escape(_plain(flyer["front_careers_heading"])), "h2"), _grid(_career_cells(flyer["front_careers"], "#667eea"))])
+    story += _section([_p(escape(_plain(flyer["methods_heading"])), "h2")] + _bullets(_labeled(flyer["methods"]), "small_bullet"))
+    story.append(_p(f"<b>Questions?</b> {escape(_plain(flyer['contact']))}", "center"))
+
+    front, story = story, [
+        _p(escape(_plain(flyer["back_title"])), "h1"),
+        _p("<br/>".join(escape(line) for line in flyer["back_credit"]), "credit"),
+        Spacer(1, 8),
+    ]
+    story += _section([_p(escape(_plain(flyer["back_careers_heading"])), "h2"), _grid(_career_cells(flyer["back_careers"], "#764ba2"))])
+    story += _section(
+        [_p(escape(_plain(flyer["case_studies_heading"])), "h2"), _p(escape(flyer["case_studies_intro"]), "small")]
+        + _bullets(_labeled(flyer["case_studies"]), "small_bullet")
+    )
+    majors = [_p("<br/>".join(f"• {escape(item)}" for item in column), "small") for column in flyer["majors"]]
+    story += _section([_p(escape(_plain(flyer["majors_heading"])), "h2"), _grid(majors, columns=len(majors))])
+    steps = [
+        Paragraph(escape(step), STYLES["small_bullet"], bulletText=f"{number}.")
+        for number, step in enumerate(flyer["steps"], start=1)
+    ]
+    story += _section([_p(escape(_plain(flyer["steps_heading"])), "h2"), _p(f"<b>{escape(flyer['steps_intro'])}</b>", "small")] + steps)
+    headline, credit = flyer["closing_credit"]
+    story += [
+        _p(f'<font color="#667eea"><b>{escape(_plain(flyer["call_to_action"]))}</b></font>', "center"),
+        _p(f"<i>{escape(flyer['quote'])}</i>", "center"),
+        _p(f"<b>{escape(headline)}</b><br/>{escape(credit)}", "credit"),
+    ]
+    return front, story
+
+
+def write_flyer_pdf(out, flyer, today, branding=DEFAULT_BRANDING):
+    """Write the two-page flyer as a PDF to out (a path or binary file object)
+
+    flyer is expected to be rebranded already (branding.rebrand); branding
+    only supplies the document metadata and page footer.
+    """
+    front, back = _flyer_sides(flyer, today)
+    _build(out, front + [PageBreak()] + back, "AP Statistics Flyer", branding.headline, branding.teacher)
+
+
+def render_flyer_pdf(flyer, today, branding=DEFAULT_BRANDING):
+    """Render the two-page flyer PDF to bytes"""
+    buffer = BytesIO()
+    write_flyer_pdf(buffer, flyer, today, branding)
+    return buffer.getvalue()
+
+
+# --- Mail-merged flyers ----------------------------------------------------------
+
+# Space kept free at the top of the front page for the student's block
+STUDENT_BLOCK_HEIGHT = 1.4 * inch
+
+
+class FlyerMerge:
+    """Personalized copies of the flyer written one after another into a single PDF
+
+    The flyer is laid out once, each page into a form XObject stored once in
+    the file. A student's pages draw those forms plus the student's block and
+    footer, so adding a copy costs a few small flowables rather than a full
+    layout. reportlab keeps finished pages in memory until close(); that is
+    the page content streams only, about 14 KB per student.
+    """
+
+    def __init__(self, out, flyer, today, branding=DEFAULT_BRANDING):
+        self.canvas = Canvas(out, pagesize=letter)
+        self.canvas.setTitle("AP Statistics Flyer")
+        self.canvas.setAuthor(branding.teacher)
+        self.count = 0
+        self.pages = self._lay_out(*_flyer_sides(flyer, today))
+
+    def _lay_out(self, front, back):
+        """Draw the flyer into one form per page; returns [(form name, has student block)]"""
+        width, height = letter
+        pages = []
+        for story, reserved in ((front, STUDENT_BLOCK_HEIGHT), (back, 0)):
+            story = list(story)
+            while story:
+                name = f"flyer{len(pages)}"
+                self.canvas.beginForm(name)
+                _draw_band(self.canvas, width, height)
+                frame = Frame(MARGIN, MARGIN, width - 2 * MARGIN, height - 2 * MARGIN - reserved)
+                remaining = len(story)
+                frame.addFromList(story, self.canvas)
+                self.canvas.endForm()
+                if len(story) == remaining:
+                    raise ValueError("a flyer section is too tall for one page")
+                pages.append((name, bool(reserved)))
+                reserved = 0
+        return pages
+
+    def _student_block(self, name, homeroom, careers):
+        width, height = letter
+        lines = [_p(f"Prepared for <b>{escape(_plain(name))}</b> | Homeroom {escape(_plain(homeroom))}", "h3")]
+        lines += _bullets([f"<b>{escape(_plain(title))}:</b> {escape(_plain(description))}"
+                           for title, description in careers], "small_bullet")
+        block = KeepInFrame(0, 0, [_box(lines, BLUE_BOX, border=PRIMARY, padding=6)], mode="shrink")
+        frame = Frame(MARGIN, height - MARGIN - STUDENT_BLOCK_HEIGHT, width - 2 * MARGIN, STUDENT_BLOCK_HEIGHT)
+        frame.addFromList([block], self.canvas)
+
+    def add(self, name, homeroom, careers):
+        """Append one student's copy; careers is a list of (title, description)"""
+        width, _ = letter
+        for number, (form, has_block) in enumerate(self.pages, start=1):
+            self.canvas.doForm(form)
+            if has_block:
+                self._student_block(name, homeroom, careers)
+            _draw_footer(self.canvas, width, f"Page {number} | {_plain(name)}, Homeroom {_plain(homeroom)}")
+            self.canvas.showPage()
+        self.count += 1
+
+    def close(self):
+        """Finish the PDF and write it out"""
+        self.canvas.save()
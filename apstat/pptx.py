@@ -0,0 +1,454 @@
+"""Native PowerPoint (.pptx) export of the deck
+
+Writes the OOXML package directly from the slide registry: one slide per
+record laid out like the app (gradient title and closing slides, a gradient
+title band with example boxes on intro and career slides), using the theme
+colors #667eea/#764ba2, with case study links as real hyperlinks. Every
+shape is an ordinary editable text box, so teachers can adapt the deck in
+PowerPoint or Google Slides.
+
+The package is streamed into a zipfile as it is generated, one part at a
+time, so it can be written to a file, a BytesIO or an unseekable stream.
+No third-party packages are needed.
+"""
+import re
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape, quoteattr
+
+from apstat.branding import DEFAULT_BRANDING
+
+PRIMARY = "667EEA"
+SECONDARY = "764BA2"
+WHITE = "FFFFFF"
+TEXT = "333333"
+LIGHT_BOX = "F8F9FA"
+BLUE_BOX = "E7F3FF"
+RESOURCE_BOX = "F0F7FF"
+LINK = "1A4FD6"
+
+# 16:9 slide in EMU (914400 per inch)
+EMU_PER_INCH = 914400
+SLIDE_WIDTH = 12192000
+SLIDE_HEIGHT = 6858000
+MARGIN = 0.5
+BAND_HEIGHT = 1.1
+
+NAMESPACES = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+)
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPE_PREFIX = "application/vnd.openxmlformats-officedocument.presentationml"
+
+_HIGHLIGHT = re.compile(r"<span class='highlight'>(.*?)</span>")
+_SPACE = re.compile(r"\s+")
+
+
+def _emu(inches):
+    return int(round(inches * EMU_PER_INCH))
+
+
+def _text(text):
+    # Runs keep their edge spaces: they separate a run from its neighbours
+    return escape(_SPACE.sub(" ", text))
+
+
+# --- Text -------------------------------------------------------------------------
+
+class Run:
+    """A run of text with its character formatting"""
+
+    __slots__ = ("text", "size", "color", "bold", "italic", "link")
+
+    def __init__(self, text, size=18, color=TEXT, bold=False, italic=False, link=None):
+        self.text = text
+        self.size = size
+        self.color = color
+        self.bold = bold
+        self.italic = italic
+        self.link = link
+
+    def xml(self, rels):
+        attributes = f'lang="en-US" sz="{int(self.size * 100)}" b="{int(self.bold)}" i="{int(self.italic)}" dirty="0"'
+        color = LINK if self.link else self.color
+        link = f'<a:hlinkClick r:id="{rels.hyperlink(self.link)}"/>' if self.link else ""
+        return (
+            f'<a:r><a:rPr {attributes}><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+            f'<a:latin typeface="+mn-lt"/>{link}</a:rPr><a:t>{_text(self.text)}</a:t></a:r>'
+        )
+
+
+def _rich(text, size, color=TEXT):
+    """Runs for slide text, showing its highlight spans in bold secondary color"""
+    runs = []
+    for number, part in enumerate(_HIGHLIGHT.split(text)):
+        if part:
+            highlighted = number % 2 == 1
+            runs.append(Run(part, size, SECONDARY if highlighted else color, bold=highlighted))
+    return runs
+
+
+def _paragraph(runs, rels, align="l", bullet=False, space_after=6):
+    bullet_xml = (
+        '<a:buFont typeface="Arial"/><a:buChar char="•"/>' if bullet else "<a:buNone/>"
+    )
+    indent = ' marL="285750" indent="-285750"' if bullet else ""
+    return (
+        f'<a:p><a:pPr algn="{align}"{indent}><a:spcAft><a:spcPts val="{space_after * 100}"/></a:spcAft>'
+        f'{bullet_xml}</a:pPr>{"".join(run.xml(rels) for run in runs)}</a:p>'
+    )
+
+
+# --- Shapes -----------------------------------------------------------------------
+
+def _solid(color):
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def _gradient(angle=45):
+    """The theme gradient (#667eea to #764ba2), like the app's 135deg CSS gradient"""
+    return (
+        f'<a:gradFill rotWithShape="1"><a:gsLst>'
+        f'<a:gs pos="0"><a:srgbClr val="{PRIMARY}"/></a:gs>'
+        f'<a:gs pos="100000"><a:srgbClr val="{SECONDARY}"/></a:gs>'
+        f'</a:gsLst><a:lin ang="{angle * 60000}" scaled="0"/></a:gradFill>'
+    )
+
+
+class SlideWriter:
+    """Collects the shapes and hyperlink relationships of one slide"""
+
+    def __init__(self, background=None):
+        self.background = background
+        self.shapes = []
+        self.links = {}
+
+    def hyperlink(self, url):
+        """Relationship id for an external hyperlink (rId1 is the layout)"""
+        return self.links.setdefault(url, f"rId{len(self.links) + 2}")
+
+    def box(self, x, y, width, height, paragraphs, fill=None, line=None, geometry="rect", anchor="t", inset=0.12):
+        """Add a text box; paragraphs are (runs, options) pairs, positions are in inches
+
+        fill is an RGB hex color or a ready-made fill element such as _gradient().
+        """
+        shape_id = len(self.shapes) + 2
+        fill_xml = fill if fill and fill.startswith("<") else (_solid(fill) if fill else "<a:noFill/>")
+        line_xml = f'<a:ln w="19050">{_solid(line)}</a:ln>' if line else "<a:ln><a:noFill/></a:ln>"
+        body = "".join(_paragraph(runs, self, **options) for runs, options in paragraphs) or "<a:p/>"
+        inset_emu = _emu(inset)
+        self.shapes.append(
+            f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Text {shape_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr><a:xfrm><a:off x="{_emu(x)}" y="{_emu(y)}"/><a:ext cx="{_emu(width)}" cy="{_emu(height)}"/></a:xfrm>'
+            f'<a:prstGeom prst="{geometry}"><a:avLst/></a:prstGeom>{fill_xml}{line_xml}</p:spPr>'
+            f'<p:txBody><a:bodyPr wrap="square" lIns="{inset_emu}" tIns="{inset_emu}" rIns="{inset_emu}" bIns="{inset_emu}" '
+            f'anchor="{anchor}"><a:normAutofit/></a:bodyPr><a:lstStyle/>{body}</p:txBody></p:sp>'
+        )
+
+    def title_band(self, title):
+        self.box(0, 0, SLIDE_WIDTH / EMU_PER_INCH, BAND_HEIGHT, [([Run(title, 36, WHITE, bold=True)], {"align": "ctr"})],
+                 fill=_gradient(), anchor="ctr")
+
+    def xml(self):
+        background = f"<p:bg><p:bgPr>{self.background}<a:effectLst/></p:bgPr></p:bg>" if self.background else ""
+        return (
+            f"{XML_HEADER}<p:sld {NAMESPACES}><p:cSld>{background}<p:spTree>{_GROUP_PROPERTIES}"
+            f'{"".join(self.shapes)}</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+        )
+
+    def rels_xml(self):
+        rels = [f'<Relationship Id="rId1" Type="{REL_NS}/slideLayout" Target="../slideLayouts/slideLayout1.xml"/>']
+        rels += [
+            f'<Relationship Id="{rel_id}" Type="{REL_NS}/hyperlink" Target={quoteattr(url)} TargetMode="External"/>'
+            for url, rel_id in self.links.items()
+        ]
+        return f'{XML_HEADER}<Relationships xmlns="{PACKAGE_REL_NS}">{"".join(rels)}</Relationships>'
+
+
+_GROUP_PROPERTIES = (
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+    '<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+)
+
+CONTENT_WIDTH = SLIDE_WIDTH / EMU_PER_INCH - 2 * MARGIN
+
+
+# --- Slide layouts ----------------------------------------------------------------
+
+def _title_slide(record, videos, today, branding):
+    slide = record.slide
+    deck = SlideWriter(background=_gradient())
+    deck.box(MARGIN, 1.5, CONTENT_WIDTH, 1.3, [([Run(slide["title"], 54, WHITE, bold=True)], {"align": "ctr"})], anchor="b")
+    deck.box(MARGIN, 2.9, CONTENT_WIDTH, 0.8, [([Run(slide["subtitle"], 30, WHITE)], {"align": "ctr"})])
+    deck.box(1.5, 4.0, CONTENT_WIDTH - 2, 1.0, [([Run(slide["content"], 24, SECONDARY, bold=True)], {"align": "ctr"})],
+             fill=WHITE, geometry="roundRect", anchor="ctr")
+    deck.box(MARGIN, 5.9, CONTENT_WIDTH, 1.0, [
+        ([Run(branding.headline, 16, WHITE, bold=True)], {"align": "ctr", "space_after": 2}),
+        ([Run(f"{branding.credit} · {today}", 14, WHITE, italic=True)], {"align": "ctr"}),
+    ])
+    return deck
+
+
+def _intro_slide(record, videos, today, branding):
+    content = record.slide["content"]
+    deck = SlideWriter()
+    deck.title_band(record.slide["title"])
+    half = (CONTENT_WIDTH - 0.3) / 2
+    benefits = [([Run("College & Career Benefits", 22, SECONDARY, bold=True)], {})]
+    benefits += [(_rich(benefit, 16), {"bullet": True}) for benefit in content["benefits"]]
+    deck.box(MARGIN, 1.4, half, 4.4, benefits, fill=BLUE_BOX, geometry="roundRect")
+    applications = [
+        ([Run("Real-World Applications", 22, SECONDARY, bold=True)], {}),
+        (_rich(content["applications"], 16), {}),
+    ]
+    deck.box(MARGIN + half + 0.3, 1.4, half, 4.4, applications, fill=BLUE_BOX, geometry="roundRect")
+    resources = [
+        ([Run("General resources: ", 12, PRIMARY, bold=True),
+          Run("Khan Academy AP Statistics · College Board AP Statistics · American Statistical Association", 12)], {}),
+    ]
+    deck.box(MARGIN, 6.05, CONTENT_WIDTH, 0.8, resources, fill=RESOURCE_BOX, geometry="roundRect", anchor="ctr")
+    return deck
+
+
+def _career_slide(record, videos, today, branding):
+    slide = record.slide
+    deck = SlideWriter()
+    deck.title_band(slide["title"])
+    deck.box(MARGIN, 1.2, CONTENT_WIDTH, 0.6, [([Run(slide["content"]["description"], 24, SECONDARY, bold=True)], {"align": "ctr"})])
+
+    examples = slide["content"]["examples"]
+    gap = 0.3
+    width = (CONTENT_WIDTH - gap * (len(examples) - 1)) / max(len(examples), 1)
+    for number, example in enumerate(examples):
+        deck.box(MARGIN + number * (width + gap), 1.9, width, 3.3, [
+            ([Run(example["title"], 18, TEXT, bold=True)], {}),
+            (_rich(example["content"], 14), {}),
+        ], fill=LIGHT_BOX, line=PRIMARY, geometry="roundRect")
+
+    resources = []
+    if record.case_studies:
+        resources.append(([Run(f"Case Studies in {record.career}", 13, PRIMARY, bold=True)], {"space_after": 2}))
+        resources += [
+            ([Run(study["title"], 11, link=study["url"]), Run(f" - {study['description']}", 11)], {"bullet": True, "space_after": 1})
+            for study in record.case_studies
+        ]
+    keywords = record.keywords[:3] or (f"statistics in {record.career}",)
+    resources.append(([Run("Search YouTube for: ", 11, PRIMARY, bold=True),
+                       Run(" · ".join(f'"{keyword}"' for keyword in keywords), 11)], {"space_after": 0}))
+    deck.box(MARGIN, 5.35, CONTENT_WIDTH, 1.95, resources, fill=RESOURCE_BOX, geometry="roundRect")
+    return deck
+
+
+def _closing_slide(record, videos, today, branding):
+    content = record.slide["content"]
+    deck = SlideWriter(background=_gradient())
+    deck.box(MARGIN, 0.5, CONTENT_WIDTH, 1.1, [([Run(record.slide["title"], 44, WHITE, bold=True)], {"align": "ctr"})], anchor="ctr")
+    points = [([Run(point, 24, WHITE)], {"align": "ctr"}) for point in content["points"]]
+    deck.box(MARGIN, 1.8, CONTENT_WIDTH, 2.4, points)
+    deck.box(1.5, 4.4, CONTENT_WIDTH - 2, 1.0, [([Run(content["call_to_action"], 22, SECONDARY, bold=True)], {"align": "ctr"})],
+             fill=WHITE, geometry="roundRect", anchor="ctr")
+    deck.box(MARGIN, 5.7, CONTENT_WIDTH, 1.2, [
+        ([Run(content["contact"], 16, WHITE)], {"align": "ctr", "space_after": 4}),
+        ([Run(f"Compiled by {branding.credit}", 14, WHITE, italic=True)], {"align": "ctr"}),
+    ])
+    return deck
+
+
+SLIDE_BUILDERS = {
+    "title": _title_slide,
+    "intro": _intro_slide,
+    "career": _career_slide,
+    "closing": _closing_slide,
+}
+
+
+# --- Package parts ----------------------------------------------------------------
+
+def _content_types(slide_count):
+    overrides = [
+        ("/ppt/presentation.xml", f"{CONTENT_TYPE_PREFIX}.presentation.main+xml"),
+        ("/ppt/slideMasters/slideMaster1.xml", f"{CONTENT_TYPE_PREFIX}.slideMaster+xml"),
+        ("/ppt/slideLayouts/slideLayout1.xml", f"{CONTENT_TYPE_PREFIX}.slideLayout+xml"),
+        ("/ppt/theme/theme1.xml", "application/vnd.openxmlformats-officedocument.theme+xml"),
+        ("/ppt/presProps.xml", f"{CONTENT_TYPE_PREFIX}.presProps+xml"),
+        ("/ppt/viewProps.xml", f"{CONTENT_TYPE_PREFIX}.viewProps+xml"),
+        ("/ppt/tableStyles.xml", f"{CONTENT_TYPE_PREFIX}.tableStyles+xml"),
+        ("/docProps/core.xml", "application/vnd.openxmlformats-package.core-properties+xml"),
+        ("/docProps/app.xml", "application/vnd.openxmlformats-officedocument.extended-properties+xml"),
+    ]
+    overrides += [(f"/ppt/slides/slide{number}.xml", f"{CONTENT_TYPE_PREFIX}.slide+xml") for number in range(1, slide_count + 1)]
+    return (
+        f'{XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        + "".join(f'<Override PartName="{name}" ContentType="{kind}"/>' for name, kind in overrides)
+        + "</Types>"
+    )
+
+
+def _relationships(rels):
+    body = "".join(f'<Relationship Id="{rel_id}" Type="{kind}" Target="{target}"/>' for rel_id, kind, target in rels)
+    return f'{XML_HEADER}<Relationships xmlns="{PACKAGE_REL_NS}">{body}</Relationships>'
+
+
+PACKAGE_RELS = _relationships([
+    ("rId1", f"{REL_NS}/officeDocument", "ppt/presentation.xml"),
+    ("rId2", "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties", "docProps/core.xml"),
+    ("rId3", f"{REL_NS}/extended-properties", "docProps/app.xml"),
+])
+
+
+def _core_properties(title, creator):
+    return (
+        f'{XML_HEADER}<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<dc:title>{escape(title)}</dc:title><dc:creator>{escape(creator)}</dc:creator></cp:coreProperties>"
+    )
+
+
+def _app_properties(slide_count):
+    return (
+        f'{XML_HEADER}<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+        f"<Application>apstat</Application><Slides>{slide_count}</Slides></Properties>"
+    )
+
+
+def _presentation(slide_count):
+    slides = "".join(f'<p:sldId id="{255 + number}" r:id="rId{number + 1}"/>' for number in range(1, slide_count + 1))
+    return (
+        f'{XML_HEADER}<p:presentation {NAMESPACES} saveSubsetFonts="1">'
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+        f'<p:sldIdLst>{slides}</p:sldIdLst>'
+        f'<p:sldSz cx="{SLIDE_WIDTH}" cy="{SLIDE_HEIGHT}"/><p:notesSz cx="6858000" cy="9144000"/>'
+        "</p:presentation>"
+    )
+
+
+def _presentation_rels(slide_count):
+    rels = [("rId1", f"{REL_NS}/slideMaster", "slideMasters/slideMaster1.xml")]
+    rels += [(f"rId{number + 1}", f"{REL_NS}/slide", f"slides/slide{number}.xml") for number in range(1, slide_count + 1)]
+    extra = slide_count + 2
+    rels += [
+        (f"rId{extra}", f"{REL_NS}/theme", "theme/theme1.xml"),
+        (f"rId{extra + 1}", f"{REL_NS}/presProps", "presProps.xml"),
+        (f"rId{extra + 2}", f"{REL_NS}/viewProps", "viewProps.xml"),
+        (f"rId{extra + 3}", f"{REL_NS}/tableStyles", "tableStyles.xml"),
+    ]
+    return _relationships(rels)
+
+
+SLIDE_MASTER = (
+    f"{XML_HEADER}<p:sldMaster {NAMESPACES}><p:cSld>"
+    '<p:bg><p:bgRef idx="1001"><a:schemeClr val="bg1"/></p:bgRef></p:bg>'
+    f"<p:spTree>{_GROUP_PROPERTIES}</p:spTree></p:cSld>"
+    '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" accent2="accent2" accent3="accent3" '
+    'accent4="accent4" accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+    '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst>'
+    "</p:sldMaster>"
+)
+
+SLIDE_MASTER_RELS = _relationships([
+    ("rId1", f"{REL_NS}/slideLayout", "../slideLayouts/slideLayout1.xml"),
+    ("rId2", f"{REL_NS}/theme", "../theme/theme1.xml"),
+])
+
+SLIDE_LAYOUT = (
+    f'{XML_HEADER}<p:sldLayout {NAMESPACES} type="blank" preserve="1"><p:cSld name="Blank">'
+    f"<p:spTree>{_GROUP_PROPERTIES}</p:spTree></p:cSld>"
+    "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>"
+)
+
+SLIDE_LAYOUT_RELS = _relationships([("rId1", f"{REL_NS}/slideMaster", "../slideMasters/slideMaster1.xml")])
+
+
+def _theme():
+    colors = (
+        ("dk1", '<a:sysClr val="windowText" lastClr="000000"/>'),
+        ("lt1", '<a:sysClr val="window" lastClr="FFFFFF"/>'),
+        ("dk2", f'<a:srgbClr val="{TEXT}"/>'),
+        ("lt2", f'<a:srgbClr val="{LIGHT_BOX}"/>'),
+        ("accent1", f'<a:srgbClr val="{PRIMARY}"/>'),
+        ("accent2", f'<a:srgbClr val="{SECONDARY}"/>'),
+        ("accent3", '<a:srgbClr val="FF9800"/>'),
+        ("accent4", '<a:srgbClr val="4CAF50"/>'),
+        ("accent5", f'<a:srgbClr val="{BLUE_BOX}"/>'),
+        ("accent6", '<a:srgbClr val="FFF3CD"/>'),
+        ("hlink", f'<a:srgbClr val="{LINK}"/>'),
+        ("folHlink", f'<a:srgbClr val="{SECONDARY}"/>'),
+    )
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="6350">{fill}</a:ln>'
+    font = '<a:latin typeface="{}"/><a:ea typeface=""/><a:cs typeface=""/>'
+    return (
+        f'{XML_HEADER}<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" name="AP Statistics">'
+        '<a:themeElements><a:clrScheme name="AP Statistics">'
+        + "".join(f"<a:{name}>{value}</a:{name}>" for name, value in colors)
+        + '</a:clrScheme><a:fontScheme name="AP Statistics">'
+        f'<a:majorFont>{font.format("Calibri Light")}</a:majorFont><a:minorFont>{font.format("Calibri")}</a:minorFont>'
+        '</a:fontScheme><a:fmtScheme name="AP Statistics">'
+        f"<a:fillStyleLst>{fill * 3}</a:fillStyleLst><a:lnStyleLst>{line * 3}</a:lnStyleLst>"
+        f'<a:effectStyleLst>{"<a:effectStyle><a:effectLst/></a:effectStyle>" * 3}</a:effectStyleLst>'
+        f"<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst>"
+        "</a:fmtScheme></a:themeElements><a:objectDefaults/><a:extraClrSchemeLst/></a:theme>"
+    )
+
+
+PRES_PROPS = f"{XML_HEADER}<p:presentationPr {NAMESPACES}/>"
+VIEW_PROPS = f"{XML_HEADER}<p:viewPr {NAMESPACES}/>"
+TABLE_STYLES = (
+    f'{XML_HEADER}<a:tblStyleLst xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'def="{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"/>'
+)
+
+
+# Fixed member timestamp, so the same deck always packs to the same bytes (and content hash)
+MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _add_member(package, name, data):
+    info = zipfile.ZipInfo(name, date_time=MEMBER_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    package.writestr(info, data)
+
+
+def write_presentation_pptx(out, registry, videos, today, branding=DEFAULT_BRANDING):
+    """Write the deck as a .pptx package to out (a path or binary file object)"""
+    records = [record for record in registry if record.type in SLIDE_BUILDERS]
+    count = len(records)
+    with zipfile.ZipFile(out, "w") as package:
+        for name, data in (
+            ("[Content_Types].xml", _content_types(count)),
+            ("_rels/.rels", PACKAGE_RELS),
+            ("docProps/core.xml", _core_properties(branding.headline, branding.teacher)),
+            ("docProps/app.xml", _app_properties(count)),
+            ("ppt/presentation.xml", _presentation(count)),
+            ("ppt/_rels/presentation.xml.rels", _presentation_rels(count)),
+            ("ppt/slideMasters/slideMaster1.xml", SLIDE_MASTER),
+            ("ppt/slideMasters/_rels/slideMaster1.xml.rels", SLIDE_MASTER_RELS),
+            ("ppt/slideLayouts/slideLayout1.xml", SLIDE_LAYOUT),
+            ("ppt/slideLayouts/_rels/slideLayout1.xml.rels", SLIDE_LAYOUT_RELS),
+            ("ppt/theme/theme1.xml", _theme()),
+            ("ppt/presProps.xml", PRES_PROPS),
+            ("ppt/viewProps.xml", VIEW_PROPS),
+            ("ppt/tableStyles.xml", TABLE_STYLES),
+        ):
+            _add_member(package, name, data)
+
+        # Slides are built and compressed one at a time
+        for number, record in enumerate(records, start=1):
+            slide = SLIDE_BUILDERS[record.type](record, videos, today, branding)
+            _add_member(package, f"ppt/slides/slide{number}.xml", slide.xml())
+            _add_member(package, f"ppt/slides/_rels/slide{number}.xml.rels", slide.rels_xml())
+
+
+def render_presentation_pptx(registry, videos, today, branding=DEFAULT_BRANDING):
+    """Render the deck as .pptx bytes"""
+    buffer = BytesIO()
+    write_presentation_pptx(buffer, registry, videos, today, branding)
+    return buffer.getvalue()
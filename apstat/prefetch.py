@@ -0,0 +1,94 @@
+"""Background warming of the render cache
+
+When a slide is shown the app asks for its neighbours too, so Next/Previous
+find their HTML already rendered. Warming runs on one background thread
+per process; the render cache's per-key locking makes a foreground request that
+races a warm-up wait for it instead of rendering the same slide twice.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from apstat.cache import render_cache
+
+
+def _get_or_render(cache, key, render, tags):
+    """cache.get_or_render() that also reports whether this call did the rendering"""
+    rendered = []
+
+    def tracked_render():
+        rendered.append(True)
+        return render()
+
+    return cache.get_or_render(key, tracked_render, tags=tags), bool(rendered)
+
+
+class Prefetcher:
+    """Looks values up in a RenderCache and warms others in the background"""
+
+    def __init__(self, cache, max_workers=1):
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+        self.warmed = 0
+        self.already_warm = 0
+        self.warm_seconds = 0.0
+        self.last_warm_seconds = 0.0
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="apstat-prefetch")
+
+    def get(self, key, render, tags=()):
+        """Return the value for key, counting whether it was already cached"""
+        value, rendered = _get_or_render(self.cache, key, render, tags)
+        with self._lock:
+            if rendered:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def prefetch(self, jobs):
+        """Warm (key, render, tags) jobs in the background; keys already queued are skipped"""
+        for key, render, tags in jobs:
+            with self._lock:
+                if key in self._pending:
+                    continue
+                self._pending.add(key)
+            self._executor.submit(self._warm, key, render, tags)
+
+    def _warm(self, key, render, tags):
+        start = time.perf_counter()
+        rendered = False
+        try:
+            _, rendered = _get_or_render(self.cache, key, render, tags)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._pending.discard(key)
+                if rendered:
+                    self.warmed += 1
+                    self.warm_seconds += elapsed
+                    self.last_warm_seconds = elapsed
+                else:
+                    self.already_warm += 1
+
+    def stats(self):
+        """Return a snapshot of the foreground hit rate and background warm-up times"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "pending": len(self._pending),
+                "warmed": self.warmed,
+                "already_warm": self.already_warm,
+                "warm_ms_total": self.warm_seconds * 1000,
+                "warm_ms_avg": self.warm_seconds * 1000 / self.warmed if self.warmed else 0.0,
+                "warm_ms_last": self.last_warm_seconds * 1000,
+            }
+
+
+# One prefetcher for the whole server process, warming the shared render cache
+slide_prefetcher = Prefetcher(render_cache)
@@ -0,0 +1,261 @@
+"""Printable full-presentation renderer built on compiled per-slide templates"""
+from html import escape
+
+from apstat.branding import DEFAULT_BRANDING
+from apstat.styles import stylesheet_bundle
+from apstat.templates import Template, render_each
+
+
+DOCUMENT_HEAD = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AP Statistics Full Presentation</title>
+    <style>
+{style}    </style>
+</head>
+<body>
+
+<div class="print-header">
+    <h1>AP Statistics Career Presentation</h1>
+    <p><strong>{headline}</strong></p>
+    <small>Generated on {today} | All content expanded for printing</small>
+    <div class="teacher-credit">
+        {compiled_by}<br>
+        {position}
+    </div>
+</div>""")
+
+DOCUMENT_TAIL = """
+    </body>
+    </html>
+    """
+
+SLIDE_OPEN = '<div class="slide">\n'
+
+SLIDE_FOOTER = Template("""
+        <div class="footer">
+            <div class="page-number"></div>
+            <div>Slide {number} of {total} | AP Statistics Career Presentation</div>
+        </div>
+        </div>
+        """)
+
+LIST_ITEM = Template("<li>{item}</li>\n")
+QUOTED_ITEM = Template('<li>"{item}"</li>\n')
+
+TITLE_SLIDE = Template("""
+            <h1>{title}</h1>
+            <h2 style="text-align: center; color: #764ba2;">{subtitle}</h2>
+            <div style="text-align: center; margin-top: 100px; font-size: 16pt;">
+                {content}
+            </div>
+            <div class="teacher-credit">
+                {headline}<br>
+                {credit}
+            </div>
+            """)
+
+INTRO_SLIDE_HEAD = Template("""
+            <h1>{title}</h1>
+            
+            <div class="highlight-box">
+                <h2>College & Career Benefits</h2>
+                <ul class="benefit-list">
+            """)
+
+INTRO_SLIDE_TAIL = Template("""
+                </ul>
+            </div>
+            
+            <div class="highlight-box">
+                <h2>Real-World Applications</h2>
+                <p>{applications}</p>
+            </div>
+            
+            <div class="resources">
+                <h4>📚 General Resources for AP Statistics:</h4>
+                <ul>
+                    <li><strong>YouTube Search:</strong> "Introduction to Statistics" or "AP Statistics course"</li>
+                    <li><strong>Khan Academy AP Statistics:</strong> Free video lessons and practice problems</li>
+                    <li><strong>College Board AP Statistics:</strong> Official course information and resources</li>
+                    <li><strong>American Statistical Association:</strong> Career information and case studies</li>
+                </ul>
+            </div>
+            """)
+
+CAREER_SLIDE_HEAD = Template("""
+            <h1>{title}</h1>
+            
+            <div class="career-title">
+                <h2>{description}</h2>
+            </div>
+            """)
+
+CAREER_EXAMPLE = Template("""
+                <div class="example">
+                    <h3>{title}</h3>
+                    <p>{content}</p>
+                </div>
+                """)
+
+CASE_STUDIES_HEAD = Template("""
+                <div class="resources">
+                    <h4>📄 Case Studies in {career_name}:</h4>
+                    <ul>
+                """)
+
+CASE_STUDY_ITEM = Template('<li><a href="{url}">{title}</a>: {description}</li>\n')
+
+CASE_STUDIES_TAIL = """
+                    </ul>
+                </div>
+                """
+
+VIDEO_SEARCH_HEAD = Template("""
+            <div class="resources">
+                <h4>📺 Find Videos About {career_name}:</h4>
+                <p><strong>Search YouTube for:</strong></p>
+                <ul>
+            """)
+
+VIDEO_SEARCH_MIDDLE = """
+                </ul>
+                <p><strong>Guaranteed working videos:</strong></p>
+                <ul>
+            """
+
+VIDEO_ITEM = Template('<li><a href="{url}">{title}</a></li>\n')
+
+VIDEO_SEARCH_TAIL = """
+                </ul>
+            </div>
+            """
+
+CLOSING_SLIDE_HEAD = Template("""
+            <h1>{title}</h1>
+            
+            <div style="text-align: center; margin: 50px 0;">
+            """)
+
+CLOSING_POINT = Template('<p style="font-size: 14pt; margin: 15px 0;">{item}</p>\n')
+
+CLOSING_SLIDE_TAIL = Template("""
+            </div>
+            
+            <div class="highlight-box" style="text-align: center; padding: 30px;">
+                <p style="font-size: 16pt; font-weight: bold;">{call_to_action}</p>
+            </div>
+            
+            <div style="text-align: center; margin-top: 50px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
+                <h3>Next Steps</h3>
+                <p style="font-size: 12pt;">{contact}</p>
+                <p style="margin-top: 15px; font-size: 11pt;">
+                    <strong>Video Resources:</strong><br>
+                    • Search YouTube: "AP Statistics introduction"<br>
+                    • Khan Academy: Free AP Statistics course<br>
+                    • College Board: Official AP Statistics resources
+                </p>
+            </div>
+            
+            <div class="teacher-credit">
+                <strong>{headline}</strong><br>
+                Compiled by {credit}
+            </div>
+            """)
+
+
+def render_title_slide(write, record, branding, **context):
+    slide = record.slide
+    TITLE_SLIDE.render_into(
+        write,
+        title=slide["title"],
+        subtitle=slide["subtitle"],
+        content=slide["content"],
+        headline=escape(branding.headline),
+        credit=escape(branding.credit),
+    )
+
+
+def render_intro_slide(write, record, **context):
+    slide = record.slide
+    INTRO_SLIDE_HEAD.render_into(write, title=slide["title"])
+    render_each(write, LIST_ITEM, slide["content"]["benefits"])
+    INTRO_SLIDE_TAIL.render_into(write, applications=slide["content"]["applications"])
+
+
+def render_career_slide(write, record, videos, **context):
+    slide = record.slide
+    career_name = record.career
+
+    CAREER_SLIDE_HEAD.render_into(write, title=slide["title"], description=slide["content"]["description"])
+    for example in slide["content"]["examples"]:
+        content = example["content"].replace("<span class='highlight'>", "<span class='stat-term'>")
+        CAREER_EXAMPLE.render_into(write, title=example["title"], content=content)
+
+    # Case studies for this career
+    if record.case_studies:
+        CASE_STUDIES_HEAD.render_into(write, career_name=career_name)
+        for study in record.case_studies:
+            CASE_STUDY_ITEM.render_into(write, **study)
+        write(CASE_STUDIES_TAIL)
+
+    # YouTube search tips
+    VIDEO_SEARCH_HEAD.render_into(write, career_name=career_name)
+    render_each(write, QUOTED_ITEM, record.keywords[:3] or [f"statistics in {career_name}"])
+    write(VIDEO_SEARCH_MIDDLE)
+    for video in videos.values():
+        VIDEO_ITEM.render_into(write, url=video["url"], title=video["title"])
+    write(VIDEO_SEARCH_TAIL)
+
+
+def render_closing_slide(write, record, branding, **context):
+    slide = record.slide
+    CLOSING_SLIDE_HEAD.render_into(write, title=slide["title"])
+    render_each(write, CLOSING_POINT, slide["content"]["points"])
+    CLOSING_SLIDE_TAIL.render_into(
+        write,
+        call_to_action=slide["content"]["call_to_action"],
+        contact=slide["content"]["contact"],
+        headline=escape(branding.headline),
+        credit=escape(branding.credit),
+    )
+
+
+# One renderer per slide layout
+SLIDE_RENDERERS = {
+    "title": render_title_slide,
+    "intro": render_intro_slide,
+    "career": render_career_slide,
+    "closing": render_closing_slide,
+}
+
+
+def write_presentation_html(write, registry, videos, today, branding=DEFAULT_BRANDING):
+    """Stream the complete printable presentation for a slide registry to write()"""
+    DOCUMENT_HEAD.render_into(
+        write,
+        style=stylesheet_bundle("presentation") + "\n",
+        today=today,
+        headline=escape(branding.headline),
+        compiled_by=escape(branding.compiled_by),
+        position=escape(branding.position),
+    )
+
+    total = len(registry)
+    for record in registry:
+        write(SLIDE_OPEN)
+        render = SLIDE_RENDERERS.get(record.type)
+        if render:
+            render(write, record, videos=videos, branding=branding)
+        SLIDE_FOOTER.render_into(write, number=record.index + 1, total=total)
+
+    write(DOCUMENT_TAIL)
+
+
+def render_presentation_html(registry, videos, today, branding=DEFAULT_BRANDING):
+    """Render the complete printable presentation to a single string"""
+    parts = []
+    write_presentation_html(parts.append, registry, videos, today, branding)
+    return "".join(parts)
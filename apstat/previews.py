@@ -0,0 +1,233 @@
+"""Offline link previews (thumbnail and site name) for the resource sections
+
+prefetch_previews() asks a fetcher for each link's metadata and image,
+resizes the image into static/thumbs under a name derived from its content
+(identical thumbnails are stored once, and a changed image gets a new name
+so browsers can cache them forever) and records the result in a JSON index.
+The app only reads that index through get_previews(), so link cards render
+from local disk; with a cold cache or no network they fall back to the
+plain links.
+
+A fetcher is any object with metadata(url) -> dict (title, site,
+image_url) and image(image_url) -> bytes. HTTPPreviewFetcher uses YouTube's
+oEmbed endpoint for videos and Open Graph tags for everything else.
+Refresh the cache with ``python -m apstat prefetch-previews``.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+from apstat.content import CONTENT_PATH
+
+PREVIEW_INDEX_PATH = os.path.join(os.path.dirname(CONTENT_PATH), "__pycache__", "previews.json")
+THUMBS_DIR = os.path.join(os.path.dirname(os.path.dirname(CONTENT_PATH)), "static", "thumbs")
+THUMBS_URL = "app/static/thumbs"
+THUMB_SIZE = (320, 180)
+PREVIEW_TTL = 7 * 24 * 60 * 60
+WORKERS = 8
+TIMEOUT = 10
+# Pages are read only far enough to find the <head> tags
+MAX_PAGE_BYTES = 256 * 1024
+USER_AGENT = "apstat-previews/1.0"
+
+
+class _OpenGraphParser(HTMLParser):
+    """Collects og:* meta tags and the <title> of a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.properties = {}
+        self.title = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta":
+            name = attrs.get("property") or attrs.get("name") or ""
+            if name.startswith("og:") and attrs.get("content"):
+                self.properties.setdefault(name, attrs["content"])
+        elif tag == "title":
+            self._in_title = True
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
+
+class HTTPPreviewFetcher:
+    """Fetches previews over HTTP: YouTube oEmbed for videos, Open Graph tags otherwise"""
+
+    def __init__(self, timeout=TIMEOUT):
+        import requests
+
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+
+    def metadata(self, url):
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        if host.endswith("youtube.com") or host.endswith("youtu.be"):
+            response = self.session.get(
+                "https://www.youtube.com/oembed",
+                params={"url": url, "format": "json"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            return {"title": data.get("title"), "site": data.get("author_name"), "image_url": data.get("thumbnail_url")}
+
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            page = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+        parser = _OpenGraphParser()
+        parser.feed(page.decode(response.encoding or "utf-8", errors="replace"))
+        image_url = parser.properties.get("og:image")
+        return {
+            "title": parser.properties.get("og:title") or parser.title.strip() or None,
+            "site": parser.properties.get("og:site_name") or host,
+            "image_url": urllib.parse.urljoin(url, image_url) if image_url else None,
+        }
+
+    def image(self, image_url):
+        response = self.session.get(image_url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+
+def make_thumbnail(data, size=THUMB_SIZE):
+    """Resize image bytes to fit size; returns JPEG bytes"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        image.thumbnail(size)
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=80, optimize=True, progressive=True)
+    return out.getvalue()
+
+
+def store_thumbnail(data, thumbs_dir=THUMBS_DIR):
+    """Write thumbnail bytes under a content-derived name (once); returns the file name"""
+    name = f"{hashlib.sha256(data).hexdigest()[:16]}.jpg"
+    path = os.path.join(thumbs_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(thumbs_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=thumbs_dir, prefix=".thumb.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return name
+
+
+def read_preview_index(path=PREVIEW_INDEX_PATH):
+    """Return the cached url -> preview mapping, or {} if there is none yet"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(index, path):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".previews.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _fetch_preview(fetcher, url, thumbs_dir, size):
+    metadata = fetcher.metadata(url)
+    thumbnail = None
+    if metadata.get("image_url"):
+        thumbnail = store_thumbnail(make_thumbnail(fetcher.image(metadata["image_url"]), size), thumbs_dir)
+    return {
+        "title": metadata.get("title"),
+        "site": metadata.get("site"),
+        "thumbnail": thumbnail,
+        "fetched_at": time.time(),
+    }
+
+
+def prefetch_previews(urls, fetcher=None, index_path=PREVIEW_INDEX_PATH, thumbs_dir=THUMBS_DIR,
+                      ttl=PREVIEW_TTL, force=False, workers=WORKERS, size=THUMB_SIZE):
+    """Fetch previews for urls missing from the index or older than ttl
+
+    A failed fetch keeps the previous entry, so a flaky network never makes
+    a card disappear. Thumbnails no longer referenced are deleted. Returns
+    (index, {url: error message}).
+    """
+    if fetcher is None:
+        fetcher = HTTPPreviewFetcher()
+    index = read_preview_index(index_path)
+    now = time.time()
+    stale = [
+        url for url in dict.fromkeys(urls)
+        if force or url not in index or now - index[url]["fetched_at"] >= ttl
+    ]
+
+    errors = {}
+    if stale:
+        def fetch(url):
+            try:
+                return url, _fetch_preview(fetcher, url, thumbs_dir, size), None
+            except Exception as exc:  # any fetcher failure only costs this one preview
+                return url, None, f"{type(exc).__name__}: {exc}"
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apstat-previews") as executor:
+            for url, preview, error in executor.map(fetch, stale):
+                if error:
+                    errors[url] = error
+                else:
+                    index[url] = preview
+        _write_index(index, index_path)
+
+    referenced = {preview["thumbnail"] for preview in index.values() if preview.get("thumbnail")}
+    if os.path.isdir(thumbs_dir):
+        for entry in os.scandir(thumbs_dir):
+            if entry.name.endswith(".jpg") and entry.name not in referenced:
+                os.unlink(entry.path)
+    return index, errors
+
+
+_lock = threading.Lock()
+_previews = (None, None, {})
+
+
+def get_previews(index_path=PREVIEW_INDEX_PATH, thumbs_dir=THUMBS_DIR):
+    """url -> {"site", "thumbnail_url"} for links with a thumbnail on disk
+
+    Re-read only when the index changes; never touches the network, and
+    returns {} when nothing has been prefetched.
+    """
+    global _previews
+
+    try:
+        version = (index_path, os.stat(index_path).st_mtime_ns)
+    except OSError:
+        return {}
+
+    if _previews[:2] == version:
+        return _previews[2]
+
+    with _lock:
+        if _previews[:2] != version:
+            previews = {}
+            for url, preview in read_preview_index(index_path).items():
+                thumbnail = preview.get("thumbnail")
+                if thumbnail and os.path.exists(os.path.join(thumbs_dir, thumbnail)):
+                    previews[url] = {"site": preview.get("site"), "thumbnail_url": f"{THUMBS_URL}/{thumbnail}"}
+            _previews = (*version, previews)
+        return _previews[2]
@@ -0,0 +1,70 @@
+"""Precomputed, read-only slide registry
+
+Each slide is resolved once per content version into a compact record
+holding its canonical career key and direct references to that career's
+case studies, search keywords and college schedule. The registry is shared
+by every session, and a slide that points at a missing entry fails when the
+content is loaded instead of silently rendering nothing.
+"""
+GENERAL_KEYWORDS = "general"
+
+
+class SlideRecord:
+    """Resolved view of one slide; attributes cannot be reassigned"""
+
+    __slots__ = ("index", "type", "title", "career", "case_studies", "keywords", "schedule", "slide")
+
+    def __init__(self, index, slide, career=None, case_studies=(), keywords=(), schedule=None):
+        for name, value in (
+            ("index", index),
+            ("type", slide["type"]),
+            ("title", slide["title"]),
+            ("career", career),
+            ("case_studies", tuple(case_studies)),
+            ("keywords", tuple(keywords)),
+            ("schedule", schedule),
+            ("slide", slide),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"SlideRecord is read-only (tried to set {name!r})")
+
+    def __repr__(self):
+        return f"SlideRecord({self.index}, {self.type!r}, career={self.career!r})"
+
+
+def build_registry(slides, case_studies, keywords, schedules):
+    """Resolve every slide into a SlideRecord, raising ValueError on missing content"""
+    records = []
+    problems = []
+
+    for index, slide in enumerate(slides):
+        if slide["type"] != "career":
+            records.append(SlideRecord(index, slide, keywords=keywords.get(GENERAL_KEYWORDS, ())))
+            continue
+
+        career = slide["content"]["resources"]
+        if not slide["title"].endswith(career):
+            problems.append(f"slide {index + 1}: title {slide['title']!r} does not match career {career!r}")
+        for table_name, table in (
+            ("CAREER_CASE_STUDIES", case_studies),
+            ("YOUTUBE_SEARCH_KEYWORDS", keywords),
+            ("NJ_COLLEGE_SCHEDULES", schedules),
+        ):
+            if career not in table:
+                problems.append(f"slide {index + 1}: {career!r} missing from {table_name}")
+
+        records.append(SlideRecord(
+            index,
+            slide,
+            career=career,
+            case_studies=case_studies.get(career, ()),
+            keywords=keywords.get(career, ()),
+            schedule=schedules.get(career),
+        ))
+
+    if problems:
+        raise ValueError("Invalid deck content:\n  " + "\n  ".join(problems))
+    return tuple(records)
+
@@ -0,0 +1,241 @@
+"""Personalized flyers for every student on a roster (mail merge)
+
+The roster is a CSV with name, homeroom and careers columns, careers being
+separated by ";" and matched (case-insensitively) to the careers in the
+deck; unknown careers are still printed, with a note to ask the counselor.
+
+The roster is read CHUNK_SIZE rows at a time, and at most a window of
+chunks is being rendered or waiting to be written at once, so memory does
+not grow with the roster. Output is either a ZIP with one HTML flyer per
+student, filed by homeroom, or one combined PDF (apstat.pdf.FlyerMerge).
+HTML flyers come from a template compiled once per process: the flyer is
+rendered and optimized once with a placeholder where the student's block
+goes, so a copy is a single Template.render. ZIP chunks can be rendered on
+a process pool; the combined PDF is a single stream and is written by one
+process.
+"""
+import csv
+import os
+import re
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from html import escape
+from itertools import islice
+
+from apstat.branding import DEFAULT_BRANDING
+from apstat.content import CONTENT_PATH, load_content
+from apstat.templates import Template
+
+CHUNK_SIZE = 200
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+COLUMNS = ("name", "homeroom", "careers")
+CAREER_SEPARATOR = ";"
+# More suggestions than this do not fit the student block
+MAX_CAREERS = 4
+UNKNOWN_CAREER_NOTE = "ask your counselor about this path"
+
+_NOT_SLUG = re.compile(r"[^A-Za-z0-9]+")
+_PLACEHOLDER = "\x00student\x00"
+
+
+def read_roster(path, chunk_size=CHUNK_SIZE):
+    """Yield the roster as lists of at most chunk_size student dicts
+
+    Each student has "line" (CSV line number), "name", "homeroom" and
+    "careers" (a list). Raises ValueError when a column is missing.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [column.strip().lower() for column in next(reader, [])]
+        missing = [column for column in COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(missing)} column")
+        positions = [header.index(column) for column in COLUMNS]
+
+        chunk = []
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            name, homeroom, careers = (row[position].strip() if position < len(row) else "" for position in positions)
+            chunk.append({
+                "line": reader.line_num,
+                "name": name,
+                "homeroom": homeroom,
+                "careers": [career.strip() for career in careers.split(CAREER_SEPARATOR) if career.strip()],
+            })
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class FlyerTemplate:
+    """The flyer for one content version, date and branding, ready to personalize"""
+
+    def __init__(self, content, today, branding=DEFAULT_BRANDING, optimize=True):
+        from apstat.flyer import render_flyer_html
+
+        self.flyer = branding.rebrand(content.flyer)
+        self.today = today
+        self.branding = branding
+        self.careers = {
+            name.lower(): (name, record.slide["content"]["description"])
+            for name, record in content.careers.items()
+        }
+        html = render_flyer_html(self.flyer, today, personal=_PLACEHOLDER, stylesheets=("flyer", "student"))
+        if optimize:
+            from apstat.exports import optimize_html
+            html = optimize_html(html)
+        source = html.replace("{", "{{").replace("}", "}}").replace(_PLACEHOLDER, "{personal}")
+        self.template = Template(source)
+
+    def careers_for(self, student):
+        """[(title, description)] for a student's suggested careers"""
+        return [
+            self.careers.get(career.lower(), (career, UNKNOWN_CAREER_NOTE))
+            for career in student["careers"][:MAX_CAREERS]
+        ]
+
+    def unknown_careers(self, student):
+        return [career for career in student["careers"] if career.lower() not in self.careers]
+
+    def render_html(self, student):
+        from apstat.flyer import STUDENT_BANNER, STUDENT_CAREER
+
+        careers = "".join(
+            STUDENT_CAREER.render(title=escape(title), description=escape(description))
+            for title, description in self.careers_for(student)
+        )
+        banner = STUDENT_BANNER.render(name=escape(student["name"]), homeroom=escape(student["homeroom"]), careers=careers)
+        return self.template.render(personal=banner)
+
+
+def flyer_path(student):
+    """Archive path for a student's flyer: <homeroom>/<name>_<line>.html"""
+    homeroom = _NOT_SLUG.sub("-", student["homeroom"]).strip("-") or "no-homeroom"
+    name = _NOT_SLUG.sub("_", student["name"]).strip("_") or "student"
+    return f"{homeroom}/{name}_{student['line']}.html"
+
+
+def _check(student):
+    if not student["name"]:
+        return f"line {student['line']}: no name"
+    return None
+
+
+# Compiled templates per (content path, date, branding, optimize), one set per worker process
+_templates = {}
+
+
+def _template(content_path, today, branding, optimize):
+    key = (content_path, today, branding, optimize)
+    if key not in _templates:
+        _templates[key] = FlyerTemplate(load_content(content_path), today, branding, optimize)
+    return _templates[key]
+
+
+def render_chunk(chunk, content_path, today, branding, optimize=True):
+    """Render a chunk of students to HTML; returns ([(path, bytes)], errors, unknown careers)"""
+    template = _template(content_path, today, branding, optimize)
+    files, errors, unknown = [], [], set()
+    for student in chunk:
+        error = _check(student)
+        if error:
+            errors.append(error)
+            continue
+        unknown.update(template.unknown_careers(student))
+        files.append((flyer_path(student), template.render_html(student).encode("utf-8")))
+    return files, errors, unknown
+
+
+def _write_zip(f, chunks, workers, render_args, on_chunk):
+    with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        def add(result):
+            files, errors, unknown = result
+            for path, data in files:
+                archive.writestr(path, data)
+            on_chunk(len(files), errors, unknown)
+
+        if workers <= 1:
+            for chunk in chunks:
+                add(render_chunk(chunk, *render_args))
+            return
+
+        window = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+
+            def fill():
+                for chunk in islice(chunks, window - len(pending)):
+                    pending.add(pool.submit(render_chunk, chunk, *render_args))
+
+            fill()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    add(future.result())
+                fill()
+
+
+def _write_pdf(f, chunks, content_path, today, branding, on_chunk):
+    from apstat.pdf import FlyerMerge
+
+    template = FlyerTemplate(load_content(content_path), today, branding, optimize=False)
+    merge = FlyerMerge(f, template.flyer, today, branding)
+    for chunk in chunks:
+        errors, unknown, added = [], set(), 0
+        for student in chunk:
+            error = _check(student)
+            if error:
+                errors.append(error)
+                continue
+            unknown.update(template.unknown_careers(student))
+            merge.add(student["name"], student["homeroom"], template.careers_for(student))
+            added += 1
+        on_chunk(added, errors, unknown)
+    merge.close()
+
+
+def merge_roster(roster, out, today, workers=1, chunk_size=CHUNK_SIZE, branding=DEFAULT_BRANDING,
+                 content_path=CONTENT_PATH, optimize=True, on_chunk=None):
+    """Write a personalized flyer for every student in the roster CSV to out
+
+    out ending in .pdf gets one combined PDF; anything else gets a ZIP of
+    HTML flyers. on_chunk(flyers, errors, unknown careers) is called after
+    each chunk. Returns a summary dict with the flyer count, skipped rows,
+    unknown careers, seconds and flyers per second.
+    """
+    chunks = read_roster(roster, chunk_size)
+    summary = {"flyers": 0, "errors": [], "unknown_careers": set()}
+
+    def chunk_done(flyers, errors, unknown):
+        summary["flyers"] += flyers
+        summary["errors"] += errors
+        summary["unknown_careers"] |= unknown
+        if on_chunk:
+            on_chunk(flyers, errors, unknown)
+
+    out_dir = os.path.dirname(os.path.abspath(out))
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".flyers.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if out.lower().endswith(".pdf"):
+                _write_pdf(f, chunks, content_path, today, branding, chunk_done)
+            else:
+                _write_zip(f, chunks, workers, (content_path, today, branding, optimize), chunk_done)
+        # mkstemp creates the file private; the flyers are meant to be handed out
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, out)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    summary["seconds"] = time.perf_counter() - start
+    summary["rate"] = summary["flyers"] / summary["seconds"] if summary["seconds"] else 0.0
+    summary["unknown_careers"] = sorted(summary["unknown_careers"])
+    return summary
@@ -0,0 +1,82 @@
+"""HTML builders for the resource sections of a slide
+
+Each builder returns one HTML block so a whole section can be sent to the
+browser with a single st.markdown call instead of one call per link.
+"""
+import urllib.parse
+from html import escape
+
+# Shown after links that failed their last health check (see apstat.links)
+DEAD_LINK_BADGE = " <span class='dead-link-badge'>⚠️ link was down at last check</span>"
+
+
+def create_youtube_search_url(search_query):
+    """Create a YouTube search URL"""
+    encoded_query = urllib.parse.quote(search_query)
+    return f"https://www.youtube.com/results?search_query={encoded_query}"
+
+
+def keyword_links_html(keywords):
+    """Clickable YouTube search links, one per keyword"""
+    return "\n".join(
+        f'<a href="{create_youtube_search_url(keyword)}" target="_blank" class="clickable-link">🔍 {keyword}</a>'
+        for keyword in keywords
+    )
+
+
+def _link_card(css_class, icon, url, title, description, dead_links, previews):
+    """One resource link, with its badge when dead and its thumbnail when previewed"""
+    if url in dead_links:
+        css_class += " dead-link"
+    badge = DEAD_LINK_BADGE if url in dead_links else ""
+    text = (
+        f"{icon} <a href='{url}' target='_blank'>{title}</a>{badge}"
+        f"<br><small>{description}</small>"
+    )
+    preview = previews.get(url) if previews else None
+    if preview is None:
+        return f"<div class='{css_class}'>{text}</div>"
+    site = f"<br><small class='link-site'>{escape(preview['site'])}</small>" if preview.get("site") else ""
+    return (
+        f"<div class='{css_class} link-card'>"
+        f"<img class='link-thumb' src='{preview['thumbnail_url']}' alt='' loading='lazy'>"
+        f"<div>{text}{site}</div>"
+        f"</div>"
+    )
+
+
+def guaranteed_videos_html(videos, dead_links=frozenset(), previews=None):
+    """Links to the always-available videos, flagging any in dead_links and carding any in previews"""
+    return "\n".join(
+        _link_card("resource-link working-video", "▶️", video["url"], video["title"], video["description"], dead_links, previews)
+        for video in videos.values()
+    )
+
+
+def case_studies_html(case_studies, dead_links=frozenset(), previews=None):
+    """Links to the real-world case studies for a career, flagging dead and carding previewed ones"""
+    return "\n".join(
+        _link_card("case-study-link", "📖", study["url"], study["title"], study["description"], dead_links, previews)
+        for study in case_studies
+    )
+
+
+def schedule_html(schedule_data):
+    """School summary and 4-year course schedule for a career"""
+    parts = [
+        f"<div class='schedule-box'>"
+        f"<h3>🏫 {schedule_data['school']}</h3>"
+        f"<p><strong>Major:</strong> {schedule_data['major']}</p>"
+        f"<p><strong>Note:</strong> {schedule_data['stats_note']}</p>"
+        f"</div>",
+        "<h3>📅 4-Year Course Schedule</h3>",
+    ]
+    for year, courses in schedule_data["schedule"].items():
+        parts.append(f"<div class='schedule-year'><strong>{year}:</strong><br>")
+        for course in courses:
+            if "Statistics" in course or "(AP Credit Accepted!)" in course:
+                parts.append(f"✅ <strong>{course}</strong><br>")
+            else:
+                parts.append(f"• {course}<br>")
+        parts.append("</div>")
+    return "\n".join(parts)
@@ -0,0 +1,59 @@
+"""Per-session state budget
+
+Every career slide has its own custom_search_{career} text box. When a
+student moves on, the box's widget state is stale: Streamlit would drop it
+at the end of the run and the text they typed would be lost. Instead,
+compact_search_state() folds stale search boxes into one small
+saved_searches dict, keeping only searches that differ from the default
+and only for the most recently left careers, so each session holds at most
+MAX_SAVED_SEARCHES strings however many slides it visits.
+"""
+import pickle
+
+SEARCH_PREFIX = "custom_search_"
+SAVED_SEARCHES = "saved_searches"
+MAX_SAVED_SEARCHES = 5
+
+
+def default_search(career_name):
+    """The text a search box starts with"""
+    return f"statistics in {career_name}"
+
+
+def saved_search(state, career_name):
+    """The search a student typed for a career before leaving it, or the default"""
+    return state.get(SAVED_SEARCHES, {}).get(career_name, default_search(career_name))
+
+
+def compact_search_state(state, active_career=None):
+    """Fold every search box except active_career's into saved_searches; returns keys removed"""
+    active_key = f"{SEARCH_PREFIX}{active_career}" if active_career else None
+    stale = [key for key in list(state.keys()) if key.startswith(SEARCH_PREFIX) and key != active_key]
+    if not stale:
+        return 0
+
+    saved = dict(state.get(SAVED_SEARCHES, {}))
+    for key in stale:
+        career_name = key[len(SEARCH_PREFIX):]
+        value = state[key]
+        # Re-inserting moves the career to the newest end
+        saved.pop(career_name, None)
+        if value and value != default_search(career_name):
+            saved[career_name] = value
+        del state[key]
+
+    for career_name in list(saved)[:-MAX_SAVED_SEARCHES]:
+        del saved[career_name]
+    state[SAVED_SEARCHES] = saved
+    return len(stale)
+
+
+def state_size(state):
+    """Approximate bytes held by a session's state: {key: pickled size}"""
+    sizes = {}
+    for key in list(state.keys()):
+        try:
+            sizes[key] = len(pickle.dumps(state[key], protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:  # unpicklable values are not counted
+            sizes[key] = 0
+    return sizes
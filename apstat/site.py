@@ -0,0 +1,146 @@
+"""Pre-rendered static site for the whole deck
+
+build_site() writes one HTML page per slide plus the printable documents and
+a content-hashed stylesheet, so the read-only audience can be served by any
+static file server (``python -m http.server -d site``) without touching the
+Streamlit process. Asset names change whenever their content does, so they
+can be cached forever.
+"""
+import hashlib
+import os
+from html import escape
+
+from apstat.branding import DEFAULT_BRANDING
+from apstat.exports import optimize_html
+from apstat.flyer import render_flyer_html
+from apstat.fragments import slide_fragment_html
+from apstat.presentation import render_presentation_html
+from apstat.styles import stylesheet_bundle
+
+ASSETS_DIR = "assets"
+SITE_TITLE = "AP Statistics for Career Success"
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title} | {site_title}</title>
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body>
+<div class="site">
+<nav class="site-nav">
+{previous}
+<select aria-label="Go to slide" onchange="location.href = this.value">
+{options}
+</select>
+{next}
+</nav>
+<div class="teacher-banner">
+<h3>{headline}</h3>
+<p>{compiled_by}</p>
+<p>{position}</p>
+</div>
+<main>
+{body}
+</main>
+<footer class="site-footer">
+<p>Slide {number} of {total} · <a href="presentation.html">Full printable presentation</a> · <a href="flyer.html">2-page flyer</a></p>
+<p>💡 <strong>Tip:</strong> Click any search link to open YouTube in a new tab</p>
+<p>🎓 <strong>{headline}</strong> - {short_credit}</p>
+</footer>
+</div>
+</body>
+</html>
+"""
+
+
+def page_name(index):
+    """File name of the page for the slide at index (slide 1 is index.html)"""
+    return "index.html" if index == 0 else f"slide-{index + 1:02d}.html"
+
+
+def hashed_asset_name(stem, data, extension):
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}.{extension}"
+
+
+def site_stylesheet():
+    """The minified stylesheet for the site: app styles plus the site layout"""
+    return stylesheet_bundle("app", "site")
+
+
+def render_slide_page(record, content, stylesheet_href, branding=DEFAULT_BRANDING):
+    registry = content.registry
+    total = len(registry)
+    index = record.index
+
+    options = "\n".join(
+        f'<option value="{page_name(other.index)}"{" selected" if other.index == index else ""}>'
+        f"Slide {other.index + 1}: {escape(other.title[:30])}...</option>"
+        for other in registry
+    )
+    previous = (
+        f'<a href="{page_name(index - 1)}" rel="prev">⬅️ Previous</a>' if index > 0
+        else '<span class="disabled">⬅️ Previous</span>'
+    )
+    following = (
+        f'<a href="{page_name(index + 1)}" rel="next">Next ➡️</a>' if index < total - 1
+        else '<span class="disabled">Next ➡️</span>'
+    )
+    return PAGE.format(
+        title=escape(record.title),
+        site_title=SITE_TITLE,
+        stylesheet=stylesheet_href,
+        previous=previous,
+        options=options,
+        next=following,
+        body=slide_fragment_html(record, content),
+        number=index + 1,
+        total=total,
+        headline=escape(branding.headline),
+        compiled_by=escape(branding.compiled_by),
+        position=escape(branding.position),
+        short_credit=escape(branding.short_credit),
+    )
+
+
+def _write(path, data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def build_site(content, out_dir, today, branding=DEFAULT_BRANDING):
+    """Render every slide page and the printable documents into out_dir; returns written paths"""
+    assets_dir = os.path.join(out_dir, ASSETS_DIR)
+    os.makedirs(assets_dir, exist_ok=True)
+    written = []
+
+    stylesheet = site_stylesheet().encode("utf-8")
+    stylesheet_name = hashed_asset_name("site", stylesheet, "css")
+    stylesheet_path = os.path.join(assets_dir, stylesheet_name)
+    _write(stylesheet_path, stylesheet)
+    written.append(stylesheet_path)
+
+    # Drop stylesheets from earlier builds
+    for entry in os.scandir(assets_dir):
+        if entry.name.startswith("site.") and entry.name.endswith(".css") and entry.name != stylesheet_name:
+            os.unlink(entry.path)
+
+    stylesheet_href = f"{ASSETS_DIR}/{stylesheet_name}"
+    for record in content.registry:
+        path = os.path.join(out_dir, page_name(record.index))
+        _write(path, render_slide_page(record, content, stylesheet_href, branding))
+        written.append(path)
+
+    for name, html in (
+        ("presentation.html", render_presentation_html(content.registry, content.videos, today, branding)),
+        ("flyer.html", render_flyer_html(branding.rebrand(content.flyer), today)),
+    ):
+        path = os.path.join(out_dir, name)
+        _write(path, optimize_html(html))
+        written.append(path)
+
+    return written
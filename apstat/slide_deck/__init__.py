@@ -0,0 +1,33 @@
+"""Client-side slide deck component
+
+All slide fragments are sent to the browser once and the component switches
+between them locally (buttons or arrow keys), so presenting on a weak
+network costs no server round trip per slide. The component only reports
+back, as {"slide": index, "exit": bool}, when the presenter leaves the deck
+or the tab is hidden, which is when the server needs to know where to
+resume. Styles come from stylesheet_url, a static path relative to the app
+root (app/static/...), so the browser caches them instead of receiving the
+stylesheet with every rerun.
+
+Unlike the rest of apstat this module imports Streamlit; only app.py uses it.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+_slide_deck = components.declare_component("slide_deck", path=_FRONTEND_DIR)
+
+
+def slide_deck(fragments, titles, index, stylesheet_url, key=None, on_change=None):
+    """Show the slides client-side; returns the last synced {"slide", "exit"} or None"""
+    return _slide_deck(
+        fragments=fragments,
+        titles=titles,
+        index=index,
+        stylesheet_url=stylesheet_url,
+        key=key,
+        on_change=on_change,
+        default=None,
+    )
@@ -0,0 +1,125 @@
+"""Stylesheets shared by the Streamlit app, the printable documents and the static site
+
+stylesheet_bundle() concatenates stylesheets, drops rules and declarations
+that repeat an identical one, and minifies the result. publish_stylesheet()
+writes a bundle once under a content-hashed name in the static directory,
+so pages only carry a <link> and browsers cache the file.
+"""
+import os
+import re
+from functools import lru_cache
+
+STYLES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_SELECTOR_PUNCTUATION = re.compile(r"\s*([,>+~])\s*")
+_VALUE_COMMA = re.compile(r"\s*,\s*")
+_LEADING_ZERO = re.compile(r"(?<![\w.#-])0\.(\d)")
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(name):
+    """Return the contents of styles/<name>.css"""
+    with open(os.path.join(STYLES_DIR, f"{name}.css"), encoding="utf-8") as f:
+        return f.read()
+
+
+def _parse(css, pos=0):
+    """Parse css from pos into [(prelude, body)], stopping at an unmatched "}"; returns (rules, end)
+
+    body is a declaration string for a style rule, a nested rule list for an
+    at-rule block (@media, @supports, @keyframes), or None for a statement
+    such as @import.
+    """
+    rules = []
+    start = pos
+    while pos < len(css):
+        char = css[pos]
+        if char == ";":
+            statement = css[start:pos].strip()
+            if statement:
+                rules.append((statement, None))
+            start = pos + 1
+        elif char == "}":
+            return rules, pos + 1
+        elif char == "{":
+            prelude = css[start:pos].strip()
+            close = css.find("}", pos)
+            nested = css.find("{", pos + 1)
+            if nested != -1 and nested < close:
+                body, pos = _parse(css, pos + 1)
+            else:
+                body, pos = css[pos + 1:close], close + 1
+            rules.append((prelude, body))
+            start = pos
+            continue
+        pos += 1
+    return rules, pos
+
+
+def _minify_prelude(prelude):
+    prelude = _SPACE.sub(" ", prelude).strip()
+    if prelude.startswith("@"):
+        return prelude
+    return _SELECTOR_PUNCTUATION.sub(r"\1", prelude)
+
+
+def _minify_declarations(body):
+    declarations = []
+    for declaration in body.split(";"):
+        name, colon, value = declaration.partition(":")
+        if not colon:
+            continue
+        value = _VALUE_COMMA.sub(",", _SPACE.sub(" ", value).strip()).replace(" !important", "!important")
+        value = _LEADING_ZERO.sub(r".\1", value)
+        declaration = f"{name.strip().lower()}:{value}"
+        # A repeated identical declaration only needs its last occurrence
+        if declaration in declarations:
+            declarations.remove(declaration)
+        declarations.append(declaration)
+    return ";".join(declarations)
+
+
+def _serialize(rules):
+    blocks = []
+    for prelude, body in rules:
+        prelude = _minify_prelude(prelude)
+        if body is None:
+            block = f"{prelude};"
+        elif isinstance(body, list):
+            inner = _serialize(body)
+            if not inner:
+                continue
+            block = f"{prelude}{{{inner}}}"
+        else:
+            declarations = _minify_declarations(body)
+            if not declarations:
+                continue
+            block = f"{prelude}{{{declarations}}}"
+        # An identical earlier rule cannot change the cascade once the later one applies
+        if block in blocks:
+            blocks.remove(block)
+        blocks.append(block)
+    return "".join(blocks)
+
+
+def minify_css(css):
+    """Minify css: strip comments and whitespace and drop exact duplicate rules"""
+    rules, _ = _parse(_COMMENT.sub("", css))
+    return _serialize(rules)
+
+
+@lru_cache(maxsize=None)
+def stylesheet_bundle(*names):
+    """Minified concatenation of styles/<name>.css for each name, in order"""
+    return minify_css("\n".join(load_stylesheet(name) for name in names))
+
+
+@lru_cache(maxsize=None)
+def publish_stylesheet(static_dir, *names):
+    """Publish the bundle of names under static_dir once; returns its fingerprinted URL path"""
+    from apstat.exports import publish
+
+    # "_" keeps one bundle's name from being a prefix of another's, which exports pruning relies on
+    return publish(static_dir, "_".join(names), stylesheet_bundle(*names).encode("utf-8"), extension="css")
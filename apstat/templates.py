@@ -0,0 +1,47 @@
+"""Minimal compiled template engine for the printable documents
+
+Templates use str.format field syntax ({name}, with {{ and }} for literal
+braces). Each template is parsed once into literal/field chunks, and
+rendering writes those chunks to a caller-supplied writer (list.append,
+file.write, ...) so large documents are joined once instead of being built
+with repeated string concatenation.
+"""
+from string import Formatter
+
+
+class Template:
+    """A template parsed once into literal text and named fields"""
+
+    __slots__ = ("source", "fields", "_chunks")
+
+    def __init__(self, source):
+        self.source = source
+        self._chunks = []
+        fields = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if spec or conversion:
+                raise ValueError(f"Template fields only support plain names, got {{{field}!{conversion}:{spec}}}")
+            self._chunks.append((literal, field))
+            if field is not None:
+                fields.append(field)
+        self.fields = tuple(fields)
+
+    def render_into(self, write, **values):
+        """Write the rendered template to write() chunk by chunk"""
+        for literal, field in self._chunks:
+            if literal:
+                write(literal)
+            if field is not None:
+                write(str(values[field]))
+
+    def render(self, **values):
+        """Render the template to a string"""
+        parts = []
+        self.render_into(parts.append, **values)
+        return "".join(parts)
+
+
+def render_each(write, template, items, name="item"):
+    """Render template once per item, exposing each item as {name}"""
+    for item in items:
+        template.render_into(write, **{name: item})
@@ -0,0 +1,162 @@
+"""Tenant profiles: one server hosting the deck for many schools
+
+A tenant is a teacher and school with their own branding (teacher, school,
+role and the title banner headline) and, optionally, a subset of the
+career slides. Profiles are read once from tenants.json next to this module,
+or from the file named by APSTAT_TENANTS_FILE:
+
+    {
+      "default": "newark-tech",
+      "tenants": {
+        "newark-tech": {},
+        "east-high": {"teacher": "Ms. Ada Byron", "school": "East High",
+                      "careers": ["NICU Nurse", "Software Developer"],
+                      "cache_entries": 16}
+      }
+    }
+
+The app picks the tenant named by the ?tenant= URL parameter. Without one,
+or for a name that is not configured, it uses APSTAT_TENANT, then the file's
+"default", then the built-in "default" tenant (the original deck), so a URL
+can never create a tenant.
+
+Each tenant keeps what depends on its branding or slide subset (the
+printables, the presenter deck) in its own RenderCache of cache_entries, so
+a busy tenant only evicts its own documents. Slide pieces that are the same
+for everyone stay in the shared apstat.cache.render_cache and are rendered
+once for all tenants.
+"""
+import json
+import os
+import re
+import threading
+
+from apstat.branding import DEFAULT_BRANDING, Branding
+from apstat.cache import RenderCache
+from apstat.content import SECTIONS, Content
+
+TENANTS_PATH = os.environ.get("APSTAT_TENANTS_FILE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tenants.json"
+)
+DEFAULT_TENANT = "default"
+TENANT_CACHE_ENTRIES = 32
+
+_NAME = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+
+
+class Tenant:
+    """One school's profile: branding, optional career subset and its own render cache"""
+
+    def __init__(self, name, branding, careers=None, cache_entries=TENANT_CACHE_ENTRIES):
+        self.name = name
+        self.branding = branding
+        self.careers = frozenset(careers) if careers else None
+        self.cache = RenderCache(max_entries=cache_entries)
+        # (shared content, this tenant's view of it), replaced as a whole
+        self._view = (None, None)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"Tenant({self.name!r}, {self.branding!r})"
+
+    def export_name(self, name):
+        """Name to publish a printable under, so tenants do not prune each other's files"""
+        return name if self.name == DEFAULT_TENANT else f"{name}_{self.name}"
+
+    def content(self, shared):
+        """This tenant's view of the shared Content: shared itself unless it has a career subset
+
+        The view is built once per content version, and the tenant's cache
+        entries built from sections that changed are dropped, as
+        get_content() does for the shared cache. The flyer is left as
+        written; renderers apply the branding (Branding.rebrand).
+        """
+        base, view = self._view
+        if base is shared:
+            return view
+        with self._lock:
+            base, previous = self._view
+            if base is shared:
+                return previous
+            view = shared if self.careers is None else self._build(shared)
+            if previous is not None:
+                changed = [name for name in SECTIONS if view.section_hashes[name] != previous.section_hashes[name]]
+                self.cache.invalidate(changed)
+            self._view = (shared, view)
+            return view
+
+    def _build(self, shared):
+        unknown = self.careers - set(shared.careers)
+        if unknown:
+            raise ValueError(f"tenant {self.name!r}: no slides for {', '.join(sorted(unknown))}")
+        slides = [
+            slide for slide in shared.slides
+            if slide["type"] != "career" or slide["content"]["resources"] in self.careers
+        ]
+        data = {
+            "guaranteed_videos": shared.videos,
+            "career_case_studies": shared.case_studies,
+            "youtube_search_keywords": shared.keywords,
+            "nj_college_schedules": shared.schedules,
+            "slides": slides,
+            "flyer": shared.flyer,
+        }
+        return Content(data, shared.mtime_ns)
+
+
+def load_tenants(path=TENANTS_PATH):
+    """Read the tenant profiles; returns ({name: Tenant}, default name)
+
+    A missing file means just the built-in default tenant. Raises
+    ValueError for a malformed file.
+    """
+    tenants = {DEFAULT_TENANT: Tenant(DEFAULT_TENANT, DEFAULT_BRANDING)}
+    config = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+
+    for name, profile in config.get("tenants", {}).items():
+        if not _NAME.match(name):
+            raise ValueError(f"{path}: tenant name {name!r} must be lowercase letters, digits, '_' or '-'")
+        tenants[name] = Tenant(
+            name,
+            Branding.from_dict(profile),
+            careers=profile.get("careers"),
+            cache_entries=profile.get("cache_entries", TENANT_CACHE_ENTRIES),
+        )
+
+    default = os.environ.get("APSTAT_TENANT") or config.get("default") or DEFAULT_TENANT
+    if default not in tenants:
+        raise ValueError(f"{path}: default tenant {default!r} is not configured")
+    return tenants, default
+
+
+_loaded = None
+_load_lock = threading.Lock()
+
+
+def _tenants():
+    global _loaded
+    if _loaded is None:
+        with _load_lock:
+            if _loaded is None:
+                _loaded = load_tenants()
+    return _loaded
+
+
+def get_tenant(name=None):
+    """The tenant called name, or the default tenant when name is missing or unknown"""
+    tenants, default = _tenants()
+    return tenants.get(name) or tenants[default]
+
+
+def tenant_cache_stats():
+    """Render cache counters summed over every tenant"""
+    tenants, _ = _tenants()
+    totals = {"entries": 0, "hits": 0, "misses": 0, "evictions": 0}
+    for tenant in tenants.values():
+        stats = tenant.cache.stats()
+        for counter in totals:
+            totals[counter] += stats[counter]
+    return totals
@@ -0,0 +1,167 @@
+"""Check the JSON content API and measure its throughput
+
+First drives apstat.api.app in-process to check pagination, ETag
+revalidation and gzip, and to time the application alone. Then starts
+`python -m apstat serve-api` (one uvicorn process) and keeps CONNECTIONS
+keep-alive HTTP/1.1 connections busy for a few seconds with a mix of
+endpoints, reporting requests per second and latency percentiles. The load
+generator shares the machine with the server, so the HTTP figure is a lower
+bound. Fails if a check fails or HTTP throughput is below MIN_RPS.
+
+Run from the repository root:
+
+    python -m benchmarks.api_throughput
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from apstat.api import app
+from benchmarks.server import REPO_ROOT, STARTUP_TIMEOUT, free_port
+
+CONNECTIONS = 8
+DURATION = 3.0
+IN_PROCESS_REQUESTS = 20000
+MIN_RPS = 1000
+PATHS = (
+    "/api/v1/slides",
+    "/api/v1/slides/4",
+    "/api/v1/slides/4/fragment",
+    "/api/v1/slides/12/fragment",
+    "/api/v1/case-studies?limit=5",
+    "/api/v1/schedules",
+)
+
+
+async def call(path, headers=()):
+    """One in-process GET; returns (status, headers dict, body)"""
+    path, _, query = path.partition("?")
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": list(headers)}
+    await app(scope, None, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+
+async def checks(report):
+    items, path, pages = [], "/api/v1/slides?limit=4", 0
+    while path:
+        status, _, body = await call(path)
+        page = json.loads(body)
+        items += page["items"]
+        path, pages = page["next"], pages + 1
+    report([item["index"] for item in items] == list(range(page["total"])),
+           f"pagination walked {len(items)} slides in {pages} pages")
+
+    status, headers, body = await call("/api/v1/slides/4/fragment")
+    revalidated, _, empty = await call("/api/v1/slides/4/fragment", [(b"if-none-match", headers[b"etag"])])
+    report(status == 200 and revalidated == 304 and not empty, "If-None-Match gets 304 with no body")
+
+    _, gzip_headers, compressed = await call("/api/v1/slides/4/fragment", [(b"accept-encoding", b"gzip, br")])
+    report(gzip_headers.get(b"content-encoding") == b"gzip" and gzip.decompress(compressed) == body,
+           f"gzip body {len(compressed):,} bytes for {len(body):,}")
+
+    status, _, _ = await call("/api/v1/slides/99")
+    report(status == 404, "unknown slide is a 404")
+
+
+async def in_process_rate():
+    headers = [(b"accept-encoding", b"gzip")]
+    for path in PATHS:
+        await call(path, headers)
+    start = time.perf_counter()
+    for number in range(IN_PROCESS_REQUESTS):
+        await call(PATHS[number % len(PATHS)], headers)
+    return IN_PROCESS_REQUESTS / (time.perf_counter() - start)
+
+
+def start_api(port):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "apstat", "serve-api", f"--port={port}"],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/v1/", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("API server did not start")
+
+
+async def client(port, number, deadline, latencies):
+    """Send requests on one keep-alive connection until the deadline; returns non-200 count"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    errors = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = PATHS[number % len(PATHS)]
+            number += 1
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nAccept-Encoding: gzip\r\n\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            length = next(int(line.split(":", 1)[1]) for line in lines if line.lower().startswith("content-length:"))
+            await reader.readexactly(length)
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += not lines[0].startswith("HTTP/1.1 200")
+    finally:
+        writer.close()
+    return errors
+
+
+async def http_load(port, connections, duration):
+    latencies = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(client(port, number, start + duration, latencies) for number in range(connections)))
+    return latencies, time.perf_counter() - start, sum(errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=CONNECTIONS, help=f"keep-alive connections (default: {CONNECTIONS})")
+    parser.add_argument("--duration", type=float, default=DURATION, help=f"seconds of HTTP load (default: {DURATION})")
+    args = parser.parse_args(argv)
+
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    asyncio.run(checks(report))
+    print(f"     in-process: {asyncio.run(in_process_rate()):,.0f} requests/s")
+
+    port = free_port()
+    process = start_api(port)
+    try:
+        latencies, elapsed, errors = asyncio.run(http_load(port, args.connections, args.duration))
+    finally:
+        process.terminate()
+        process.wait()
+
+    rate = len(latencies) / elapsed
+    percentiles = statistics.quantiles(latencies, n=100)
+    report(errors == 0, f"{len(latencies):,} HTTP requests, {errors} errors")
+    report(rate >= MIN_RPS,
+           f"HTTP: {rate:,.0f} requests/s over {args.connections} connections "
+           f"(p50 {statistics.median(latencies):.2f} ms, p99 {percentiles[98]:.2f} ms; minimum {MIN_RPS:,})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Render-performance suite: every slide and both printable views through AppTest
+
+For each scenario the app is run headlessly and the suite records the best
+wall time of several reruns (the least noisy summary on a shared machine),
+the peak memory allocated during one, and the number of deltas (elements)
+and bytes a rerun sends to the browser, as counted by apstat.metrics.
+Results are compared against the stored baseline and the run fails when a
+scenario's deltas, bytes or peak memory regress past their tolerance. Wall
+time depends on the machine the baseline was recorded on, so it is shown
+next to the baseline's but never fails the run.
+
+Run from the repository root:
+
+    python -m benchmarks.app_render                    # compare with the baseline
+    python -m benchmarks.app_render --update-baseline  # record a new baseline
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baselines", "app_render.json")
+ROUNDS = 7
+
+# metric -> (allowed ratio to the baseline, absolute slack); wall time is reported, not gated
+TOLERANCES = {
+    "peak_kib": (1.25, 64.0),
+    "deltas": (1.0, 0),
+    "bytes": (1.05, 0),
+}
+
+
+def scenarios(slide_count):
+    """(name, session state) for every slide and the two printable views"""
+    for index in range(slide_count):
+        yield f"slide-{index + 1:02d}", {"current_slide": index, "show_flyer": False, "show_printable": False}
+    yield "flyer", {"current_slide": 0, "show_flyer": True, "show_printable": False}
+    yield "presentation", {"current_slide": 0, "show_flyer": False, "show_printable": True}
+
+
+def measure(at, state, rounds):
+    for name, value in state.items():
+        at.session_state[name] = value
+    at.run()  # warm the render caches for this scenario
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception}")
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sent = at.session_state.last_rerun_deltas
+    return {
+        "wall_ms": round(min(timings), 2),
+        "peak_kib": round(peak / 1024, 1),
+        "deltas": sent["deltas"],
+        "bytes": sent["bytes"],
+    }
+
+
+def regressions(result, baseline):
+    """Human-readable list of the metrics that exceed their tolerance"""
+    problems = []
+    for metric, (ratio, slack) in TOLERANCES.items():
+        limit = baseline[metric] * ratio + slack
+        if result[metric] > limit:
+            problems.append(f"{metric} {result[metric]} > {limit:g} (baseline {baseline[metric]})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help=f"timed reruns per scenario (default: {ROUNDS})")
+    args = parser.parse_args(argv)
+
+    from apstat.content import get_content
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    results = {}
+    for name, state in scenarios(len(get_content().slides)):
+        results[name] = measure(at, state, args.rounds)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote baseline for {len(results)} scenarios to {BASELINE_PATH}")
+        return 0
+
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except OSError:
+        baseline = {}
+
+    failures = 0
+    print(f"{'scenario':<14} {'wall ms':>8} {'baseline':>9} {'peak KiB':>9} {'deltas':>7} {'bytes':>8}  status")
+    for name, result in results.items():
+        if name not in baseline:
+            status = "no baseline"
+            baseline_wall = "-"
+        else:
+            problems = regressions(result, baseline[name])
+            failures += bool(problems)
+            status = "FAIL " + "; ".join(problems) if problems else "ok"
+            baseline_wall = f"{baseline[name]['wall_ms']:.1f}"
+        print(f"{name:<14} {result['wall_ms']:>8.1f} {baseline_wall:>9} {result['peak_kib']:>9.1f} "
+              f"{result['deltas']:>7} {result['bytes']:>8,}  {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Check the batch exporter and compare worker counts
+
+Exports DECKS branded decks (every document and format) plus one deck whose
+content file is missing, once with a single worker and once with one worker
+per CPU. Checks that every good job is in the ZIP with its own branding,
+that the broken deck's jobs are reported as failures without stopping the
+batch, and that report.json covers every job. Prints wall time, summed
+render time, the speedup between the two runs and the parent's peak RSS,
+which stays flat as the batch grows because files go straight to the ZIP.
+
+Run from the repository root:
+
+    python -m benchmarks.batch_export
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+
+from apstat.batch import REPORT_NAME, export_batch
+from apstat.branding import DEFAULT_BRANDING
+
+DECKS = 8
+FORMATS = ["html", "pdf", "md", "pptx"]
+
+
+def batch_configs(decks):
+    configs = [
+        {
+            "name": f"school-{number:02d}",
+            "teacher": f"Teacher {number:02d}",
+            "school": f"School {number:02d}",
+            "formats": FORMATS,
+            "date": "September 2, 2026",
+        }
+        for number in range(decks)
+    ]
+    configs.append({"name": "broken", "content": "missing-content.json", "formats": ["html"]})
+    return configs
+
+
+def run(configs, out, workers):
+    start = time.perf_counter()
+    results = export_batch(configs, out, workers=workers)
+    return results, time.perf_counter() - start
+
+
+def check(report, configs, out, results):
+    failed = [result for result in results if result["error"]]
+    report(len(failed) == 2 and all(result["deck"] == "broken" for result in failed),
+           f"broken deck: {len(failed)} failed jobs reported, batch finished")
+
+    with zipfile.ZipFile(out) as archive:
+        names = set(archive.namelist())
+        written = {result["path"] for result in results if not result["error"]}
+        report(names == written | {REPORT_NAME}, f"{len(written)} files in the archive, none missing or extra")
+
+        job_report = json.loads(archive.read(REPORT_NAME))
+        report(len(job_report["jobs"]) == len(results), f"{REPORT_NAME} covers {len(job_report['jobs'])} jobs")
+
+        branded = 0
+        for config in configs[:-1]:
+            for document in ("presentation", "flyer"):
+                html = archive.read(f"{config['name']}/ap_statistics_{document}.html").decode("utf-8")
+                branded += config["teacher"] in html and DEFAULT_BRANDING.teacher not in html
+        expected = 2 * (len(configs) - 1)
+        report(branded == expected, f"{branded}/{expected} HTML files carry their own teacher's name only")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decks", type=int, default=DECKS, help=f"branded decks in the batch (default: {DECKS})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="workers for the parallel run (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    configs = batch_configs(args.decks)
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for workers in sorted({1, args.workers}):
+            out = os.path.join(tmp, f"batch-{workers}.zip")
+            results, elapsed = run(configs, out, workers)
+            check(report, configs, out, results)
+            render = sum(result["ms"] for result in results) / 1000
+            timings[workers] = elapsed
+            print(f"     {workers} worker(s): {len(results)} jobs in {elapsed:.2f} s "
+                  f"({render:.2f} s of rendering, {os.path.getsize(out):,} byte archive)")
+
+    if len(timings) > 1:
+        print(f"     speedup with {args.workers} workers: {timings[1] / timings[args.workers]:.2f}x "
+              f"on {os.cpu_count()} CPU(s)")
+    print(f"     parent peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Correctness checks for the export post-processing, file formats and previews
+
+Each check prints an "ok"/"FAIL" line; the run fails if any check fails.
+
+Run from the repository root:
+
+    python -m benchmarks.export_checks
+"""
+import argparse
+import os
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from apstat.content import get_content
+from apstat.exports import optimize_html
+from apstat.pptx import render_presentation_pptx
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+TODAY = "September 2, 2026"
+PAGE = "<html><head><style>p{{margin:0}}</style></head><body>{body}</body></html>"
+
+
+def check_hoisting(report):
+    """Hoisted styles merge into an existing class attribute of either quote style"""
+    html = optimize_html(PAGE.format(body=(
+        "<p class='x' style=\"color:red\">a</p>"
+        "<p class=\"y\" style=\"color: red\">b</p>"
+        "<p style=\"color:red\">c</p>"
+        "<p class=z style=\"color:red\">d</p>"
+    )))
+    report("<p class='x hs1'>" in html, "single-quoted class merged with the hoisted class")
+    report('<p class="y hs1">' in html, "double-quoted class merged with the hoisted class")
+    report('<p class="hs1">' in html, "class added to a tag without one")
+    report('<p class=z style="color:red">' in html, "unquoted class left unchanged, not duplicated")
+    report(html.count("class=") == 4, "no tag has two class attributes")
+
+
+def check_pptx_reproducible(report):
+    """The same deck renders to identical .pptx bytes, whenever it is rendered"""
+    content = get_content()
+    first = render_presentation_pptx(content.registry, content.videos, TODAY)
+    # Let the clock move past the ZIP timestamp resolution (two seconds)
+    time.sleep(2.1)
+    second = render_presentation_pptx(content.registry, content.videos, TODAY)
+    report(first == second, f"PowerPoint deck renders to the same {len(first):,} bytes twice")
+
+
+def check_printable_previews(report):
+    """The printable views load their published export in the iframe, not as inline HTML"""
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    for flag in ("show_flyer", "show_printable"):
+        at.session_state["show_flyer"] = flag == "show_flyer"
+        at.session_state["show_printable"] = flag == "show_printable"
+        at.run()
+        frames = [element.proto for element in at.get("iframe")]
+        loaded = len(frames) == 1 and frames[0].src.startswith("/app/static/") and not frames[0].srcdoc
+        report(loaded, f"{flag}: preview iframe loads {frames[0].src if frames else None!r} (not inline srcdoc)")
+
+
+CHECKS = [check_hoisting, check_pptx_reproducible, check_printable_previews]
+
+
+def main(argv=None):
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args(argv)
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    for check in CHECKS:
+        check(report)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
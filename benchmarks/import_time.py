@@ -0,0 +1,40 @@
+"""Check that the headless CLI imports quickly and never imports Streamlit
+
+Run from the repository root:
+
+    python -m benchmarks.import_time
+"""
+import subprocess
+import sys
+
+# Cold import budget for `import apstat.cli`, in milliseconds
+BUDGET_MS = 150
+RUNS = 5
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import apstat.cli
+elapsed = (time.perf_counter() - start) * 1000
+heavy = sorted(name for name in ("streamlit", "reportlab", "pandas", "numpy") if name in sys.modules)
+print(f"{elapsed:.2f} {','.join(heavy)}")
+"""
+
+
+def main():
+    timings = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True).stdout.split()
+        timings.append(float(output[0]))
+        heavy = output[1] if len(output) > 1 else ""
+        if heavy:
+            print(f"FAIL: importing apstat.cli pulled in {heavy}")
+            return 1
+
+    best = min(timings)
+    print(f"import apstat.cli: best {best:.1f} ms, worst {max(timings):.1f} ms over {RUNS} runs (budget {BUDGET_MS} ms)")
+    return 0 if best <= BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
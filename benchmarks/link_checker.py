@@ -0,0 +1,126 @@
+"""Exercise the link checker against a local stub HTTP server
+
+The stub answers with healthy, missing, HEAD-refusing, flaky, slow and
+redirecting endpoints. The harness checks that every one is classified
+correctly, that cached results are reused within the TTL, and that delayed
+responses are checked concurrently instead of one after another.
+
+Run from the repository root:
+
+    python -m benchmarks.link_checker
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from apstat.links import LinkStatusCache, check_links
+
+DELAY = 0.2
+DELAYED_URLS = 16
+TIMEOUT = 0.5
+OPTIONS = {"concurrency": 8, "per_host": 8, "timeout": TIMEOUT, "retries": 2, "backoff": 0.05}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests_seen = Counter()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, location=None):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _handle(self):
+        with self.lock:
+            self.requests_seen[self.path] += 1
+            seen = self.requests_seen[self.path]
+        path = self.path
+        if path == "/ok":
+            self._respond(200)
+        elif path == "/missing":
+            self._respond(404)
+        elif path == "/gone":
+            self._respond(410)
+        elif path == "/no-head":
+            self._respond(405 if self.command == "HEAD" else 200)
+        elif path == "/flaky":
+            self._respond(503 if seen < 3 else 200)
+        elif path == "/always-503":
+            self._respond(503)
+        elif path == "/slow":
+            time.sleep(TIMEOUT * 3)
+            self._respond(200)
+        elif path == "/redirect":
+            self._respond(301, "/ok")
+        elif path.startswith("/delay/"):
+            time.sleep(DELAY)
+            self._respond(200)
+        else:
+            self._respond(404)
+
+    do_HEAD = _handle
+    do_GET = _handle
+
+
+EXPECTED = {
+    "/ok": True,
+    "/missing": False,
+    "/gone": False,
+    "/no-head": True,
+    "/flaky": True,
+    "/always-503": False,
+    "/slow": False,
+    "/redirect": True,
+}
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LinkStatusCache(path=os.path.join(tmp, "link_status.json"))
+        urls = [base + path for path in EXPECTED] + ["http://127.0.0.1:9/refused"]
+        results = check_links(urls, cache=cache, **OPTIONS)
+        for url, entry in results.items():
+            path = url[len(base):] if url.startswith(base) else url
+            expected = EXPECTED.get(path, False)
+            status = "ok  " if entry["ok"] == expected else "FAIL"
+            failures += entry["ok"] != expected
+            detail = entry["error"] or entry["status"]
+            print(f"{status} {path:<28} ok={entry['ok']!s:<5} attempts={entry['attempts']} ({detail})")
+
+        # Within the TTL nothing is requested again, from this cache or a fresh reader
+        before = sum(StubHandler.requests_seen.values())
+        check_links(urls, cache=LinkStatusCache(path=cache.path), **OPTIONS)
+        repeated = sum(StubHandler.requests_seen.values()) - before
+        print(f"{'ok  ' if repeated == 0 else 'FAIL'} cached re-check made {repeated} requests")
+        failures += repeated != 0
+
+        # Delayed responses overlap instead of adding up
+        delayed = [f"{base}/delay/{number}" for number in range(DELAYED_URLS)]
+        start = time.perf_counter()
+        check_links(delayed, cache=cache, **OPTIONS)
+        elapsed = time.perf_counter() - start
+        serial = DELAY * DELAYED_URLS
+        status = "ok  " if elapsed < serial / 2 else "FAIL"
+        failures += elapsed >= serial / 2
+        print(f"{status} {DELAYED_URLS} x {DELAY * 1000:.0f} ms responses checked in {elapsed * 1000:.0f} ms (serial: {serial * 1000:.0f} ms)")
+
+    server.shutdown()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Exercise the link preview cache with an in-memory fetcher
+
+Runs prefetch_previews() over the deck's links with a fetcher that serves
+generated images instead of touching the network, then checks that:
+identical images share one thumbnail file, a failing fetcher keeps the
+previous previews, a warm cache makes no fetches, and rendering the link
+cards from the index is fast.
+
+Run from the repository root:
+
+    python -m benchmarks.link_previews
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from apstat.content import get_content
+from apstat.links import collect_links
+from apstat.previews import get_previews, prefetch_previews
+from apstat.sections import case_studies_html, guaranteed_videos_html
+
+# Distinct generated images; links share them round-robin, so thumbnails must dedupe
+COLOURS = ("#667eea", "#764ba2", "#ff9800")
+RENDERS = 200
+
+
+class FixtureFetcher:
+    """Serves a generated 1280x720 image per link and counts calls"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    def metadata(self, url):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("network unavailable")
+        colour = COLOURS[hash(url) % len(COLOURS)]
+        return {"title": url, "site": "Fixture", "image_url": colour}
+
+    def image(self, image_url):
+        out = io.BytesIO()
+        Image.new("RGB", (1280, 720), image_url).save(out, "PNG")
+        return out.getvalue()
+
+
+def main():
+    content = get_content()
+    urls = collect_links(content)
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        options = {"index_path": os.path.join(tmp, "previews.json"), "thumbs_dir": os.path.join(tmp, "thumbs")}
+
+        report(get_previews(**options) == {}, "cold cache: no previews, plain links")
+
+        start = time.perf_counter()
+        index, errors = prefetch_previews(urls, fetcher=FixtureFetcher(), **options)
+        elapsed = (time.perf_counter() - start) * 1000
+        thumbs = os.listdir(options["thumbs_dir"])
+        report(not errors and all(index[url]["thumbnail"] for url in urls),
+               f"prefetched {len(urls)} links in {elapsed:.0f} ms")
+        report(len(thumbs) <= len(COLOURS), f"{len(thumbs)} thumbnail files for {len(urls)} links")
+
+        warm = FixtureFetcher()
+        prefetch_previews(urls, fetcher=warm, **options)
+        report(warm.calls == 0, f"warm cache made {warm.calls} fetches")
+
+        offline = FixtureFetcher(fail=True)
+        index, errors = prefetch_previews(urls, fetcher=offline, force=True, **options)
+        report(len(errors) == len(urls) and all(index[url]["thumbnail"] for url in urls),
+               "offline refresh kept every previous preview")
+
+        previews = get_previews(**options)
+        start = time.perf_counter()
+        for _ in range(RENDERS):
+            html = guaranteed_videos_html(content.videos, previews=previews)
+            html += "".join(case_studies_html(studies, previews=previews) for studies in content.case_studies.values())
+        per_render = (time.perf_counter() - start) * 1000 / RENDERS
+        report(html.count("link-thumb") == len(urls), f"all link cards rendered in {per_render:.3f} ms")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Load-test the app with many concurrent browser sessions
+
+Starts a real `streamlit run` server and opens N websocket sessions at
+once. Each session plays a scripted visit: it walks the slides, types in
+the YouTube search box on career slides, and opens and closes the printable
+flyer and presentation. Reported:
+
+- server memory per session: the growth of the server's resident memory
+  while all N sessions are still connected, divided by N;
+- rerun latency percentiles (p50/p99) over every rerun of every session;
+- throughput: reruns completed per second of wall time.
+
+The check fails if any rerun errors out or if memory per session exceeds
+the budget, which guards against a regression that keeps render output or
+widget state alive per session instead of in the shared caches.
+
+Run from the repository root:
+
+    python -m benchmarks.load_sessions
+    python -m benchmarks.load_sessions --sessions 50 --steps 40
+"""
+import argparse
+import asyncio
+import contextlib
+import statistics
+import sys
+import time
+
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.server import BrowserSession, connect, find_widget, free_port, rss_kib, start_server, stop_server, stream_url
+
+SESSIONS = 20
+STEPS = 30
+# Server memory a connected session may add, in KiB
+MEMORY_BUDGET_KIB = 2048
+SETTLE_SECONDS = 1.0
+
+SLIDE_SELECTOR = "Go to Slide:"
+SEARCH_BOX = "Search YouTube:"
+PRINT_FLYER = "📄 Print Flyer"
+PRINT_PRESENTATION = "📊 Full Presentation"
+BACK = "← Back to Interactive Presentation"
+
+
+class Visitor:
+    """One scripted student: keeps the widget states a browser would resend"""
+
+    def __init__(self, session, number):
+        self.session = session
+        self.number = number
+        self.states = {}
+        self.elements = []
+        self.latencies = []
+
+    async def rerun(self, *changes):
+        """Rerun with the sticky widget states plus the given changes; triggers are not kept"""
+        states = dict(self.states)
+        for state in changes:
+            states[state.id] = state
+        elapsed, _, _, elements = await self.session.rerun(list(states.values()))
+        self.latencies.append(elapsed * 1000)
+        self.states = {key: state for key, state in states.items() if not state.HasField("trigger_value")}
+        self.elements = elements
+
+    def widget(self, kind, label):
+        widget, _ = find_widget(self.elements, kind, label)
+        return widget
+
+    async def visit(self, steps):
+        await self.rerun()
+        slide_count = len(self.widget("selectbox", SLIDE_SELECTOR).options)
+        for step in range(steps):
+            action = (step + self.number) % 6
+            if action == 4:
+                button = PRINT_FLYER if step % 2 else PRINT_PRESENTATION
+                await self.rerun(WidgetState(id=self.widget("button", button).id, trigger_value=True))
+                await self.rerun(WidgetState(id=self.widget("button", BACK).id, trigger_value=True))
+                continue
+
+            selector = self.widget("selectbox", SLIDE_SELECTOR)
+            slide = (self.number + step) % slide_count
+            await self.rerun(WidgetState(id=selector.id, string_value=selector.options[slide]))
+            if action in (1, 3):
+                try:
+                    search = self.widget("text_input", SEARCH_BOX)
+                except LookupError:  # not a career slide
+                    continue
+                await self.rerun(WidgetState(id=search.id, string_value=f"visitor {self.number} step {step}"))
+
+
+async def _load(url, sessions, steps, pid):
+    before = rss_kib(pid)
+    async with contextlib.AsyncExitStack() as stack:
+        sockets = await asyncio.gather(*(stack.enter_async_context(connect(url)) for _ in range(sessions)))
+        visitors = [Visitor(BrowserSession(ws), number) for number, ws in enumerate(sockets)]
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(visitor.visit(steps) for visitor in visitors), return_exceptions=True)
+        elapsed = time.perf_counter() - start
+        # Let the server finish releasing per-run garbage before sampling
+        await asyncio.sleep(SETTLE_SECONDS)
+        after = rss_kib(pid)
+    errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    latencies = [latency for visitor in visitors for latency in visitor.latencies]
+    return before, after, elapsed, latencies, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=SESSIONS, help=f"concurrent sessions (default: {SESSIONS})")
+    parser.add_argument("--steps", type=int, default=STEPS, help=f"scripted steps per session (default: {STEPS})")
+    parser.add_argument("--budget-kib", type=float, default=MEMORY_BUDGET_KIB,
+                        help=f"allowed server memory per session (default: {MEMORY_BUDGET_KIB})")
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    process = start_server(port)
+    try:
+        url = stream_url(port)
+        # One warm-up visit fills the shared render caches, so only per-session cost is measured
+        asyncio.run(_load(url, 1, 6, process.pid))
+        before, after, elapsed, latencies, errors = asyncio.run(_load(url, args.sessions, args.steps, process.pid))
+    finally:
+        stop_server(process)
+
+    per_session = (after - before) / args.sessions
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"sessions {args.sessions}, reruns {len(latencies)} in {elapsed:.1f} s")
+    print(f"server RSS       {before:,} KiB -> {after:,} KiB")
+    print(f"memory/session   {per_session:,.0f} KiB")
+    print(f"latency p50      {statistics.median(latencies):.1f} ms")
+    print(f"latency p99      {percentiles[98]:.1f} ms")
+    print(f"throughput       {len(latencies) / elapsed:.1f} reruns/s")
+
+    failures = 0
+    for error in errors:
+        failures += 1
+        print(f"FAIL session error: {type(error).__name__}: {error}")
+    if per_session > args.budget_kib:
+        failures += 1
+        print(f"FAIL {per_session:,.0f} KiB per session exceeds the {args.budget_kib:,.0f} KiB budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Measure roster mail-merge throughput and check that memory stays bounded
+
+Generates a synthetic roster (STUDENTS rows, one without a name and some
+careers the deck does not have) and merges it into a ZIP of HTML flyers with
+one worker and with one per CPU, and into one combined PDF. Checks flyer and
+page counts and reports flyers per second. Then runs ZIP merges of a small
+and a SCALE times larger roster in fresh processes and fails if peak RSS
+grows by more than MAX_ZIP_GROWTH_MIB, i.e. if memory follows the roster
+size instead of the chunk window.
+
+Run from the repository root:
+
+    python -m benchmarks.mail_merge
+"""
+import argparse
+import csv
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+from apstat.content import get_content
+from apstat.pdf import FlyerMerge, render_flyer_pdf
+from apstat.roster import merge_roster
+from benchmarks.server import REPO_ROOT
+
+STUDENTS = 1500
+SCALE = 4
+MAX_ZIP_GROWTH_MIB = 8
+MIN_ZIP_RATE = 500
+MIN_PDF_RATE = 50
+TODAY = "September 2, 2026"
+_PAGE = re.compile(rb"/Type /Page\b(?!s)")
+
+
+def write_roster(path, students):
+    careers = sorted(get_content().careers) + ["Astronaut"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Homeroom", "Careers"])
+        for number in range(students):
+            picks = [careers[(number * step) % len(careers)] for step in (1, 3, 7)]
+            writer.writerow([f"Student {number:04d}" if number != 5 else "", f"1{number % 4}{'ABCDEF'[number % 6]}", "; ".join(picks)])
+
+
+def peak_rss_kib(roster, out):
+    """Peak RSS of a fresh process merging roster into out"""
+    # VmHWM rather than ru_maxrss, which carries over the forking parent's peak
+    code = (
+        "from apstat.roster import merge_roster\n"
+        f"merge_roster({roster!r}, {out!r}, {TODAY!r})\n"
+        "print(next(line.split()[1] for line in open('/proc/self/status') if line.startswith('VmHWM:')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return int(result.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=STUDENTS, help=f"roster rows (default: {STUDENTS})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="workers for the parallel ZIP run (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    expected = args.students - 1
+    with tempfile.TemporaryDirectory() as tmp:
+        roster = os.path.join(tmp, "roster.csv")
+        write_roster(roster, args.students)
+
+        for workers in sorted({1, args.workers}):
+            out = os.path.join(tmp, f"flyers-{workers}.zip")
+            summary = merge_roster(roster, out, TODAY, workers=workers)
+            with zipfile.ZipFile(out) as archive:
+                count = len(archive.namelist())
+            report(count == expected == summary["flyers"] and len(summary["errors"]) == 1,
+                   f"ZIP, {workers} worker(s): {count:,} flyers, {len(summary['errors'])} row skipped")
+            report(summary["rate"] >= MIN_ZIP_RATE,
+                   f"ZIP, {workers} worker(s): {summary['rate']:,.0f} flyers/s in {summary['seconds']:.2f} s (minimum {MIN_ZIP_RATE:,})")
+
+        out = os.path.join(tmp, "flyers.pdf")
+        summary = merge_roster(roster, out, TODAY)
+        with open(out, "rb") as f:
+            pages = len(_PAGE.findall(f.read()))
+        report(pages == 2 * expected, f"PDF: {pages:,} pages for {summary['flyers']:,} flyers, {os.path.getsize(out):,} bytes")
+        report(summary["rate"] >= MIN_PDF_RATE,
+               f"PDF: {summary['rate']:,.0f} flyers/s in {summary['seconds']:.2f} s (minimum {MIN_PDF_RATE:,})")
+
+        # What the compiled form layout saves over laying out every copy
+        flyer = get_content().flyer
+        start = time.perf_counter()
+        for _ in range(5):
+            render_flyer_pdf(flyer, TODAY)
+        full = (time.perf_counter() - start) / 5 * 1000
+        merge = FlyerMerge(os.path.join(tmp, "sample.pdf"), flyer, TODAY)
+        start = time.perf_counter()
+        for number in range(50):
+            merge.add(f"Student {number}", "10A", [("NICU Nurse", "How Statistics Empowers NICU Nurses")])
+        merged = (time.perf_counter() - start) / 50 * 1000
+        merge.close()
+        print(f"     PDF per flyer: {full:.1f} ms laid out alone, {merged:.1f} ms merged ({full / merged:.0f}x)")
+
+        small, large = os.path.join(tmp, "small.csv"), os.path.join(tmp, "large.csv")
+        write_roster(small, args.students)
+        write_roster(large, args.students * SCALE)
+        small_rss = peak_rss_kib(small, os.path.join(tmp, "small.zip"))
+        large_rss = peak_rss_kib(large, os.path.join(tmp, "large.zip"))
+        growth = (large_rss - small_rss) / 1024
+        report(growth <= MAX_ZIP_GROWTH_MIB,
+               f"ZIP peak RSS {small_rss / 1024:.1f} MiB for {args.students:,} rows, "
+               f"{large_rss / 1024:.1f} MiB for {args.students * SCALE:,} (maximum growth {MAX_ZIP_GROWTH_MIB} MiB)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
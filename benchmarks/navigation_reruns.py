@@ -0,0 +1,80 @@
+"""Count the script runs each navigation action costs
+
+Every user action should cost exactly one run of app.py. The harness drives
+the app with Streamlit's AppTest and counts runs by wrapping
+apstat.metrics.install_delta_counter, which app.py calls once at the top of
+every run.
+
+Run from the repository root:
+
+    python -m benchmarks.navigation_reruns
+"""
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+import apstat.metrics
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+RUNS_PER_ACTION = 1
+
+
+class RunCounter:
+    """Counts calls to install_delta_counter, i.e. script runs"""
+
+    def __init__(self):
+        self.runs = 0
+        self._install = apstat.metrics.install_delta_counter
+
+    def __enter__(self):
+        def counting_install(ctx):
+            self.runs += 1
+            return self._install(ctx)
+
+        apstat.metrics.install_delta_counter = counting_install
+        return self
+
+    def __exit__(self, *exc_info):
+        apstat.metrics.install_delta_counter = self._install
+
+
+def _button(at, label):
+    return next(button for button in at.button if button.label == label)
+
+
+ACTIONS = (
+    ("select slide 5", lambda at: at.sidebar.selectbox[0].set_value(4)),
+    ("next", lambda at: _button(at, "Next ➡️").click()),
+    ("previous", lambda at: _button(at, "⬅️ Previous").click()),
+    ("sidebar: print flyer", lambda at: _button(at, "📄 Print Flyer").click()),
+    ("back from flyer", lambda at: _button(at, "← Back to Interactive Presentation").click()),
+    ("main: save presentation", lambda at: _button(at, "📊 Save Full Presentation").click()),
+    ("back from presentation", lambda at: _button(at, "← Back to Interactive Presentation").click()),
+    ("presenter mode on", lambda at: at.sidebar.toggle[0].set_value(True)),
+    ("presenter mode off", lambda at: at.sidebar.toggle[0].set_value(False)),
+)
+
+
+def main():
+    failures = 0
+    with RunCounter() as counter:
+        at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+        for name, action in ACTIONS:
+            before = counter.runs
+            action(at)
+            at.run()
+            runs = counter.runs - before
+            if at.exception:
+                print(f"FAIL {name}: {at.exception}")
+                failures += 1
+                continue
+            status = "ok  " if runs == RUNS_PER_ACTION else "FAIL"
+            failures += runs != RUNS_PER_ACTION
+            print(f"{status} {name:<26} {runs} run(s), now on slide {at.session_state.current_slide + 1}")
+    print(f"{len(ACTIONS) - failures}/{len(ACTIONS)} actions took exactly {RUNS_PER_ACTION} run")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Compare per-interaction latency of fragment reruns and full-app reruns
+
+AppTest always re-executes the whole script, so this starts a real
+`streamlit run` server and speaks its websocket protocol the way the browser
+does. Each interaction is replayed twice: as the browser sends it now
+(scoped to the widget's fragment) and as it was sent before the page was
+split into fragments (a full-app rerun). Time is measured from sending the
+rerun request to receiving script_finished; the two modes are interleaved so
+drift affects both alike. Every rerun pays a fixed cost for starting the
+script thread and flushing messages, so the message count is the stable
+signal and the check fails only if a fragment rerun sends as much as a
+full one.
+
+Run from the repository root:
+
+    python -m benchmarks.partial_reruns
+"""
+import asyncio
+import statistics
+import sys
+
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.server import BrowserSession, connect, find_widget, free_port, start_server, stop_server, stream_url
+
+ROUNDS = 40
+WARMUP_ROUNDS = 5
+# Measure on a career slide, the heaviest kind
+SLIDE_INDEX = 4
+
+
+def _text_state(widget_id, round_number):
+    return [WidgetState(id=widget_id, string_value=f"statistics example {round_number}")]
+
+
+def _click_state(widget_id, round_number):
+    return [WidgetState(id=widget_id, trigger_value=True)]
+
+
+async def _measure(url):
+    async with connect(url) as ws:
+        session = BrowserSession(ws)
+        _, _, _, elements = await session.rerun()
+
+        # The browser sends every widget's state with each rerun; keep the slide selected
+        selector, _ = find_widget(elements, "selectbox", "Go to Slide:")
+        slide_state = WidgetState(id=selector.id, string_value=selector.options[SLIDE_INDEX])
+        _, _, _, elements = await session.rerun([slide_state])
+
+        interactions = (
+            ("type in YouTube search box", find_widget(elements, "text_input", "Search YouTube:"), _text_state),
+            ("download PowerPoint", find_widget(elements, "download_button", "📥 Download PowerPoint (.pptx)"), _click_state),
+        )
+
+        results = []
+        for name, (widget, fragment_id), make_state in interactions:
+            modes = (("full app", ""), ("fragment", fragment_id))
+            timings = {mode: [] for mode, _ in modes}
+            sizes = {}
+            for round_number in range(WARMUP_ROUNDS + ROUNDS):
+                for mode, scope in modes:
+                    states = [slide_state] + make_state(widget.id, round_number)
+                    elapsed, messages, received, _ = await session.rerun(states, scope)
+                    if round_number >= WARMUP_ROUNDS:
+                        timings[mode].append(elapsed * 1000)
+                    sizes[mode] = (messages, received)
+            for mode, _ in modes:
+                deciles = statistics.quantiles(timings[mode], n=10)
+                results.append((name, mode, statistics.median(timings[mode]), deciles[-1], *sizes[mode]))
+        return results
+
+
+def main():
+    port = free_port()
+    process = start_server(port)
+    try:
+        results = asyncio.run(_measure(stream_url(port)))
+    finally:
+        stop_server(process)
+
+    print(f"{'interaction':<28} {'rerun':<9} {'p50 ms':>8} {'p90 ms':>8} {'messages':>9} {'bytes':>9}")
+    sent = {}
+    for name, mode, median, p90, messages, received in results:
+        sent[name, mode] = messages
+        print(f"{name:<28} {mode:<9} {median:>8.1f} {p90:>8.1f} {messages:>9} {received:>9,}")
+
+    failures = [name for name, mode in sent if mode == "fragment" and sent[name, mode] >= sent[name, "full app"]]
+    for name in failures:
+        print(f"FAIL {name}: the fragment rerun sends as much as a full-app rerun")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Check that printable-presentation render time grows linearly with slide count
+
+Run from the repository root:
+
+    python -m benchmarks.render_scaling
+"""
+import copy
+import sys
+import time
+
+from apstat.presentation import render_presentation_html
+from apstat.registry import build_registry
+
+SIZES = (15, 50, 100, 250, 500)
+REPEATS = 5
+# Per-slide cost at the largest size may be at most this many times the
+# per-slide cost at the smallest size before we call it non-linear.
+MAX_PER_SLIDE_RATIO = 2.0
+
+
+def sample_deck():
+    """Build a small deck shaped like the real one (title, intro, careers, closing)"""
+    career = {
+        "title": "🏥 NICU Nurse",
+        "content": {
+            "description": "How Statistics Empowers NICU Nurses",
+            "examples": [
+                {
+                    "title": "Patient Monitoring & Risk Assessment",
+                    "content": "Using <span class='highlight'>mean, standard deviation, and outliers</span> " * 4,
+                },
+                {
+                    "title": "Treatment Effectiveness Analysis",
+                    "content": "Using <span class='highlight'>hypothesis testing</span> " * 4,
+                },
+            ],
+            "resources": "NICU Nurse",
+        },
+        "type": "career",
+    }
+    case_studies = {"NICU Nurse": [{"title": "Study", "url": "https://example.org/a", "description": "A study " * 5}] * 2}
+    keywords = {"NICU Nurse": ["statistics nursing NICU", "medical statistics for nurses", "data analysis in healthcare"]}
+    schedules = {"NICU Nurse": {"school": "Rutgers", "major": "BSN", "schedule": {}, "stats_note": ""}}
+    videos = {"v": {"title": "What is Statistics?", "url": "https://www.youtube.com/watch?v=LMSyiAJm99g", "description": ""}}
+    head = [
+        {"title": "📊 AP Statistics", "subtitle": "Subtitle", "content": "Content", "type": "title"},
+        {"title": "Why AP Statistics Matters", "content": {"benefits": ["a", "b"], "applications": "text"}, "type": "intro"},
+    ]
+    closing = {"title": "Take AP Statistics Next Year!", "content": {"points": ["x"], "call_to_action": "go", "contact": "ask"}, "type": "closing"}
+    return head, career, closing, case_studies, keywords, schedules, videos
+
+
+def build_slides(n, head, career, closing):
+    """Pad the deck with career slides until it has n slides"""
+    return head + [copy.deepcopy(career) for _ in range(n - len(head) - 1)] + [closing]
+
+
+def time_render(slides, case_studies, keywords, schedules, videos):
+    registry = build_registry(slides, case_studies, keywords, schedules)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        render_presentation_html(registry, videos, "January 01, 2026")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    head, career, closing, case_studies, keywords, schedules, videos = sample_deck()
+
+    print(f"{'slides':>7} {'total ms':>10} {'us/slide':>10}")
+    per_slide = {}
+    for n in SIZES:
+        elapsed = time_render(build_slides(n, head, career, closing), case_studies, keywords, schedules, videos)
+        per_slide[n] = elapsed / n
+        print(f"{n:>7} {elapsed * 1000:>10.2f} {per_slide[n] * 1e6:>10.1f}")
+
+    ratio = per_slide[SIZES[-1]] / per_slide[SIZES[0]]
+    print(f"per-slide cost ratio {SIZES[-1]}/{SIZES[0]}: {ratio:.2f} (limit {MAX_PER_SLIDE_RATIO})")
+    return 0 if ratio <= MAX_PER_SLIDE_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Helpers for benchmarks that drive a real `streamlit run` server
+
+BrowserSession speaks the websocket protocol the way the browser does: it
+sends rerun requests carrying widget states and reads ForwardMsgs until the
+script run finishes.
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_TIMEOUT = 30
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, env=None):
+    """Start app.py on port and wait until it is healthy; returns the process"""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "app.py",
+            "--server.headless=true",
+            f"--server.port={port}",
+            "--server.address=127.0.0.1",
+            "--browser.gatherUsageStats=false",
+        ],
+        cwd=REPO_ROOT,
+        env=dict(os.environ, **(env or {})),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("streamlit did not start")
+
+
+def stop_server(process):
+    process.terminate()
+    process.wait()
+
+
+def rss_kib(pid):
+    """Resident memory of a process in KiB (Linux)"""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    raise RuntimeError("VmRSS not found")
+
+
+def stream_url(port):
+    return f"ws://127.0.0.1:{port}/_stcore/stream"
+
+
+def connect(url):
+    return websockets.connect(url, subprotocols=["streamlit"], max_size=None)
+
+
+class BrowserSession:
+    """One browser tab: sends reruns and collects what the server sends back"""
+
+    def __init__(self, ws):
+        self.ws = ws
+
+    async def rerun(self, widget_states=(), fragment_id=""):
+        """Send a rerun and wait for it to finish; returns (seconds, messages, bytes, elements)
+
+        elements is a list of (Element proto, fragment id) for every new element.
+        """
+        back_msg = BackMsg()
+        back_msg.rerun_script.query_string = ""
+        back_msg.rerun_script.page_script_hash = ""
+        back_msg.rerun_script.fragment_id = fragment_id
+        back_msg.rerun_script.widget_states.widgets.extend(widget_states)
+
+        start = time.perf_counter()
+        await self.ws.send(back_msg.SerializeToString())
+        messages = 0
+        received = 0
+        elements = []
+        while True:
+            data = await self.ws.recv()
+            messages += 1
+            received += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            if msg.HasField("delta") and msg.delta.HasField("new_element"):
+                elements.append((msg.delta.new_element, msg.delta.fragment_id))
+            if msg.WhichOneof("type") == "script_finished":
+                return time.perf_counter() - start, messages, received, elements
+
+
+def find_widget(elements, kind, label):
+    """Return (widget proto, id of the fragment it belongs to) for the first match"""
+    for element, fragment_id in elements:
+        if element.WhichOneof("type") == kind and getattr(element, kind).label == label:
+            return getattr(element, kind), fragment_id
+    raise LookupError(f"no {kind} labelled {label!r}")
@@ -0,0 +1,127 @@
+"""Check that tenants share slide pieces but never evict each other's renders
+
+Writes a tenants file with TENANTS schools (one with a career subset) plus a
+"hot" tenant whose render cache holds only HOT_CACHE_ENTRIES documents, and
+runs the app through AppTest as each of them: every slide, the flyer and the
+presentation. Checks that each tenant sees its own banner, that the slide
+pieces in the shared cache are rendered once for all tenants, and that after
+the hot tenant churns through its small cache the other tenants still serve
+every view from their caches with no evictions. Prints the time of a tenant's
+first (cold) and second (warm) visit.
+
+Run from the repository root:
+
+    python -m benchmarks.tenant_caches
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+TENANTS = 4
+HOT_TENANT = "hot"
+HOT_CACHE_ENTRIES = 2
+SUBSET = ["NICU Nurse", "Software Developer"]
+
+
+def tenants_config(count):
+    tenants = {
+        f"school-{number:02d}": {"teacher": f"Teacher {number:02d}", "school": f"School {number:02d}"}
+        for number in range(count)
+    }
+    tenants["school-00"]["careers"] = SUBSET
+    tenants[HOT_TENANT] = {"teacher": "Teacher Hot", "school": "Hot School", "cache_entries": HOT_CACHE_ENTRIES}
+    return {"tenants": tenants}
+
+
+def views(slide_count):
+    """Session state for every slide and the two printable views"""
+    for index in range(slide_count):
+        yield {"current_slide": index, "show_flyer": False, "show_printable": False}
+    yield {"current_slide": 0, "show_flyer": True, "show_printable": False}
+    yield {"current_slide": 0, "show_flyer": False, "show_printable": True}
+
+
+def visit(name, slide_count):
+    """Run the app as tenant name through every view; returns (banner text, seconds)"""
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.query_params["tenant"] = name
+    banner = ""
+    start = time.perf_counter()
+    for state in views(slide_count):
+        for key, value in state.items():
+            at.session_state[key] = value
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"app raised for tenant {name}: {at.exception}")
+        if not state["show_flyer"] and not state["show_printable"]:
+            banner = next((md.value for md in at.markdown if "teacher-banner" in md.value), banner)
+    return banner, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=TENANTS, help=f"schools besides the hot tenant (default: {TENANTS})")
+    args = parser.parse_args(argv)
+
+    failures = 0
+
+    def report(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {message}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tenants.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(tenants_config(args.tenants), f)
+        # Read when apstat.tenants is first imported, so set before the imports below
+        os.environ["APSTAT_TENANTS_FILE"] = path
+
+        from apstat.cache import render_cache
+        from apstat.content import get_content
+        from apstat.tenants import get_tenant
+
+        names = [f"school-{number:02d}" for number in range(args.tenants)] + [HOT_TENANT]
+        slide_counts = {name: len(get_tenant(name).content(get_content()).slides) for name in names}
+        report(slide_counts["school-00"] < slide_counts[HOT_TENANT],
+               f"school-00 deck has {slide_counts['school-00']} of {slide_counts[HOT_TENANT]} slides")
+
+        shared_misses = []
+        for name in names:
+            banner, cold = visit(name, slide_counts[name])
+            _, warm = visit(name, slide_counts[name])
+            teacher = get_tenant(name).branding.teacher
+            report(teacher in banner and "Lucas" not in banner, f"{name}: banner names {teacher}")
+            print(f"     {name}: {slide_counts[name] + 2} views in {cold:.2f} s cold, {warm:.2f} s warm")
+            shared_misses.append(render_cache.stats()["misses"])
+        report(len(set(shared_misses[1:])) == 1,
+               f"shared slide pieces rendered once: {shared_misses[-1]} misses after {len(names)} tenants "
+               f"({shared_misses[0]} after the first)")
+
+        # The hot tenant overflows its own cache again and again ...
+        for _ in range(3):
+            visit(HOT_TENANT, slide_counts[HOT_TENANT])
+        hot = get_tenant(HOT_TENANT).cache.stats()
+        report(hot["evictions"] > 0 and hot["entries"] <= HOT_CACHE_ENTRIES,
+               f"{HOT_TENANT}: {hot['evictions']} evictions within its {HOT_CACHE_ENTRIES}-entry cache")
+
+        # ... without costing any other tenant a render
+        for name in names[:-1]:
+            before = get_tenant(name).cache.stats()
+            visit(name, slide_counts[name])
+            after = get_tenant(name).cache.stats()
+            report(after["misses"] == before["misses"] and after["evictions"] == 0,
+                   f"{name}: {after['hits'] - before['hits']} hits, {after['misses'] - before['misses']} misses "
+                   f"and {after['evictions']} evictions after the hot tenant's churn")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())